@@ -0,0 +1,36 @@
+"""Freshness TTLs for slow-changing sources
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Seconds a fetched result stays fresh before the upstream is asked again.
+CACHE_TTLS = {
+    "quiver_quant": 3600,
+    "google_trends": 3600,
+    "swaggy_stocks": 900,
+    "polymarket": 300,
+}
+
+
+def upgrade() -> None:
+    for source_name, ttl in CACHE_TTLS.items():
+        op.execute(
+            "UPDATE source_configs "
+            f"SET config_json = config_json || '{{\"cache_ttl_seconds\": {ttl}}}'::jsonb "
+            f"WHERE source_name = '{source_name}'"
+        )
+
+
+def downgrade() -> None:
+    op.execute("UPDATE source_configs SET config_json = config_json - 'cache_ttl_seconds'")
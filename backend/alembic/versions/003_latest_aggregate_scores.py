@@ -0,0 +1,60 @@
+"""Latest aggregate score per stock
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "latest_aggregate_scores",
+        sa.Column("stock_id", UUID(as_uuid=True), sa.ForeignKey("stocks.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column(
+            "aggregate_score_id", UUID(as_uuid=True),
+            sa.ForeignKey("aggregate_scores.id", ondelete="SET NULL"), nullable=True,
+        ),
+        sa.Column("score", sa.Numeric(7, 6), nullable=False),
+        sa.Column("confidence", sa.Numeric(5, 4), nullable=False),
+        sa.Column("sources_available", sa.Integer, nullable=False),
+        sa.Column("sources_total", sa.Integer, nullable=False, server_default="13"),
+        sa.Column("source_breakdown", JSONB, nullable=False),
+        sa.Column("weight_breakdown", JSONB, nullable=False),
+        sa.Column("sentiment_label", sa.String(20), nullable=False),
+        sa.Column("previous_score", sa.Numeric(7, 6), nullable=True),
+        sa.Column("score_delta", sa.Numeric(7, 6), nullable=True),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+    # Backfill from the newest aggregate_scores row of every stock.
+    op.execute(
+        """
+        INSERT INTO latest_aggregate_scores (
+            stock_id, aggregate_score_id, score, confidence, sources_available,
+            sources_total, source_breakdown, weight_breakdown, sentiment_label,
+            previous_score, score_delta, computed_at
+        )
+        SELECT DISTINCT ON (stock_id)
+            stock_id, id, score, confidence, sources_available,
+            sources_total, source_breakdown, weight_breakdown, sentiment_label,
+            previous_score, score_delta, computed_at
+        FROM aggregate_scores
+        ORDER BY stock_id, computed_at DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("latest_aggregate_scores")
@@ -0,0 +1,62 @@
+"""Aggregate score rollups at 1h, 4h and 1d
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RESOLUTIONS = {"1h": "1 hour", "4h": "4 hours", "1d": "1 day"}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "aggregate_score_rollups",
+        sa.Column("stock_id", UUID(as_uuid=True), sa.ForeignKey("stocks.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("resolution", sa.String(4), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("count", sa.Integer, nullable=False),
+        sa.Column("score_sum", sa.Numeric(14, 6), nullable=False),
+        sa.Column("score_min", sa.Numeric(7, 6), nullable=False),
+        sa.Column("score_max", sa.Numeric(7, 6), nullable=False),
+        sa.Column("last_score", sa.Numeric(7, 6), nullable=False),
+        sa.Column("last_label", sa.String(20), nullable=False),
+        sa.Column("last_computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("confidence_sum", sa.Numeric(14, 4), nullable=False),
+        sa.Column("sources_sum", sa.Integer, nullable=False),
+    )
+
+    # Backfill from the aggregate scores still retained.
+    for resolution, interval in RESOLUTIONS.items():
+        op.execute(
+            f"""
+            INSERT INTO aggregate_score_rollups (
+                stock_id, resolution, bucket_start, count, score_sum, score_min,
+                score_max, last_score, last_label, last_computed_at,
+                confidence_sum, sources_sum
+            )
+            SELECT
+                stock_id, '{resolution}',
+                date_bin('{interval}', computed_at, TIMESTAMPTZ '1970-01-01 00:00:00+00') AS bucket,
+                count(*), sum(score), min(score), max(score),
+                (array_agg(score ORDER BY computed_at DESC))[1],
+                (array_agg(sentiment_label ORDER BY computed_at DESC))[1],
+                max(computed_at), sum(confidence), sum(sources_available)
+            FROM aggregate_scores
+            GROUP BY stock_id, bucket
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("aggregate_score_rollups")
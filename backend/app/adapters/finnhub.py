@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from app.adapters.base import AbstractSourceAdapter, RawSentimentData
 from app.adapters.http_client import get_http_client
-from app.adapters.rate_limiter import RateLimiter
+from app.adapters.rate_limiter import get_rate_limiter
 from app.adapters.registry import register_adapter
 from app.core.config import settings
 
@@ -16,7 +16,7 @@ class FinnhubAdapter(AbstractSourceAdapter):
     BASE_URL = "https://finnhub.io/api/v1"
 
     def __init__(self):
-        self._rate_limiter = RateLimiter(requests_per_minute=60)
+        self._rate_limiter = get_rate_limiter(self.source_name, requests_per_minute=60)
         self._api_key = settings.FINNHUB_API_KEY
 
     async def fetch_sentiment(self, ticker: str) -> RawSentimentData | None:
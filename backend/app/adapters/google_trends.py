@@ -3,8 +3,9 @@ from datetime import datetime, timezone
 from decimal import Decimal
 
 from app.adapters.base import AbstractSourceAdapter, RawSentimentData
-from app.adapters.rate_limiter import RateLimiter
+from app.adapters.rate_limiter import get_rate_limiter
 from app.adapters.registry import register_adapter
+from app.adapters.response_cache import get_response_cache
 
 
 @register_adapter("google_trends")
@@ -13,9 +14,20 @@ class GoogleTrendsAdapter(AbstractSourceAdapter):
     category = "alternative"
 
     def __init__(self):
-        self._rate_limiter = RateLimiter(requests_per_minute=10)
+        self._rate_limiter = get_rate_limiter(self.source_name, requests_per_minute=10)
+        self._cache = get_response_cache()
 
     async def fetch_sentiment(self, ticker: str) -> RawSentimentData | None:
+        # pytrends gives no validators, so only the freshness TTL applies:
+        # a ticker scored within it skips the request entirely.
+        cached = await self._cache.get_fresh(self.source_name, ticker)
+        if cached is not None:
+            return cached
+        result = await self._fetch_interest(ticker)
+        await self._cache.put(self.source_name, ticker, result)
+        return result
+
+    async def _fetch_interest(self, ticker: str) -> RawSentimentData | None:
         await self._rate_limiter.acquire()
 
         try:
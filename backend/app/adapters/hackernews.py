@@ -3,9 +3,9 @@ from decimal import Decimal
 
 from app.adapters.base import AbstractSourceAdapter, RawSentimentData
 from app.adapters.http_client import get_http_client
-from app.adapters.rate_limiter import RateLimiter
+from app.adapters.rate_limiter import get_rate_limiter
 from app.adapters.registry import register_adapter
-from app.nlp.sentiment_analyzer import SentimentAnalyzer
+from app.nlp.async_scorer import get_async_scorer
 
 
 @register_adapter("hackernews")
@@ -16,8 +16,8 @@ class HackerNewsAdapter(AbstractSourceAdapter):
     ALGOLIA_URL = "https://hn.algolia.com/api/v1"
 
     def __init__(self):
-        self._rate_limiter = RateLimiter(requests_per_minute=60)
-        self._analyzer = SentimentAnalyzer()
+        self._rate_limiter = get_rate_limiter(self.source_name, requests_per_minute=60)
+        self._scorer = get_async_scorer()
 
     async def fetch_sentiment(self, ticker: str) -> RawSentimentData | None:
         await self._rate_limiter.acquire()
@@ -57,7 +57,7 @@ class HackerNewsAdapter(AbstractSourceAdapter):
         if not texts:
             return None
 
-        avg_score = self._analyzer.average_score(texts)
+        avg_score = await self._scorer.average_score_async(texts)
 
         return RawSentimentData(
             source_name=self.source_name,
@@ -1,3 +1,7 @@
+import asyncio
+import logging
+from collections import defaultdict
+
 import httpx
 from tenacity import (
     retry,
@@ -6,27 +10,139 @@ from tenacity import (
     wait_exponential,
 )
 
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CONNECTION_STATS_KEY = "http_connection_stats"
+
 _client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+# Per upstream host: requests sent, TCP connections opened, TLS handshakes,
+# requests that went over HTTP/2. Reused = requests - new connections.
+_host_stats: dict[str, dict[str, int]] = defaultdict(
+    lambda: {"requests": 0, "new_connections": 0, "tls_handshakes": 0, "http2_requests": 0}
+)
+_client_rebuilds = 0
 
 
 def get_http_client() -> httpx.AsyncClient:
-    """Get or create the shared async HTTP client."""
-    global _client
+    """
+    Get or create the shared async HTTP client.
+
+    The client's connection pool belongs to the event loop it was created on.
+    If it is requested from a different running loop, the old client is
+    discarded (its connections cannot be used there) and a new one is built.
+    """
+    global _client, _client_loop, _client_rebuilds
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _client is not None and loop is not None and _client_loop not in (None, loop):
+        _discard_client(_client, _client_loop)
+        _client = None
+        _client_rebuilds += 1
+
     if _client is None:
+        limits = httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
         _client = httpx.AsyncClient(
             timeout=httpx.Timeout(30.0, connect=10.0),
             follow_redirects=True,
-            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            limits=limits,
+            mounts=_http2_mounts(limits),
+            event_hooks={"request": [_trace_request]},
         )
+    if loop is not None:
+        _client_loop = loop
     return _client
 
 
 async def close_http_client():
     """Close the shared HTTP client. Call on app shutdown."""
-    global _client
+    global _client, _client_loop
     if _client is not None:
         await _client.aclose()
         _client = None
+        _client_loop = None
+
+
+def _discard_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop):
+    """Close a client on its own loop if that loop is still alive."""
+    if loop.is_closed() or not loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    except RuntimeError:
+        pass
+
+
+def _http2_mounts(limits: httpx.Limits) -> dict[str, httpx.AsyncBaseTransport]:
+    """
+    HTTP/2 transports for the hosts listed in HTTP2_HOSTS (httpx mount
+    patterns, e.g. "api.example.com" or "*.example.com"). Every other
+    upstream keeps using HTTP/1.1.
+    """
+    if not settings.HTTP2_HOSTS or not _http2_available():
+        return {}
+    return {
+        f"all://{host}": httpx.AsyncHTTPTransport(http2=True, limits=limits)
+        for host in settings.HTTP2_HOSTS
+    }
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("HTTP2_HOSTS is set but the h2 package is missing; using HTTP/1.1")
+        return False
+    return True
+
+
+async def _trace_request(request: httpx.Request):
+    stats = _host_stats[request.url.host]
+    stats["requests"] += 1
+
+    async def trace(event: str, info: dict):
+        if event == "connection.connect_tcp.complete":
+            stats["new_connections"] += 1
+        elif event == "connection.start_tls.complete":
+            stats["tls_handshakes"] += 1
+        elif event == "http2.send_request_headers.started":
+            stats["http2_requests"] += 1
+
+    request.extensions["trace"] = trace
+
+
+def connection_stats() -> dict:
+    """Connection reuse per upstream host for this process."""
+    hosts = {}
+    for host, s in _host_stats.items():
+        reused = max(s["requests"] - s["new_connections"], 0)
+        hosts[host] = {
+            **s,
+            "reused": reused,
+            "reuse_ratio": round(reused / s["requests"], 4) if s["requests"] else 0.0,
+        }
+    return {"client_rebuilds": _client_rebuilds, "hosts": hosts}
+
+
+def publish_connection_stats():
+    """Store this process's connection stats in Redis for /health."""
+    try:
+        from app.core.process_stats import process_field, stats_value
+        from app.core.redis import get_sync_redis
+
+        get_sync_redis().hset(CONNECTION_STATS_KEY, process_field(), stats_value(connection_stats()))
+    except Exception:
+        pass
 
 
 @retry(
@@ -3,7 +3,8 @@ from decimal import Decimal
 
 from app.adapters.base import AbstractSourceAdapter, RawSentimentData
 from app.adapters.http_client import get_http_client
-from app.adapters.rate_limiter import RateLimiter
+from app.adapters.rate_limiter import get_rate_limiter
+from app.adapters.response_cache import get_response_cache
 from app.adapters.registry import register_adapter
 
 
@@ -15,21 +16,20 @@ class PolymarketAdapter(AbstractSourceAdapter):
     GAMMA_API_URL = "https://gamma-api.polymarket.com"
 
     def __init__(self):
-        self._rate_limiter = RateLimiter(requests_per_minute=60)
+        self._rate_limiter = get_rate_limiter(self.source_name, requests_per_minute=60)
+        self._cache = get_response_cache()
 
     async def fetch_sentiment(self, ticker: str) -> RawSentimentData | None:
-        await self._rate_limiter.acquire()
-        client = get_http_client()
-
         # Search for markets related to this stock/company
-        response = await client.get(
+        return await self._cache.fetch_scored(
+            self.source_name,
             f"{self.GAMMA_API_URL}/markets",
+            lambda markets: self._score(ticker, markets),
             params={"tag": ticker, "active": True, "limit": 10},
+            rate_limiter=self._rate_limiter,
         )
-        if response.status_code != 200:
-            return None
 
-        markets = response.json()
+    def _score(self, ticker: str, markets) -> RawSentimentData | None:
         if not markets:
             return None
 
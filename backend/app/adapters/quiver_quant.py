@@ -3,7 +3,8 @@ from decimal import Decimal
 
 from app.adapters.base import AbstractSourceAdapter, RawSentimentData
 from app.adapters.http_client import get_http_client
-from app.adapters.rate_limiter import RateLimiter
+from app.adapters.rate_limiter import get_rate_limiter
+from app.adapters.response_cache import get_response_cache
 from app.adapters.registry import register_adapter
 from app.core.config import settings
 
@@ -16,25 +17,24 @@ class QuiverQuantAdapter(AbstractSourceAdapter):
     BASE_URL = "https://api.quiverquant.com/beta"
 
     def __init__(self):
-        self._rate_limiter = RateLimiter(requests_per_minute=30)
+        self._rate_limiter = get_rate_limiter(self.source_name, requests_per_minute=30)
         self._api_key = settings.QUIVER_QUANT_KEY
+        self._cache = get_response_cache()
 
     async def fetch_sentiment(self, ticker: str) -> RawSentimentData | None:
-        await self._rate_limiter.acquire()
-        client = get_http_client()
-
         headers = {"Authorization": f"Token {self._api_key}"}
 
-        # Fetch WSB mentions as a proxy for social sentiment
-        response = await client.get(
+        # Fetch WSB mentions as a proxy for social sentiment. The history is
+        # daily, so unchanged responses reuse the previous score.
+        return await self._cache.fetch_scored(
+            self.source_name,
             f"{self.BASE_URL}/historical/wallstreetbets/{ticker}",
+            lambda data: self._score(ticker, data),
             headers=headers,
+            rate_limiter=self._rate_limiter,
         )
 
-        if response.status_code != 200:
-            return None
-
-        data = response.json()
+    def _score(self, ticker: str, data) -> RawSentimentData | None:
         if not data:
             return None
 
@@ -1,5 +1,21 @@
 import asyncio
 import time
+from contextvars import ContextVar
+
+from app.core.config import settings
+
+# Seconds the current fetch spent waiting on rate limiters. Set per asyncio
+# task so concurrent fetches in one loop do not mix their numbers.
+rate_limit_wait: ContextVar[float] = ContextVar("rate_limit_wait", default=0.0)
+
+# Longest the current fetch may wait for a slot, when the caller has a
+# better budget than RATE_LIMIT_MAX_WAIT_SECONDS (fan-out tasks pacing a
+# whole source). Per asyncio task like rate_limit_wait.
+rate_limit_budget: ContextVar[float | None] = ContextVar("rate_limit_budget", default=None)
+
+
+class RateLimitExceededError(RuntimeError):
+    """Raised when the wait for a token would exceed the caller's budget."""
 
 
 class RateLimiter:
@@ -12,17 +28,178 @@ class RateLimiter:
         self._last_refill = time.monotonic()
         self._lock = asyncio.Lock()
 
-    async def acquire(self):
-        """Wait until a token is available, then consume it."""
+    async def acquire(self) -> float:
+        """Wait until a token is available, then consume it. Returns seconds waited."""
         async with self._lock:
             now = time.monotonic()
             elapsed = now - self._last_refill
             self._tokens = min(self._max_tokens, self._tokens + elapsed * self._rate)
             self._last_refill = now
 
+            wait_time = 0.0
             if self._tokens < 1.0:
                 wait_time = (1.0 - self._tokens) / self._rate
                 await asyncio.sleep(wait_time)
                 self._tokens = 0.0
             else:
                 self._tokens -= 1.0
+
+        rate_limit_wait.set(rate_limit_wait.get() + wait_time)
+        return wait_time
+
+
+# Reservation-style token bucket. Each call refills from server time,
+# takes one token (letting the balance go negative) and returns how long
+# the caller must sleep before its slot. Callers never poll: one EVALSHA
+# per acquire, and slots are handed out in arrival order.
+_TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local wait = 0
+if tokens < 1 then
+    wait = (1 - tokens) / rate
+end
+if wait > max_wait then
+    return {0, tostring(wait)}
+end
+
+tokens = tokens - 1
+redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / rate * 1000) + 1000)
+return {1, tostring(wait)}
+"""
+
+
+class DistributedRateLimiter:
+    """
+    Cluster-wide token bucket shared by every worker through Redis.
+
+    The rate comes from ``SourceConfig.rate_limit_rpm`` (refreshed every
+    RATE_LIMIT_CONFIG_TTL_SECONDS, ``default_rpm`` until loaded) and the
+    burst from ``config_json["burst"]`` (defaults to one minute of tokens,
+    like RateLimiter). If Redis is unreachable the limiter degrades to a
+    local RateLimiter for this process.
+    """
+
+    KEY_PREFIX = "ratelimit"
+
+    def __init__(self, source_name: str, default_rpm: int):
+        self._source_name = source_name
+        self._key = f"{self.KEY_PREFIX}:{source_name}"
+        self._rpm = default_rpm
+        self._burst = float(default_rpm)
+        self._config_loaded_at = 0.0
+        self._config_lock = asyncio.Lock()
+        self._script = None
+        self._fallback = RateLimiter(requests_per_minute=default_rpm)
+
+        self.acquires = 0
+        self.total_wait_seconds = 0.0
+
+    async def acquire(self, max_wait: float | None = None) -> float:
+        """
+        Reserve the next slot and sleep until it arrives. Returns seconds
+        waited. Raises RateLimitExceededError (without consuming a token) if
+        the slot is further away than ``max_wait``.
+        """
+        if max_wait is None:
+            max_wait = rate_limit_budget.get()
+        if max_wait is None:
+            max_wait = float(settings.RATE_LIMIT_MAX_WAIT_SECONDS)
+        await self._refresh_config()
+
+        try:
+            granted, wait_time = await self._reserve(max_wait)
+        except Exception:
+            return await self._fallback.acquire()
+
+        if not granted:
+            raise RateLimitExceededError(
+                f"{self._source_name}: next slot in {wait_time:.1f}s exceeds {max_wait:.1f}s budget"
+            )
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        self.acquires += 1
+        self.total_wait_seconds += wait_time
+        rate_limit_wait.set(rate_limit_wait.get() + wait_time)
+        return wait_time
+
+    async def _reserve(self, max_wait: float) -> tuple[bool, float]:
+        from app.core.redis import get_redis
+
+        if self._script is None:
+            r = await get_redis()
+            self._script = r.register_script(_TOKEN_BUCKET_LUA)
+        granted, wait_time = await self._script(
+            keys=[self._key],
+            args=[self._rpm / 60.0, self._burst, max_wait],
+        )
+        return bool(int(granted)), float(wait_time)
+
+    async def _refresh_config(self):
+        if self._config_is_fresh():
+            return
+        async with self._config_lock:
+            if self._config_is_fresh():
+                return
+            try:
+                config = await asyncio.to_thread(_load_source_limits, self._source_name)
+            except Exception:
+                config = None
+            # Stamp even on failure so a DB outage is not retried every call.
+            self._config_loaded_at = time.monotonic()
+        if config is None:
+            return
+        rpm, burst = config
+        if rpm > 0:
+            self._rpm = rpm
+            self._burst = float(burst or rpm)
+
+    def _config_is_fresh(self) -> bool:
+        return (
+            self._config_loaded_at > 0
+            and time.monotonic() - self._config_loaded_at < settings.RATE_LIMIT_CONFIG_TTL_SECONDS
+        )
+
+
+def _load_source_limits(source_name: str) -> tuple[int, int | None] | None:
+    from app.core.database import get_sync_session
+    from app.models.source_config import SourceConfig
+
+    with get_sync_session() as session:
+        config = (
+            session.query(SourceConfig)
+            .filter(SourceConfig.source_name == source_name)
+            .first()
+        )
+        if not config:
+            return None
+        return config.rate_limit_rpm, (config.config_json or {}).get("burst")
+
+
+def get_rate_limiter(source_name: str, requests_per_minute: int):
+    """
+    Build the limiter for an adapter. ``requests_per_minute`` is the default
+    used until the source's configured rate is loaded (or always, for the
+    in-process backend).
+    """
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return DistributedRateLimiter(source_name, default_rpm=requests_per_minute)
+    return RateLimiter(requests_per_minute=requests_per_minute)
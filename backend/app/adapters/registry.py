@@ -1,9 +1,18 @@
+import time
 from typing import Type
 
 from app.adapters.base import AbstractSourceAdapter
 
 _ADAPTER_REGISTRY: dict[str, Type[AbstractSourceAdapter]] = {}
 
+# Long-lived adapter instances for this process (one per source), so rate
+# limiter buckets, analyzers and lexicons survive across tasks.
+_ADAPTER_INSTANCES: dict[str, AbstractSourceAdapter] = {}
+
+# Milliseconds spent constructing each pooled adapter. Every task paid this
+# before adapters were pooled.
+ADAPTER_INIT_MS: dict[str, float] = {}
+
 
 def register_adapter(source_name: str):
     """Decorator to register an adapter class."""
@@ -16,11 +25,33 @@ def register_adapter(source_name: str):
 
 
 def get_adapter(source_name: str, **kwargs) -> AbstractSourceAdapter:
-    """Factory: instantiate an adapter by source name."""
+    """
+    Return the pooled adapter for a source, creating it on first use.
+    Passing constructor kwargs bypasses the pool and builds a fresh instance.
+    """
+    if kwargs:
+        return create_adapter(source_name, **kwargs)
+    adapter = _ADAPTER_INSTANCES.get(source_name)
+    if adapter is None:
+        start = time.perf_counter()
+        adapter = create_adapter(source_name)
+        ADAPTER_INIT_MS[source_name] = round((time.perf_counter() - start) * 1000, 3)
+        _ADAPTER_INSTANCES[source_name] = adapter
+    return adapter
+
+
+def create_adapter(source_name: str, **kwargs) -> AbstractSourceAdapter:
+    """Factory: instantiate a new adapter by source name."""
     if source_name not in _ADAPTER_REGISTRY:
         raise ValueError(f"No adapter registered for source: {source_name}")
     return _ADAPTER_REGISTRY[source_name](**kwargs)
 
 
+def reset_adapters():
+    """Drop pooled instances (e.g. after fork, before re-warming)."""
+    _ADAPTER_INSTANCES.clear()
+    ADAPTER_INIT_MS.clear()
+
+
 def get_all_adapter_names() -> list[str]:
     return list(_ADAPTER_REGISTRY.keys())
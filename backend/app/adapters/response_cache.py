@@ -0,0 +1,313 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+
+from app.adapters.base import RawSentimentData
+from app.adapters.http_client import get_http_client
+from app.core.config import settings
+
+STATS_KEY = "http_response_cache:stats"
+
+
+class ResponseCache:
+    """
+    Conditional-request cache for adapter GETs.
+
+    An entry holds only what is needed to avoid work on the next fetch: the
+    response validators (ETag / Last-Modified), a digest of the body and the
+    RawSentimentData scored from it. The body itself is never stored.
+
+    - Younger than the source's freshness TTL: the scored result is reused
+      without any request.
+    - Otherwise a conditional GET is sent; a 304, or a 200 whose body digest
+      is unchanged, reuses the scored result without parsing the body.
+    - Anything else is parsed and scored as usual and replaces the entry.
+
+    Entries live in Redis (``HTTP_CACHE_BACKEND=redis``) or as small JSON
+    files under HTTP_CACHE_DIR (``disk``).
+    """
+
+    KEY_PREFIX = "httpcache"
+
+    def __init__(self, backend: str, directory: str, max_age_seconds: int):
+        self._backend = backend
+        self._dir = Path(directory)
+        self._max_age = max_age_seconds
+        self._ttl: dict[str, tuple[float, int]] = {}
+
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.unchanged_bodies = 0
+        self.misses = 0
+        self._published = {"fresh_hits": 0, "revalidated": 0, "unchanged_bodies": 0, "misses": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self._backend in ("redis", "disk")
+
+    async def fetch_scored(
+        self,
+        source_name: str,
+        url: str,
+        score: Callable[[Any], RawSentimentData | None],
+        params: dict | None = None,
+        headers: dict | None = None,
+        rate_limiter=None,
+    ) -> RawSentimentData | None:
+        """
+        GET ``url`` and return ``score(response.json())``, reusing the last
+        scored result whenever the upstream body is known to be unchanged.
+        Non-200 responses return None and leave the entry untouched.
+
+        ``rate_limiter`` is acquired only when a request is actually sent
+        (conditional ones included), so fresh hits cost no token.
+        """
+        client = get_http_client()
+        if not self.enabled:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            return _score_response(await client.get(url, params=params, headers=headers), score)
+
+        key = self._key(source_name, str(httpx.URL(url, params=params)))
+        entry = await self._load(key)
+
+        if entry is not None:
+            age = time.time() - entry["stored_at"]
+            if age < await self._freshness_ttl(source_name):
+                self.fresh_hits += 1
+                return _revive(entry["result"], "fresh")
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        response = await client.get(url, params=params, headers=request_headers)
+
+        if entry is not None and response.status_code == 304:
+            self.revalidated += 1
+            await self._save(key, {**entry, **_validators(response, entry), "stored_at": time.time()})
+            return _revive(entry["result"], "revalidated")
+
+        if response.status_code != 200:
+            return None
+
+        digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+        if entry is not None and entry.get("digest") == digest:
+            self.unchanged_bodies += 1
+            await self._save(key, {**entry, **_validators(response, entry), "stored_at": time.time()})
+            return _revive(entry["result"], "unchanged")
+
+        self.misses += 1
+        result = _score_response(response, score)
+        await self._save(key, {
+            **_validators(response),
+            "digest": digest,
+            "stored_at": time.time(),
+            "result": _dump(result),
+        })
+        return result
+
+    async def get_fresh(self, source_name: str, ticker: str) -> RawSentimentData | None:
+        """
+        Result stored with put() for a source that is not fetched over
+        httpx (no validators), if it is still within the freshness TTL.
+        """
+        if not self.enabled:
+            return None
+        entry = await self._load(self._key(source_name, ticker))
+        if entry is None or entry["result"] is None:
+            return None
+        if time.time() - entry["stored_at"] >= await self._freshness_ttl(source_name):
+            return None
+        self.fresh_hits += 1
+        return _revive(entry["result"], "fresh")
+
+    async def put(self, source_name: str, ticker: str, result: RawSentimentData | None):
+        if not self.enabled or result is None:
+            return
+        self.misses += 1
+        await self._save(
+            self._key(source_name, ticker),
+            {"stored_at": time.time(), "result": _dump(result)},
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "fresh_hits": self.fresh_hits,
+            "revalidated": self.revalidated,
+            "unchanged_bodies": self.unchanged_bodies,
+            "misses": self.misses,
+        }
+
+    def publish_stats(self):
+        """Add this process's counters since the last publish to Redis."""
+        current = self.stats()
+        deltas = {k: v - self._published[k] for k, v in current.items() if v != self._published[k]}
+        if not deltas:
+            return
+        try:
+            from app.core.redis import get_sync_redis
+
+            pipe = get_sync_redis().pipeline()
+            for field, delta in deltas.items():
+                pipe.hincrby(STATS_KEY, field, delta)
+            pipe.execute()
+        except Exception:
+            return
+        self._published = current
+
+    def _key(self, source_name: str, identity: str) -> str:
+        digest = hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()
+        return f"{self.KEY_PREFIX}:{source_name}:{digest}"
+
+    async def _load(self, key: str) -> dict | None:
+        try:
+            if self._backend == "redis":
+                from app.core.redis import get_redis
+
+                raw = await (await get_redis()).get(key)
+            else:
+                raw = await asyncio.to_thread(self._read_file, key)
+        except Exception:
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _save(self, key: str, entry: dict):
+        raw = json.dumps(entry, separators=(",", ":"), default=str)
+        try:
+            if self._backend == "redis":
+                from app.core.redis import get_redis
+
+                await (await get_redis()).set(key, raw, ex=self._max_age)
+            else:
+                await asyncio.to_thread(self._write_file, key, raw)
+        except Exception:
+            pass
+
+    def _path(self, key: str) -> Path:
+        _, source_name, digest = key.split(":")
+        return self._dir / source_name / f"{digest}.json"
+
+    def _read_file(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self._max_age:
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_text()
+        except FileNotFoundError:
+            return None
+
+    def _write_file(self, key: str, raw: str):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(raw)
+        os.replace(tmp, path)
+
+    async def _freshness_ttl(self, source_name: str) -> int:
+        """``config_json["cache_ttl_seconds"]`` for the source, 0 if unset."""
+        loaded_at, ttl = self._ttl.get(source_name, (0.0, 0))
+        if time.monotonic() - loaded_at < settings.RATE_LIMIT_CONFIG_TTL_SECONDS:
+            return ttl
+        try:
+            ttl = await asyncio.to_thread(_load_cache_ttl, source_name)
+        except Exception:
+            pass
+        self._ttl[source_name] = (time.monotonic(), ttl)
+        return ttl
+
+
+def _validators(response: httpx.Response, previous: dict | None = None) -> dict:
+    previous = previous or {}
+    return {
+        "etag": response.headers.get("ETag") or previous.get("etag"),
+        "last_modified": response.headers.get("Last-Modified") or previous.get("last_modified"),
+    }
+
+
+def _score_response(
+    response: httpx.Response, score: Callable[[Any], RawSentimentData | None]
+) -> RawSentimentData | None:
+    if response.status_code != 200:
+        return None
+    return score(response.json())
+
+
+def _dump(result: RawSentimentData | None) -> dict | None:
+    if result is None:
+        return None
+    data = asdict(result)
+    data.pop("raw_texts", None)
+    data["raw_score"] = str(result.raw_score) if result.raw_score is not None else None
+    data["normalized_score"] = str(result.normalized_score)
+    data["fetched_at"] = result.fetched_at.isoformat()
+    return data
+
+
+def _revive(data: dict | None, cache_status: str) -> RawSentimentData | None:
+    """
+    Rebuild a cached result. ``fetched_at`` stays that of the fetch that
+    produced it, and ``metadata["http_cache"]`` tells callers the result
+    was reused (its SourceScore row already exists).
+    """
+    if data is None:
+        return None
+    return RawSentimentData(
+        source_name=data["source_name"],
+        ticker=data["ticker"],
+        raw_score=Decimal(data["raw_score"]) if data["raw_score"] is not None else None,
+        normalized_score=Decimal(data["normalized_score"]),
+        data_points=data["data_points"],
+        fetched_at=datetime.fromisoformat(data["fetched_at"]),
+        metadata={**data["metadata"], "http_cache": cache_status},
+    )
+
+
+def _load_cache_ttl(source_name: str) -> int:
+    from app.core.database import get_sync_session
+    from app.models.source_config import SourceConfig
+
+    with get_sync_session() as session:
+        config = (
+            session.query(SourceConfig)
+            .filter(SourceConfig.source_name == source_name)
+            .first()
+        )
+        if not config:
+            return 0
+        return int((config.config_json or {}).get("cache_ttl_seconds", 0))
+
+
+_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(
+            backend=settings.HTTP_CACHE_BACKEND,
+            directory=settings.HTTP_CACHE_DIR,
+            max_age_seconds=settings.HTTP_CACHE_MAX_AGE_SECONDS,
+        )
+    return _cache
+
+
+def publish_response_cache_stats():
+    """Report this worker's response cache counters to Redis."""
+    if _cache is not None:
+        _cache.publish_stats()
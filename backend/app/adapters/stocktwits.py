@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from app.adapters.base import AbstractSourceAdapter, RawSentimentData
 from app.adapters.http_client import get_http_client
-from app.adapters.rate_limiter import RateLimiter
+from app.adapters.rate_limiter import get_rate_limiter
 from app.adapters.registry import register_adapter
 
 
@@ -15,7 +15,7 @@ class StocktwitsAdapter(AbstractSourceAdapter):
     BASE_URL = "https://api.stocktwits.com/api/2"
 
     def __init__(self):
-        self._rate_limiter = RateLimiter(requests_per_minute=100)
+        self._rate_limiter = get_rate_limiter(self.source_name, requests_per_minute=100)
 
     async def fetch_sentiment(self, ticker: str) -> RawSentimentData | None:
         await self._rate_limiter.acquire()
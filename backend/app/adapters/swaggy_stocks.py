@@ -3,7 +3,8 @@ from decimal import Decimal
 
 from app.adapters.base import AbstractSourceAdapter, RawSentimentData
 from app.adapters.http_client import get_http_client
-from app.adapters.rate_limiter import RateLimiter
+from app.adapters.rate_limiter import get_rate_limiter
+from app.adapters.response_cache import get_response_cache
 from app.adapters.registry import register_adapter
 
 
@@ -15,20 +16,19 @@ class SwaggyStocksAdapter(AbstractSourceAdapter):
     BASE_URL = "https://api.swaggystocks.com/wsb"
 
     def __init__(self):
-        self._rate_limiter = RateLimiter(requests_per_minute=30)
+        self._rate_limiter = get_rate_limiter(self.source_name, requests_per_minute=30)
+        self._cache = get_response_cache()
 
     async def fetch_sentiment(self, ticker: str) -> RawSentimentData | None:
-        await self._rate_limiter.acquire()
-        client = get_http_client()
-
-        response = await client.get(
+        return await self._cache.fetch_scored(
+            self.source_name,
             f"{self.BASE_URL}/sentiment/ticker",
+            lambda data: self._score(ticker, data),
             params={"ticker": ticker},
+            rate_limiter=self._rate_limiter,
         )
-        if response.status_code != 200:
-            return None
 
-        data = response.json()
+    def _score(self, ticker: str, data) -> RawSentimentData | None:
         if not data:
             return None
 
@@ -3,9 +3,9 @@ from datetime import datetime, timezone
 from decimal import Decimal
 
 from app.adapters.base import AbstractSourceAdapter, RawSentimentData
-from app.adapters.rate_limiter import RateLimiter
+from app.adapters.rate_limiter import get_rate_limiter
 from app.adapters.registry import register_adapter
-from app.nlp.sentiment_analyzer import SentimentAnalyzer
+from app.nlp.async_scorer import get_async_scorer
 
 
 @register_adapter("yahoo_finance")
@@ -14,8 +14,8 @@ class YahooFinanceAdapter(AbstractSourceAdapter):
     category = "financial"
 
     def __init__(self):
-        self._rate_limiter = RateLimiter(requests_per_minute=60)
-        self._analyzer = SentimentAnalyzer()
+        self._rate_limiter = get_rate_limiter(self.source_name, requests_per_minute=60)
+        self._scorer = get_async_scorer()
 
     async def fetch_sentiment(self, ticker: str) -> RawSentimentData | None:
         await self._rate_limiter.acquire()
@@ -39,7 +39,7 @@ class YahooFinanceAdapter(AbstractSourceAdapter):
             if not titles:
                 return None
 
-            avg_score = self._analyzer.average_score(titles)
+            avg_score = await self._scorer.average_score_async(titles)
 
             return RawSentimentData(
                 source_name=self.source_name,
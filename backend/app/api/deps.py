@@ -1,6 +1,15 @@
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_session
+from app.services.stock_cache import CachedStock, get_cached_stock
 
 # Re-export for use as FastAPI dependency
 get_db = get_async_session
+
+
+async def get_stock_or_404(db: AsyncSession, ticker: str) -> CachedStock:
+    stock = await get_cached_stock(db, ticker)
+    if not stock:
+        raise HTTPException(status_code=404, detail=f"Stock {ticker} not found")
+    return stock
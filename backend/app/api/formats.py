@@ -0,0 +1,146 @@
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, Request, Response
+
+JSON = "application/json"
+ARROW = "application/vnd.apache.arrow.stream"
+MSGPACK = "application/x-msgpack"
+
+_ALIASES = {"application/msgpack": MSGPACK, "application/vnd.msgpack": MSGPACK}
+_PACKAGES = {ARROW: "pyarrow", MSGPACK: "msgpack"}
+
+# Column kinds a table spec may use: (name, kind) pairs, see columnar_response().
+TIMESTAMP, FLOAT, INT, STR, CATEGORY = "timestamp", "float", "int", "str", "category"
+
+
+def negotiate_format(request: Request) -> str:
+    """
+    Pick the response media type from the Accept header (FastAPI dependency).
+
+    JSON unless the client prefers Arrow IPC or msgpack. Asking only for a
+    binary format whose package is not installed is a 406.
+    """
+    ranges = []
+    for i, part in enumerate(request.headers.get("accept", "").split(",")):
+        media, *params = (p.strip() for p in part.split(";"))
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    pass
+        if media and q > 0:
+            ranges.append((-q, i, _ALIASES.get(media.lower(), media.lower())))
+
+    missing = None
+    for _, _, media in sorted(ranges):
+        if media in (JSON, "application/*", "*/*"):
+            return JSON
+        if media in _PACKAGES:
+            if _available(media):
+                return media
+            missing = media
+    if missing:
+        raise HTTPException(
+            status_code=406,
+            detail=f"{missing} needs the {_PACKAGES[missing]} package on the server",
+        )
+    return JSON
+
+
+def _available(media_type: str) -> bool:
+    try:
+        if media_type == ARROW:
+            import pyarrow  # noqa: F401
+        else:
+            import msgpack  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def columnar_response(media_type: str, meta: dict, tables: dict[str, tuple]) -> Response:
+    """
+    Encode row tuples column by column instead of as row-wise JSON.
+
+    ``tables`` maps a table name to ``(columns, rows)``, where ``columns`` is
+    a sequence of (name, kind) pairs and every row a tuple in that order.
+
+    Arrow: one IPC stream per table, back to back, each schema carrying
+    ``meta`` plus its table name as metadata. Read them in order with
+    ``pa.ipc.open_stream`` on a single ``pa.BufferReader``. Timestamps are
+    UTC milliseconds and category columns dictionary-encoded.
+
+    msgpack: ``{**meta, table: {column: [values...]}}`` with timestamps as
+    epoch milliseconds and category columns as ``{"categories", "codes"}``.
+    """
+    if media_type == ARROW:
+        body = _arrow_body(meta, tables)
+    else:
+        body = _msgpack_body(meta, tables)
+    return Response(content=body, media_type=media_type, headers={"Vary": "Accept"})
+
+
+def _transpose(columns, rows) -> list[list]:
+    if not rows:
+        return [[] for _ in columns]
+    return [list(values) for values in zip(*rows)]
+
+
+def _categorize(values: list) -> tuple[list[str], list[int]]:
+    index: dict[str, int] = {}
+    codes = [index.setdefault(v, len(index)) for v in values]
+    return list(index), codes
+
+
+def _epoch_ms(ts: datetime | None) -> int | None:
+    return None if ts is None else int(ts.timestamp() * 1000)
+
+
+def _msgpack_body(meta: dict, tables: dict[str, tuple]) -> bytes:
+    import msgpack
+
+    payload = dict(meta)
+    for name, (columns, rows) in tables.items():
+        table = {}
+        for (column, kind), values in zip(columns, _transpose(columns, rows)):
+            if kind == TIMESTAMP:
+                values = [_epoch_ms(v) for v in values]
+            elif kind == CATEGORY:
+                categories, codes = _categorize(values)
+                values = {"categories": categories, "codes": codes}
+            table[column] = values
+        payload[name] = table
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def _arrow_body(meta: dict, tables: dict[str, tuple]) -> bytes:
+    import pyarrow as pa
+
+    types = {
+        TIMESTAMP: pa.timestamp("ms", tz="UTC"),
+        FLOAT: pa.float64(),
+        INT: pa.int64(),
+        STR: pa.string(),
+    }
+    metadata = {k: v if isinstance(v, str) else json.dumps(v) for k, v in meta.items()}
+    sink = pa.BufferOutputStream()
+    for name, (columns, rows) in tables.items():
+        arrays = []
+        for (column, kind), values in zip(columns, _transpose(columns, rows)):
+            if kind == CATEGORY:
+                categories, codes = _categorize(values)
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(codes, pa.int32()), pa.array(categories, pa.string())
+                ))
+            else:
+                arrays.append(pa.array(values, types[kind]))
+        schema = pa.schema(
+            [pa.field(column, array.type) for (column, _), array in zip(columns, arrays)],
+            metadata={**metadata, "table": name},
+        )
+        with pa.ipc.new_stream(sink, schema) as writer:
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+    return sink.getvalue().to_pybytes()
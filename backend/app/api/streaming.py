@@ -0,0 +1,61 @@
+import json
+from typing import AsyncIterator, Callable
+
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+
+
+def _dumps(value) -> str:
+    # Same encoding as fastapi's JSONResponse
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+async def stream_rows(query, transform: Callable = tuple) -> AsyncIterator[list]:
+    """
+    ``transform(row)`` for every row of ``query``, in batches read through a
+    server-side cursor (HISTORY_STREAM_BATCH_ROWS rows per round trip).
+
+    Runs in a session of its own: the request's session is closed by the
+    time a streamed response body is iterated.
+    """
+    from app.core.database import async_session_factory
+
+    batch_rows = settings.HISTORY_STREAM_BATCH_ROWS
+    async with async_session_factory() as db:
+        result = await db.stream(query.execution_options(yield_per=batch_rows))
+        async for rows in result.partitions():
+            yield [transform(row) for row in rows]
+
+
+def json_stream_response(
+    head: dict, arrays: dict[str, AsyncIterator[list]], counts: dict[str, str] | None = None
+) -> StreamingResponse:
+    """
+    A JSON object written while it is produced, one chunk per batch: the
+    ``head`` fields, then a key per entry of ``arrays`` whose elements come
+    from its batches. ``counts`` maps an array name to a key written after
+    the array with its length.
+    """
+    counts = counts or {}
+
+    async def body():
+        chunk = _dumps(head)[:-1]
+        first = not head
+        for name, batches in arrays.items():
+            chunk += ("" if first else ",") + _dumps(name) + ":["
+            first = False
+            length = 0
+            async for batch in batches:
+                if not batch:
+                    continue
+                chunk += ("," if length else "") + ",".join(_dumps(item) for item in batch)
+                length += len(batch)
+                yield chunk
+                chunk = ""
+            chunk += "]"
+            if name in counts:
+                chunk += f",{_dumps(counts[name])}:{length}"
+        yield chunk + "}"
+
+    return StreamingResponse(body(), media_type="application/json", headers={"Vary": "Accept"})
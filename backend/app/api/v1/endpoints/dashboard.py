@@ -1,13 +1,16 @@
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_stock_or_404
+from app.core.config import settings
 from app.models.aggregate_score import AggregateScore
+from app.models.latest_aggregate_score import LatestAggregateScore
 from app.models.source_score import SourceScore
-from app.models.stock import Stock
+from app.services.dashboard_cache import get_dashboard_cache
+from app.services.latest_scores import fetch_latest_scores
 
 router = APIRouter()
 
@@ -19,21 +22,20 @@ async def get_dashboard_data(
     db: AsyncSession = Depends(get_db),
 ):
     """Full dashboard payload for a single stock: current score, trend, source breakdown."""
-    result = await db.execute(
-        select(Stock).filter(Stock.ticker == ticker.upper())
+    stock = await get_stock_or_404(db, ticker)
+
+    if not settings.DASHBOARD_CACHE_ENABLED:
+        return await _build_dashboard(db, stock, hours)
+
+    payload = await get_dashboard_cache().get_or_compute(
+        stock.ticker, hours, lambda: _build_dashboard(db, stock, hours)
     )
-    stock = result.scalar_one_or_none()
-    if not stock:
-        raise HTTPException(status_code=404, detail=f"Stock {ticker} not found")
+    return Response(content=payload, media_type="application/json")
 
+
+async def _build_dashboard(db: AsyncSession, stock, hours: int) -> dict:
     # Latest aggregate score
-    agg_result = await db.execute(
-        select(AggregateScore)
-        .filter(AggregateScore.stock_id == stock.id)
-        .order_by(desc(AggregateScore.computed_at))
-        .limit(1)
-    )
-    latest = agg_result.scalar_one_or_none()
+    latest = await db.get(LatestAggregateScore, stock.id)
 
     # Trend data for the last N hours
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
@@ -104,30 +106,20 @@ async def get_overview(
     db: AsyncSession = Depends(get_db),
 ):
     """Multi-stock overview for the main dashboard page."""
-    result = await db.execute(
-        select(Stock).filter(Stock.is_active.is_(True)).order_by(Stock.ticker)
-    )
-    stocks = result.scalars().all()
-
-    overview = []
-    for stock in stocks:
-        agg_result = await db.execute(
-            select(AggregateScore)
-            .filter(AggregateScore.stock_id == stock.id)
-            .order_by(desc(AggregateScore.computed_at))
-            .limit(1)
-        )
-        latest = agg_result.scalar_one_or_none()
+    rows = await fetch_latest_scores(db)
 
-        overview.append({
-            "ticker": stock.ticker,
-            "company_name": stock.company_name,
-            "score": float(latest.score) if latest else None,
-            "confidence": float(latest.confidence) if latest else None,
-            "sentiment_label": latest.sentiment_label if latest else None,
-            "score_delta": float(latest.score_delta) if latest and latest.score_delta else None,
-            "sources_available": latest.sources_available if latest else 0,
-            "computed_at": latest.computed_at.isoformat() if latest else None,
-        })
+    overview = [
+        {
+            "ticker": row.ticker,
+            "company_name": row.company_name,
+            "score": float(row.score) if row.score is not None else None,
+            "confidence": float(row.confidence) if row.confidence is not None else None,
+            "sentiment_label": row.sentiment_label,
+            "score_delta": float(row.score_delta) if row.score_delta else None,
+            "sources_available": row.sources_available or 0,
+            "computed_at": row.computed_at.isoformat() if row.computed_at else None,
+        }
+        for row in rows
+    ]
 
     return {"stocks": overview}
@@ -1,9 +1,21 @@
+import json
+import time
+
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.adapters.http_client import CONNECTION_STATS_KEY
+from app.adapters.response_cache import STATS_KEY as RESPONSE_CACHE_STATS_KEY
 from app.api.deps import get_db
+from app.core.process_stats import is_stale
 from app.core.redis import get_redis
+from app.core.write_buffer import WRITE_BUFFER_STATS_KEY
+from app.nlp.score_cache import STATS_KEY
+from app.services.dashboard_cache import STATS_KEY as DASHBOARD_CACHE_STATS_KEY
+from app.services.fetch_planner import LAST_PLAN_KEY
+from app.services.score_hub import STATS_KEY as SSE_HUB_STATS_KEY
+from app.tasks.warmup import STARTUP_METRICS_KEY
 
 router = APIRouter()
 
@@ -33,4 +45,65 @@ async def health_check(db: AsyncSession = Depends(get_db)):
     return {
         "status": "healthy" if all_healthy else "degraded",
         "checks": checks,
+        "sentiment_cache": await _counter_stats(STATS_KEY),
+        "http_response_cache": await _counter_stats(RESPONSE_CACHE_STATS_KEY),
+        "dashboard_cache": _with_hit_ratio(await _counter_stats(DASHBOARD_CACHE_STATS_KEY)),
+        "worker_startup": await _per_worker_metrics(STARTUP_METRICS_KEY),
+        "http_connections": await _per_worker_metrics(CONNECTION_STATS_KEY),
+        "write_buffer": await _per_worker_metrics(WRITE_BUFFER_STATS_KEY),
+        "sse_hub": await _per_worker_metrics(SSE_HUB_STATS_KEY),
+        "fetch_plan": await _last_fetch_plan(),
     }
+
+
+async def _counter_stats(key: str) -> dict[str, int]:
+    """Cluster-wide cache counters published by the workers."""
+    try:
+        r = await get_redis()
+        raw = await r.hgetall(key)
+    except Exception:
+        return {}
+    return {field: int(value) for field, value in raw.items()}
+
+
+def _with_hit_ratio(stats: dict[str, int]) -> dict:
+    lookups = sum(stats.get(field, 0) for field in ("hits", "misses", "coalesced"))
+    if lookups:
+        return {**stats, "hit_ratio": round((lookups - stats.get("misses", 0)) / lookups, 4)}
+    return stats
+
+
+async def _per_worker_metrics(key: str) -> dict[str, dict]:
+    """
+    JSON metrics reported per worker or API process (warm-up, HTTP reuse,
+    writes, SSE). Entries their process stopped refreshing are removed.
+    """
+    try:
+        r = await get_redis()
+        raw = await r.hgetall(key)
+    except Exception:
+        return {}
+    now = time.time()
+    metrics, stale = {}, []
+    for worker, value in raw.items():
+        stats = json.loads(value)
+        if is_stale(stats, now):
+            stale.append(worker)
+        else:
+            metrics[worker] = stats
+    if stale:
+        try:
+            await r.hdel(key, *stale)
+        except Exception:
+            pass
+    return metrics
+
+
+async def _last_fetch_plan() -> dict:
+    """Predicted timeline of the most recent refresh cycle."""
+    try:
+        r = await get_redis()
+        raw = await r.get(LAST_PLAN_KEY)
+    except Exception:
+        return {}
+    return json.loads(raw) if raw else {}
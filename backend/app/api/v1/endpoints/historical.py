@@ -1,187 +1,365 @@
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import desc, select
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_stock_or_404
+from app.api.formats import (
+    CATEGORY, FLOAT, INT, JSON, TIMESTAMP, columnar_response, negotiate_format,
+)
+from app.api.streaming import json_stream_response, stream_rows
 from app.models.aggregate_score import AggregateScore
+from app.models.aggregate_score_rollup import AggregateScoreRollup
 from app.models.source_score import SourceScore
-from app.models.stock import Stock
+from app.services.rollups import BUCKET_SECONDS, ROLLUP_RESOLUTIONS, bucket_start, time_bucket
 
 router = APIRouter()
 
+# Row layout of _history_query/_source_query results after their row
+# transforms, as (name, kind) pairs for columnar responses.
+HISTORY_COLUMNS = (
+    ("computed_at", TIMESTAMP),
+    ("score", FLOAT),
+    ("confidence", FLOAT),
+    ("sentiment_label", CATEGORY),
+    ("sources_available", INT),
+    ("min", FLOAT),
+    ("max", FLOAT),
+    ("last", FLOAT),
+    ("count", INT),
+)
+SOURCE_COLUMNS = (
+    ("fetched_at", TIMESTAMP),
+    ("source_name", CATEGORY),
+    ("normalized_score", FLOAT),
+    ("data_points", INT),
+)
+
 
 @router.get("/historical/{ticker}")
 async def get_historical(
     ticker: str,
+    response: Response,
     from_time: datetime | None = Query(None, alias="from"),
     to_time: datetime | None = Query(None, alias="to"),
     resolution: str = Query("1h", regex="^(15m|1h|4h|1d)$"),
     include_sources: bool = Query(False),
     limit: int = Query(500, ge=1, le=5000),
+    stream: bool = Query(False),
+    media_type: str = Depends(negotiate_format),
     db: AsyncSession = Depends(get_db),
 ):
-    """Historical sentiment data with configurable resolution."""
-    result = await db.execute(
-        select(Stock).filter(Stock.ticker == ticker.upper())
-    )
-    stock = result.scalar_one_or_none()
-    if not stock:
-        raise HTTPException(status_code=404, detail=f"Stock {ticker} not found")
+    """
+    Historical sentiment data with configurable resolution.
+
+    JSON by default; ``Accept: application/vnd.apache.arrow.stream`` or
+    ``application/x-msgpack`` returns the same data column-wise. With
+    ``stream=true`` JSON is written in chunks from a server-side cursor
+    instead of being built in memory first.
+    """
+    stock = await get_stock_or_404(db, ticker)
 
     if from_time is None:
         from_time = datetime.now(timezone.utc) - timedelta(days=7)
     if to_time is None:
         to_time = datetime.now(timezone.utc)
 
-    # Fetch all aggregate scores in range
-    agg_result = await db.execute(
-        select(AggregateScore)
-        .filter(
-            AggregateScore.stock_id == stock.id,
-            AggregateScore.computed_at >= from_time,
-            AggregateScore.computed_at <= to_time,
-        )
-        .order_by(AggregateScore.computed_at)
-        .limit(limit)
-    )
-    scores = agg_result.scalars().all()
-
-    # Resample based on resolution
-    resampled = _resample_scores(scores, resolution)
-
-    response = {
+    meta = {
         "ticker": stock.ticker,
         "from": from_time.isoformat(),
         "to": to_time.isoformat(),
         "resolution": resolution,
-        "data_points": len(resampled),
-        "data": resampled,
     }
+    history_query, to_point = _history_query(stock.id, resolution, from_time, to_time, limit)
+    source_query = _source_query(stock.id, from_time, to_time, limit * 13)
+
+    if stream and media_type == JSON:
+        arrays = {"data": stream_rows(history_query, lambda row: _point_json(to_point(row)))}
+        if include_sources:
+            arrays["source_data"] = stream_rows(source_query, lambda row: _source_json(_source_row(row)))
+        return json_stream_response(meta, arrays, counts={"data": "data_points"})
 
+    points = [to_point(row) for row in (await db.execute(history_query)).all()]
+    tables = {"data": (HISTORY_COLUMNS, points)}
     if include_sources:
-        source_result = await db.execute(
-            select(SourceScore)
-            .filter(
-                SourceScore.stock_id == stock.id,
-                SourceScore.fetched_at >= from_time,
-                SourceScore.fetched_at <= to_time,
-            )
-            .order_by(SourceScore.fetched_at)
-            .limit(limit * 13)
-        )
-        source_scores = source_result.scalars().all()
-        response["source_data"] = [
-            {
-                "source_name": s.source_name,
-                "normalized_score": float(s.normalized_score),
-                "data_points": s.data_points,
-                "fetched_at": s.fetched_at.isoformat(),
-            }
-            for s in source_scores
-        ]
+        rows = (await db.execute(source_query)).all()
+        tables["source_data"] = (SOURCE_COLUMNS, [_source_row(row) for row in rows])
 
-    return response
+    if media_type != JSON:
+        return columnar_response(media_type, meta, tables)
+
+    response.headers["Vary"] = "Accept"
+    return history_json(meta, tables)
 
 
 @router.get("/historical/{ticker}/heatmap")
 async def get_heatmap(
     ticker: str,
+    response: Response,
     from_time: datetime | None = Query(None, alias="from"),
     to_time: datetime | None = Query(None, alias="to"),
+    resolution: str = Query("1h", regex="^(15m|1h|4h|1d)$"),
+    stream: bool = Query(False),
+    media_type: str = Depends(negotiate_format),
     db: AsyncSession = Depends(get_db),
 ):
-    """Source x time heatmap data for visualization."""
-    result = await db.execute(
-        select(Stock).filter(Stock.ticker == ticker.upper())
-    )
-    stock = result.scalar_one_or_none()
-    if not stock:
-        raise HTTPException(status_code=404, detail=f"Stock {ticker} not found")
+    """
+    Source x time heatmap: each source's mean score per time bucket, as a
+    matrix of ``scores[source][bucket]``. Arrow and msgpack responses hold
+    one ``bucket`` column plus a score column per source. ``stream=true``
+    writes the JSON matrix a source row at a time (see _stream_heatmap).
+    """
+    stock = await get_stock_or_404(db, ticker)
 
     if from_time is None:
         from_time = datetime.now(timezone.utc) - timedelta(days=7)
     if to_time is None:
         to_time = datetime.now(timezone.utc)
 
-    source_result = await db.execute(
-        select(SourceScore)
+    meta = {
+        "ticker": stock.ticker,
+        "from": from_time.isoformat(),
+        "to": to_time.isoformat(),
+        "resolution": resolution,
+    }
+    bucket = time_bucket(SourceScore.fetched_at, BUCKET_SECONDS[resolution]).label("bucket")
+    in_range = (
+        SourceScore.stock_id == stock.id,
+        SourceScore.fetched_at >= from_time,
+        SourceScore.fetched_at <= to_time,
+    )
+
+    if stream and media_type == JSON:
+        return await _stream_heatmap(db, meta, bucket, in_range)
+
+    result = await db.execute(
+        select(bucket, SourceScore.source_name, func.avg(SourceScore.normalized_score))
+        .filter(*in_range)
+        .group_by(bucket, SourceScore.source_name)
+        .order_by(bucket)
+    )
+    cells = result.all()
+
+    # Source x bucket matrix; None where a source has no score in a bucket
+    buckets = list(dict.fromkeys(b for b, _, _ in cells))
+    sources = sorted({name for _, name, _ in cells})
+    column = {b: i for i, b in enumerate(buckets)}
+    row = {name: i for i, name in enumerate(sources)}
+    matrix = [[None] * len(buckets) for _ in sources]
+    for b, name, avg in cells:
+        matrix[row[name]][column[b]] = round(float(avg), 6)
+
+    if media_type != JSON:
+        columns = [("bucket", TIMESTAMP)] + [(name, FLOAT) for name in sources]
+        rows = [(b, *scores) for b, *scores in zip(buckets, *matrix)]
+        return columnar_response(media_type, meta, {"scores": (columns, rows)})
+
+    response.headers["Vary"] = "Accept"
+    return {
+        **meta,
+        "sources": sources,
+        "buckets": [b.isoformat() for b in buckets],
+        "scores": matrix,
+    }
+
+
+async def _stream_heatmap(db: AsyncSession, meta: dict, bucket, in_range: tuple):
+    """
+    The heatmap JSON written one source row at a time. The source and bucket
+    axes are read first (they are small), then the cells stream through a
+    server-side cursor ordered by source, so only one row is held at once.
+
+    The cells are read in another transaction, after the axes went out:
+    cells of a source or bucket written since are skipped, and a source
+    whose cells were deleted since gets an empty row, so every row still
+    lines up with ``sources`` and ``buckets``.
+    """
+    sources = (await db.execute(
+        select(SourceScore.source_name).filter(*in_range).distinct().order_by(SourceScore.source_name)
+    )).scalars().all()
+    buckets = (await db.execute(
+        select(bucket).filter(*in_range).distinct().order_by(bucket)
+    )).scalars().all()
+    column = {b: i for i, b in enumerate(buckets)}
+    position = {name: i for i, name in enumerate(sources)}
+
+    cells = (
+        select(SourceScore.source_name, bucket, func.avg(SourceScore.normalized_score))
+        .filter(*in_range)
+        .group_by(SourceScore.source_name, bucket)
+        .order_by(SourceScore.source_name, bucket)
+    )
+
+    async def source_rows():
+        # Rows of sources[:emitted] are out; ``row`` belongs to sources[emitted]
+        emitted, row = 0, None
+        async for batch in stream_rows(cells):
+            done = []
+            for name, b, avg in batch:
+                at = position.get(name)
+                if at is None or b not in column:
+                    continue
+                if row is None or at > emitted:
+                    if row is not None:
+                        done.append(row)
+                        emitted += 1
+                    done.extend([None] * len(buckets) for _ in range(at - emitted))
+                    emitted, row = at, [None] * len(buckets)
+                row[column[b]] = round(float(avg), 6)
+            yield done
+        if row is not None:
+            emitted += 1
+            yield [row]
+        yield [[None] * len(buckets) for _ in range(len(sources) - emitted)]
+
+    head = dict(meta, sources=sources, buckets=[b.isoformat() for b in buckets])
+    return json_stream_response(head, {"scores": source_rows()})
+
+
+def history_json(meta: dict, tables: dict[str, tuple]) -> dict:
+    """The row-wise JSON body of /historical from its HISTORY/SOURCE_COLUMNS rows."""
+    points = tables["data"][1]
+    body = dict(meta, data_points=len(points), data=[_point_json(p) for p in points])
+    if "source_data" in tables:
+        body["source_data"] = [_source_json(row) for row in tables["source_data"][1]]
+    return body
+
+
+def _point_json(point: tuple) -> dict:
+    computed_at, score, confidence, label, sources, low, high, last, count = point
+    return {
+        "score": score,
+        "confidence": confidence,
+        "sentiment_label": label,
+        "sources_available": sources,
+        "computed_at": computed_at.isoformat(),
+        "min": low,
+        "max": high,
+        "last": last,
+        "count": count,
+    }
+
+
+def _source_json(row: tuple) -> dict:
+    fetched_at, name, score, data_points = row
+    return {
+        "source_name": name,
+        "normalized_score": score,
+        "data_points": data_points,
+        "fetched_at": fetched_at.isoformat(),
+    }
+
+
+def _source_query(stock_id, from_time: datetime, to_time: datetime, limit: int):
+    return (
+        select(
+            SourceScore.fetched_at,
+            SourceScore.source_name,
+            SourceScore.normalized_score,
+            SourceScore.data_points,
+        )
         .filter(
-            SourceScore.stock_id == stock.id,
+            SourceScore.stock_id == stock_id,
             SourceScore.fetched_at >= from_time,
             SourceScore.fetched_at <= to_time,
         )
         .order_by(SourceScore.fetched_at)
+        .limit(limit)
     )
-    scores = source_result.scalars().all()
-
-    # Build heatmap: list of {source, time, score}
-    heatmap = [
-        {
-            "source_name": s.source_name,
-            "score": float(s.normalized_score),
-            "time": s.fetched_at.isoformat(),
-        }
-        for s in scores
-    ]
 
-    return {
-        "ticker": stock.ticker,
-        "from": from_time.isoformat(),
-        "to": to_time.isoformat(),
-        "data": heatmap,
-    }
 
+def _source_row(row) -> tuple:
+    fetched_at, name, score, data_points = row
+    return fetched_at, name, float(score), data_points
 
-def _resample_scores(scores: list, resolution: str) -> list[dict]:
-    """Resample scores to the given resolution by bucketing and averaging."""
-    if not scores:
-        return []
 
-    bucket_seconds = {
-        "15m": 900,
-        "1h": 3600,
-        "4h": 14400,
-        "1d": 86400,
-    }
-    bucket_size = bucket_seconds.get(resolution, 3600)
-
-    # If resolution is 15m, return raw data (that's our native resolution)
-    if resolution == "15m":
-        return [
-            {
-                "score": float(s.score),
-                "confidence": float(s.confidence),
-                "sentiment_label": s.sentiment_label,
-                "sources_available": s.sources_available,
-                "computed_at": s.computed_at.isoformat(),
-            }
-            for s in scores
-        ]
-
-    # Bucket and average
-    buckets: dict[int, list] = {}
-    for s in scores:
-        ts = int(s.computed_at.timestamp())
-        bucket_key = ts - (ts % bucket_size)
-        if bucket_key not in buckets:
-            buckets[bucket_key] = []
-        buckets[bucket_key].append(s)
-
-    resampled = []
-    for bucket_key in sorted(buckets.keys()):
-        items = buckets[bucket_key]
-        avg_score = sum(float(s.score) for s in items) / len(items)
-        avg_confidence = sum(float(s.confidence) for s in items) / len(items)
-        avg_sources = sum(s.sources_available for s in items) // len(items)
-
-        resampled.append({
-            "score": round(avg_score, 6),
-            "confidence": round(avg_confidence, 4),
-            "sentiment_label": items[-1].sentiment_label,
-            "sources_available": avg_sources,
-            "computed_at": datetime.fromtimestamp(bucket_key, tz=timezone.utc).isoformat(),
-        })
-
-    return resampled
+def _history_query(
+    stock_id, resolution: str, from_time: datetime, to_time: datetime, limit: int
+) -> tuple:
+    """
+    The query for /historical points and the function turning its rows into
+    HISTORY_COLUMNS tuples: pre-rolled buckets for resolutions with a
+    rollup, aggregate scores bucketed in SQL otherwise.
+    """
+    if resolution in ROLLUP_RESOLUTIONS:
+        return _rollup_query(stock_id, resolution, from_time, to_time, limit), _rollup_point
+    return _bucket_query(stock_id, resolution, from_time, to_time, limit), _bucket_point
+
+
+def _rollup_query(stock_id, resolution: str, from_time: datetime, to_time: datetime, limit: int):
+    """Pre-rolled buckets overlapping [from_time, to_time]."""
+    R = AggregateScoreRollup
+    return (
+        select(
+            R.bucket_start, R.score_sum, R.confidence_sum, R.last_label, R.sources_sum,
+            R.score_min, R.score_max, R.last_score, R.count,
+        )
+        .filter(
+            R.stock_id == stock_id,
+            R.resolution == resolution,
+            R.bucket_start >= bucket_start(from_time, ROLLUP_RESOLUTIONS[resolution]),
+            R.bucket_start <= to_time,
+        )
+        .order_by(R.bucket_start)
+        .limit(limit)
+    )
+
+
+def _rollup_point(row) -> tuple:
+    start, score_sum, confidence_sum, label, sources_sum, low, high, last, count = row
+    return (
+        start,
+        round(float(score_sum) / count, 6),
+        round(float(confidence_sum) / count, 4),
+        label,
+        sources_sum // count,
+        float(low),
+        float(high),
+        float(last),
+        count,
+    )
+
+
+def _bucket_query(stock_id, resolution: str, from_time: datetime, to_time: datetime, limit: int):
+    """Aggregate scores bucketed in SQL, for resolutions without a rollup."""
+    score = AggregateScore.score
+    bucket = time_bucket(AggregateScore.computed_at, BUCKET_SECONDS[resolution]).label("bucket")
+    newest_first = AggregateScore.computed_at.desc()
+    return (
+        select(
+            bucket,
+            func.avg(score),
+            func.avg(AggregateScore.confidence),
+            func.array_agg(aggregate_order_by(AggregateScore.sentiment_label, newest_first))[1],
+            func.avg(AggregateScore.sources_available),
+            func.min(score),
+            func.max(score),
+            func.array_agg(aggregate_order_by(score, newest_first))[1],
+            func.count(),
+        )
+        .filter(
+            AggregateScore.stock_id == stock_id,
+            AggregateScore.computed_at >= from_time,
+            AggregateScore.computed_at <= to_time,
+        )
+        .group_by(bucket)
+        .order_by(bucket)
+        .limit(limit)
+    )
+
+
+def _bucket_point(row) -> tuple:
+    b, avg_score, avg_confidence, label, avg_sources, low, high, last, count = row
+    return (
+        b,
+        round(float(avg_score), 6),
+        round(float(avg_confidence), 4),
+        label,
+        int(avg_sources),
+        float(low),
+        float(high),
+        float(last),
+        count,
+    )
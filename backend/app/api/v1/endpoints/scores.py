@@ -4,10 +4,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_stock_or_404
 from app.models.aggregate_score import AggregateScore
+from app.models.latest_aggregate_score import LatestAggregateScore
 from app.models.source_score import SourceScore
-from app.models.stock import Stock
 from app.schemas.score import (
     AggregateScoreRead,
     ScoreHistory,
@@ -15,6 +15,7 @@ from app.schemas.score import (
     ScoreSummary,
     SourceScoreRead,
 )
+from app.services.latest_scores import fetch_latest_scores
 
 router = APIRouter()
 
@@ -25,15 +26,9 @@ async def get_latest_score(
     db: AsyncSession = Depends(get_db),
 ):
     """Get the latest aggregate sentiment score for a stock."""
-    stock = await _get_stock_or_404(db, ticker)
+    stock = await get_stock_or_404(db, ticker)
 
-    result = await db.execute(
-        select(AggregateScore)
-        .filter(AggregateScore.stock_id == stock.id)
-        .order_by(desc(AggregateScore.computed_at))
-        .limit(1)
-    )
-    agg = result.scalar_one_or_none()
+    agg = await db.get(LatestAggregateScore, stock.id)
     if not agg:
         raise HTTPException(status_code=404, detail=f"No scores yet for {ticker}")
 
@@ -59,7 +54,7 @@ async def get_source_scores(
     db: AsyncSession = Depends(get_db),
 ):
     """Get the latest scores from all sources for a stock."""
-    stock = await _get_stock_or_404(db, ticker)
+    stock = await get_stock_or_404(db, ticker)
 
     # Get the most recent score from each source using a subquery
     # For simplicity, get scores from the last cycle (last 20 minutes)
@@ -95,7 +90,7 @@ async def get_score_history(
     db: AsyncSession = Depends(get_db),
 ):
     """Get historical aggregate scores for a stock."""
-    stock = await _get_stock_or_404(db, ticker)
+    stock = await get_stock_or_404(db, ticker)
 
     if from_time is None:
         from_time = datetime.now(timezone.utc) - timedelta(hours=24)
@@ -135,42 +130,18 @@ async def get_all_summaries(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a summary of the latest scores for all active stocks."""
-    result = await db.execute(
-        select(Stock).filter(Stock.is_active.is_(True)).order_by(Stock.ticker)
-    )
-    stocks = result.scalars().all()
-
-    summaries: list[ScoreSummary] = []
-    for stock in stocks:
-        agg_result = await db.execute(
-            select(AggregateScore)
-            .filter(AggregateScore.stock_id == stock.id)
-            .order_by(desc(AggregateScore.computed_at))
-            .limit(1)
+    rows = await fetch_latest_scores(db)
+
+    return [
+        ScoreSummary(
+            ticker=row.ticker,
+            company_name=row.company_name,
+            score=float(row.score) if row.score is not None else 0.0,
+            confidence=float(row.confidence) if row.confidence is not None else 0.0,
+            sentiment_label=row.sentiment_label or "neutral",
+            score_delta=float(row.score_delta) if row.score_delta else None,
+            sources_available=row.sources_available or 0,
+            computed_at=row.computed_at,
         )
-        agg = agg_result.scalar_one_or_none()
-
-        summaries.append(
-            ScoreSummary(
-                ticker=stock.ticker,
-                company_name=stock.company_name,
-                score=float(agg.score) if agg else 0.0,
-                confidence=float(agg.confidence) if agg else 0.0,
-                sentiment_label=agg.sentiment_label if agg else "neutral",
-                score_delta=float(agg.score_delta) if agg and agg.score_delta else None,
-                sources_available=agg.sources_available if agg else 0,
-                computed_at=agg.computed_at if agg else None,
-            )
-        )
-
-    return summaries
-
-
-async def _get_stock_or_404(db: AsyncSession, ticker: str) -> Stock:
-    result = await db.execute(
-        select(Stock).filter(Stock.ticker == ticker.upper())
-    )
-    stock = result.scalar_one_or_none()
-    if not stock:
-        raise HTTPException(status_code=404, detail=f"Stock {ticker} not found")
-    return stock
+        for row in rows
+    ]
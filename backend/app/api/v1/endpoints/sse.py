@@ -1,45 +1,56 @@
-import asyncio
-import json
 from typing import AsyncGenerator
 
-import redis.asyncio as aioredis
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 from sse_starlette.sse import EventSourceResponse
 
-from app.core.config import settings
+from app.services.score_hub import get_score_hub, parse_stream_id
 
 router = APIRouter()
 
 
-async def score_event_generator(tickers: list[str]) -> AsyncGenerator[dict, None]:
-    """Subscribe to Redis pub/sub and yield SSE events for requested tickers."""
-    r = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
-    pubsub = r.pubsub()
-    await pubsub.subscribe("sentiment_updates")
-
+async def score_event_generator(
+    tickers: list[str], last_event_id: str | None = None
+) -> AsyncGenerator[dict, None]:
+    """
+    Yield SSE events for the requested tickers from this process's score
+    hub, first replaying what was stored after ``last_event_id``.
+    """
+    hub = get_score_hub()
+    # Subscribe before replaying so nothing falls between the two; live
+    # events the replay already covered are skipped by id.
+    subscriber = hub.subscribe(tickers)
     try:
+        seen = None
+        if last_event_id:
+            async for event in hub.replay(subscriber.tickers, last_event_id):
+                if "id" in event:
+                    seen = parse_stream_id(event["id"])
+                yield event
+            if seen is None:
+                try:
+                    seen = parse_stream_id(last_event_id)
+                except ValueError:
+                    pass
         while True:
-            message = await pubsub.get_message(
-                ignore_subscribe_messages=True, timeout=1.0
-            )
-            if message and message["type"] == "message":
-                data = json.loads(message["data"])
-                if data.get("ticker") in tickers:
-                    yield {
-                        "event": "score_update",
-                        "data": json.dumps(data),
-                    }
-            else:
-                # Send keepalive comment every second to detect disconnects
-                await asyncio.sleep(1)
+            event = await subscriber.get()
+            if seen is not None and parse_stream_id(event["id"]) <= seen:
+                continue
+            yield event
     finally:
-        await pubsub.unsubscribe("sentiment_updates")
-        await r.close()
+        hub.unsubscribe(subscriber)
 
 
 @router.get("/sse/scores")
 async def stream_scores(
+    request: Request,
     tickers: list[str] = Query(..., description="Stock tickers to subscribe to"),
+    last_event_id: str | None = Query(
+        None, description="Resume after this event id (for clients that cannot send Last-Event-ID)"
+    ),
 ):
-    """SSE endpoint for real-time score updates."""
-    return EventSourceResponse(score_event_generator(tickers))
+    """
+    SSE endpoint for real-time score updates. Event ids are stream ids: a
+    client reconnecting with Last-Event-ID gets the updates it missed first.
+    """
+    last_event_id = request.headers.get("last-event-id") or last_event_id
+    return EventSourceResponse(score_event_generator(tickers, last_event_id))
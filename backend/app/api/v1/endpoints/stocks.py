@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_db
 from app.models.stock import Stock
 from app.schemas.stock import StockCreate, StockList, StockRead, StockUpdate
+from app.services.stock_cache import invalidate_stock_cache
 
 router = APIRouter()
 
@@ -54,6 +55,7 @@ async def create_stock(
     )
     db.add(stock)
     await db.commit()
+    await invalidate_stock_cache()
     await db.refresh(stock)
     return StockRead.model_validate(stock)
 
@@ -92,6 +94,7 @@ async def update_stock(
         setattr(stock, field, value)
 
     await db.commit()
+    await invalidate_stock_cache()
     await db.refresh(stock)
     return StockRead.model_validate(stock)
 
@@ -111,3 +114,4 @@ async def delete_stock(
 
     await db.delete(stock)
     await db.commit()
+    await invalidate_stock_cache()
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Coroutine
+
+
+class AsyncRuntime:
+    """
+    One event loop per worker process, running in a daemon thread for the
+    lifetime of the process. Celery tasks submit coroutines with run(); loop-
+    bound resources (the shared HTTP client, async Redis, asyncio locks in
+    the rate limiters) are created on this loop and stay valid across tasks.
+    """
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._started = threading.Event()
+        self._pid = os.getpid()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._start()
+        return self._loop
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _start(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_forever, name="async-runtime", daemon=True
+        )
+        self._thread.start()
+        self._started.wait()
+
+    def _run_forever(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(self._started.set)
+        self._loop.run_forever()
+
+    def run(self, coro: Coroutine, timeout: float | None = None) -> Any:
+        """
+        Run a coroutine on the runtime loop and block until it finishes. If
+        the caller is interrupted (timeout, Celery soft time limit) the
+        coroutine is cancelled instead of being left running on the loop.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Coroutine did not finish within {timeout}s")
+        except BaseException:
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = 10.0):
+        """Close the HTTP client, cancel leftover tasks and stop the loop."""
+        if not self.running:
+            return
+        from app.adapters.http_client import close_http_client
+
+        try:
+            self.run(close_http_client(), timeout=timeout)
+        except Exception:
+            pass
+        try:
+            self.run(_cancel_pending(), timeout=timeout)
+        except Exception:
+            pass
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self._loop.close()
+        self._loop = None
+        self._thread = None
+        self._started.clear()
+
+
+async def _cancel_pending():
+    current = asyncio.current_task()
+    pending = [t for t in asyncio.all_tasks() if t is not current]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+_runtime: AsyncRuntime | None = None
+
+
+def get_runtime() -> AsyncRuntime:
+    """Get or create this process's runtime (recreated after a fork)."""
+    global _runtime
+    if _runtime is None or _runtime._pid != os.getpid():
+        _runtime = AsyncRuntime()
+    return _runtime
+
+
+def run_async(coro: Coroutine, timeout: float | None = None) -> Any:
+    """Run a coroutine on the worker's shared event loop."""
+    return get_runtime().run(coro, timeout)
+
+
+def shutdown_runtime():
+    """Stop the runtime. Call on worker process shutdown."""
+    global _runtime
+    if _runtime is not None and _runtime._pid == os.getpid():
+        _runtime.shutdown()
+    _runtime = None
@@ -1,8 +1,28 @@
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
 
 from app.core.config import settings
 
+
+def _refresh_schedule_entry() -> dict:
+    """
+    Adaptive mode ticks a scheduler that refreshes only the tickers that
+    are due; otherwise every stock refreshes every REFRESH_INTERVAL_MINUTES.
+    """
+    if settings.ADAPTIVE_REFRESH_ENABLED:
+        return {
+            "task": "app.tasks.orchestrator.schedule_due_refreshes",
+            "schedule": settings.REFRESH_TICK_SECONDS,
+            "options": {"queue": "orchestrator"},
+        }
+    return {
+        "task": "app.tasks.orchestrator.run_sentiment_cycle",
+        "schedule": settings.REFRESH_INTERVAL_MINUTES * 60,
+        "options": {"queue": "orchestrator"},
+    }
+
+
 celery_app = Celery(
     "sentiment_tasks",
     broker=settings.CELERY_BROKER_URL,
@@ -18,6 +38,8 @@ celery_app.conf.update(
     task_track_started=True,
     task_acks_late=True,
     worker_prefetch_multiplier=1,
+    # Child processes warm up adapters and NLP models before accepting tasks.
+    worker_proc_alive_timeout=60,
     task_soft_time_limit=120,
     task_time_limit=180,
     task_routes={
@@ -27,11 +49,7 @@ celery_app.conf.update(
         "app.tasks.orchestrator.*": {"queue": "orchestrator"},
     },
     beat_schedule={
-        "sentiment-refresh-cycle": {
-            "task": "app.tasks.orchestrator.run_sentiment_cycle",
-            "schedule": settings.REFRESH_INTERVAL_MINUTES * 60,
-            "options": {"queue": "orchestrator"},
-        },
+        "sentiment-refresh-cycle": _refresh_schedule_entry(),
         "source-health-check": {
             "task": "app.tasks.health_check_tasks.check_all_sources",
             "schedule": crontab(minute="*/30"),
@@ -48,3 +66,25 @@ celery_app.conf.update(
 celery_app.autodiscover_tasks([
     "app.tasks",
 ])
+
+
+@worker_process_init.connect
+def _warm_up_worker_process(**kwargs):
+    """Build pooled adapters, NLP backend and scoring pool once per child."""
+    from app.tasks.warmup import warm_up_worker
+
+    warm_up_worker()
+
+
+@worker_process_shutdown.connect
+def _close_worker_resources(**kwargs):
+    """Flush buffered rows, then stop the event loop thread, scoring pool and inference batcher."""
+    from app.core.async_runtime import shutdown_runtime
+    from app.core.write_buffer import close_write_buffer
+    from app.nlp.async_scorer import close_async_scorer
+    from app.nlp.backends import close_default_backend
+
+    close_write_buffer()
+    shutdown_runtime()
+    close_async_scorer()
+    close_default_backend()
@@ -29,9 +29,72 @@ class Settings(BaseSettings):
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
 
     # Refresh cycle
-    REFRESH_INTERVAL_MINUTES: int = 15
+    REFRESH_INTERVAL_MINUTES: int = 15  # Fixed cadence when adaptive is off
+    # Per-ticker cadence from recent activity, between the min and max
+    ADAPTIVE_REFRESH_ENABLED: bool = False
+    REFRESH_MIN_INTERVAL_MINUTES: float = 5
+    REFRESH_MAX_INTERVAL_MINUTES: float = 60
+    REFRESH_TICK_SECONDS: int = 60
+    REFRESH_ACTIVITY_HISTORY: int = 12  # Aggregate scores used for volatility
     FETCH_TIMEOUT_SECONDS: int = 45
+    # Fold each source result into a running per-ticker aggregate as it
+    # lands; publish once this share of sources reported (partial score),
+    # again on every later arrival, and finally at the cycle deadline.
+    # A quorum of 0 publishes from the first source on.
+    AGGREGATION_QUORUM_ENABLED: bool = False
+    AGGREGATION_QUORUM: float = 0.6
+    AGGREGATION_STATE_TTL_SECONDS: int = 3600  # Late arrivals accepted this long
     DATA_RETENTION_DAYS: int = 90
+    # /dashboard/{ticker} payloads cached until the ticker's next score
+    DASHBOARD_CACHE_ENABLED: bool = False
+    DASHBOARD_CACHE_TTL_SECONDS: int = 900
+    DASHBOARD_CACHE_LOCK_SECONDS: float = 5.0  # Single-flight recompute wait
+    # Rows fetched per server-side cursor round trip (and written per chunk)
+    # by streamed /historical responses (stream=true)
+    HISTORY_STREAM_BATCH_ROWS: int = 1000
+    # Pending score updates held per SSE client before the oldest is dropped
+    SSE_SUBSCRIBER_QUEUE_SIZE: int = 100
+    # Score updates kept in the SSE stream for clients resuming with Last-Event-ID
+    SSE_STREAM_MAXLEN: int = 10000
+    # Ticker -> stock cache lifetime if invalidation messages are missed
+    STOCK_CACHE_MAX_AGE_SECONDS: int = 300
+    # Fetch tasks buffer SourceScore/FetchLog rows per worker and write them
+    # in multi-row INSERTs when this many are pending or the oldest is this old
+    WRITE_BUFFER_ENABLED: bool = False
+    WRITE_BUFFER_MAX_ROWS: int = 500
+    WRITE_BUFFER_MAX_AGE_SECONDS: float = 2.0
+    WRITE_BUFFER_MAX_PENDING_ROWS: int = 50000  # Kept across failed flushes
+    # Per-process stats for /health are republished this often; fields not
+    # refreshed for the TTL (processes that exited) are skipped and removed
+    PROCESS_STATS_PUBLISH_SECONDS: float = 30.0
+    PROCESS_STATS_TTL_SECONDS: float = 180.0
+    # "chord": one task per (source, ticker); "fanout": one task per source
+    # (or shard) running its tickers concurrently in a single event loop
+    FETCH_MODE: str = "chord"
+    FETCH_FANOUT_CONCURRENCY: int = 16
+    FETCH_FANOUT_SHARD_SIZE: int = 0  # 0 = all tickers in one task
+    # Spread each source's requests over the cycle by rate limit and latency
+    FETCH_PLANNER_ENABLED: bool = False
+    FETCH_PLANNER_UTILIZATION: float = 0.9  # Share of the cycle to plan into
+    FETCH_PLANNER_LATENCY_WINDOW_HOURS: int = 24
+    FETCH_PLANNER_DEFAULT_LATENCY_SECONDS: float = 1.0
+
+    # Rate limiting ("redis" for cluster-wide buckets, "local" per process)
+    RATE_LIMIT_BACKEND: str = "redis"
+    RATE_LIMIT_MAX_WAIT_SECONDS: int = 45
+    RATE_LIMIT_CONFIG_TTL_SECONDS: int = 300
+
+    # Shared HTTP client. Upstream hosts to talk HTTP/2 to (needs the
+    # optional h2 package); every other host uses HTTP/1.1.
+    HTTP2_HOSTS: list[str] = []
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+
+    # Adapter response cache ("redis", "disk" or "off"). Freshness per source
+    # comes from SourceConfig.config_json["cache_ttl_seconds"].
+    HTTP_CACHE_BACKEND: str = "redis"
+    HTTP_CACHE_DIR: str = "/tmp/sentiment-http-cache"
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 7 * 86_400
 
     # API Keys
     REDDIT_CLIENT_ID: str = ""
@@ -49,6 +112,18 @@ class Settings(BaseSettings):
 
     # NLP
     USE_FINBERT: bool = False
+    FINBERT_MODEL_PATH: str = "ProsusAI/finbert"
+    FINBERT_QUANTIZE: bool = False
+    FINBERT_MAX_LENGTH: int = 256
+    FINBERT_NUM_THREADS: int = 0
+    FINBERT_MAX_BATCH_SIZE: int = 32
+    FINBERT_MAX_WAIT_MS: float = 10.0
+    FINBERT_QUEUE_SIZE: int = 256
+    SENTIMENT_CACHE_SIZE: int = 50_000
+    SENTIMENT_CACHE_TTL_SECONDS: int = 86_400
+    SENTIMENT_CACHE_REDIS: bool = True
+    NLP_POOL_WORKERS: int = 2
+    NLP_POOL_MIN_CHUNK: int = 64
 
 
 settings = Settings()
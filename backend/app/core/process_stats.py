@@ -0,0 +1,63 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Callable
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def process_field() -> str:
+    """This process's field in the per-process stats hashes read by /health."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def stats_value(stats: dict) -> str:
+    """
+    JSON for a per-process stats field, stamped with ``updated_at`` (epoch
+    seconds). Fields of processes that exited stop being refreshed, and
+    /health drops them once PROCESS_STATS_TTL_SECONDS old.
+    """
+    return json.dumps(dict(stats, updated_at=round(time.time(), 3)))
+
+
+def is_stale(stats: dict, now: float) -> bool:
+    updated_at = stats.get("updated_at")
+    if not isinstance(updated_at, (int, float)):
+        return True
+    return now - updated_at > settings.PROCESS_STATS_TTL_SECONDS
+
+
+_publishers: list[Callable[[], None]] = []
+_thread: threading.Thread | None = None
+_thread_pid: int | None = None
+
+
+def register_stats_publisher(publish: Callable[[], None]):
+    """
+    Call ``publish`` every PROCESS_STATS_PUBLISH_SECONDS from a daemon
+    thread, so an idle process keeps its stats fields fresh.
+    """
+    global _publishers, _thread, _thread_pid
+    if _thread_pid != os.getpid():
+        # Forked: the parent's thread did not come along
+        _publishers, _thread, _thread_pid = [], None, os.getpid()
+    if publish not in _publishers:
+        _publishers.append(publish)
+    if _thread is None:
+        _thread = threading.Thread(target=_run, name="stats-heartbeat", daemon=True)
+        _thread.start()
+
+
+def _run():
+    while True:
+        time.sleep(settings.PROCESS_STATS_PUBLISH_SECONDS)
+        for publish in list(_publishers):
+            try:
+                publish()
+            except Exception:
+                logger.debug("Stats publisher %r failed", publish, exc_info=True)
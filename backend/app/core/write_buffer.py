@@ -0,0 +1,302 @@
+import logging
+import os
+import threading
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+WRITE_BUFFER_STATS_KEY = "write_buffer_stats"
+
+
+class WriteBuffer:
+    """
+    Write-behind buffer for the rows fetch tasks produce (SourceScore,
+    FetchLog). Rows are collected per worker process and written with one
+    multi-row INSERT per table in a single transaction once ``max_rows``
+    are pending or the oldest row is ``max_age_seconds`` old, instead of a
+    session and commit per row.
+
+    A daemon thread enforces the age limit between tasks; close() (worker
+    shutdown) stops it and flushes whatever is left. When a row is rejected
+    (constraint violation, bad value), the batch is retried table by table
+    and then row by row, so only the offending rows are dropped. Any other
+    failed flush keeps its rows for the next attempt, up to ``max_pending``
+    rows, beyond which the oldest are dropped and counted, as are rows the
+    final flush in close() cannot write. Fetch logs record the fetch, not
+    the write: a queued row is logged as a success even if it is dropped
+    later, so dropped rows only show in the stats /health reports.
+
+    Rows still pending when the process is killed outright (a Celery hard
+    time limit, SIGKILL, OOM) are lost: nothing runs to flush them.
+    """
+
+    def __init__(self, max_rows: int, max_age_seconds: float, max_pending: int):
+        self._max_rows = max(max_rows, 1)
+        self._max_age = max_age_seconds
+        self._max_pending = max(max_pending, self._max_rows)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._source_scores: list[dict] = []
+        self._fetch_logs: list[dict] = []
+        self._oldest: float | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+        self.stats = {
+            "flushes": 0,
+            "failed_flushes": 0,
+            "rows": 0,
+            "dropped": 0,
+            "rejected": 0,
+            "last_batch_size": 0,
+            "max_batch_size": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+    @property
+    def pending(self) -> int:
+        return len(self._source_scores) + len(self._fetch_logs)
+
+    def add_source_score(self, row: dict):
+        """Queue a SourceScore row; ``row["ticker"]`` is resolved to stock_id at flush."""
+        self._add(self._source_scores, row)
+
+    def add_fetch_log(self, row: dict):
+        self._add(self._fetch_logs, row)
+
+    def _add(self, rows: list[dict], row: dict):
+        with self._lock:
+            rows.append(row)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            full = self.pending >= self._max_rows
+        self._ensure_flusher()
+        if full:
+            self.flush()
+
+    def _ensure_flusher(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="write-buffer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        interval = max(self._max_age / 2, 0.05)
+        while not self._stop.wait(interval):
+            oldest = self._oldest
+            if oldest is not None and time.monotonic() - oldest >= self._max_age:
+                self.flush()
+
+    def flush(self) -> int:
+        """Write everything pending. Returns the number of rows written."""
+        with self._flush_lock:
+            with self._lock:
+                scores, self._source_scores = self._source_scores, []
+                logs, self._fetch_logs = self._fetch_logs, []
+                self._oldest = None
+            if not scores and not logs:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                written, rejected = _write_rows(scores, logs)
+            except Exception:
+                logger.exception("Write buffer flush of %d rows failed", len(scores) + len(logs))
+                self.stats["failed_flushes"] += 1
+                self._requeue(scores, logs)
+                return 0
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            batch = len(scores) + len(logs)
+            self.stats["flushes"] += 1
+            self.stats["rows"] += written
+            self.stats["rejected"] += rejected
+            self.stats["last_batch_size"] = batch
+            self.stats["max_batch_size"] = max(self.stats["max_batch_size"], batch)
+            self.stats["last_flush_ms"] = round(elapsed_ms, 2)
+            self.stats["max_flush_ms"] = round(max(self.stats["max_flush_ms"], elapsed_ms), 2)
+            self.stats["total_flush_ms"] = round(self.stats["total_flush_ms"] + elapsed_ms, 2)
+        if scores:
+            _invalidate_dashboards({row["ticker"] for row in scores})
+        publish_write_buffer_stats()
+        return written
+
+    def _requeue(self, scores: list[dict], logs: list[dict]):
+        with self._lock:
+            self._source_scores = scores + self._source_scores
+            self._fetch_logs = logs + self._fetch_logs
+            overflow = self.pending - self._max_pending
+            if overflow > 0:
+                # Fetch logs are the cheaper loss, so they go first.
+                dropped_logs = min(overflow, len(self._fetch_logs))
+                del self._fetch_logs[:dropped_logs]
+                del self._source_scores[:overflow - dropped_logs]
+                self.stats["dropped"] += overflow
+                logger.error("Write buffer full, dropped %d rows", overflow)
+            if self.pending and self._oldest is None:
+                self._oldest = time.monotonic()
+
+    def close(self):
+        """Stop the flusher thread and write what is left (worker shutdown)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+        with self._lock:
+            lost = self.pending
+            self._source_scores, self._fetch_logs = [], []
+        if lost:
+            self.stats["dropped"] += lost
+            logger.error("Write buffer closed with %d unwritten rows, dropped them", lost)
+
+
+def write_rows_now(scores: list[dict] = (), logs: list[dict] = ()):
+    """
+    Insert rows in one transaction without buffering (WRITE_BUFFER_ENABLED
+    off). Errors propagate to the caller, so a failed write fails its task.
+    """
+    from sqlalchemy import insert
+
+    from app.core.database import get_sync_session
+
+    with get_sync_session() as session:
+        for model, rows in _tables(session, scores, logs):
+            if rows:
+                session.execute(insert(model), rows)
+        session.commit()
+
+
+def _tables(session, scores: list[dict], logs: list[dict]) -> list[tuple]:
+    """(model, rows) to insert; source score tickers resolved to stock_id."""
+    from app.models.fetch_log import FetchLog
+    from app.models.source_score import SourceScore
+    from app.services.stock_cache import get_cached_stocks_sync
+
+    score_rows = []
+    if scores:
+        stocks = get_cached_stocks_sync(session, (row["ticker"] for row in scores))
+        score_rows = [
+            {k: v for k, v in row.items() if k != "ticker"}
+            | {"stock_id": stocks[row["ticker"]].id}
+            for row in scores
+            if row["ticker"] in stocks
+        ]
+    return [(SourceScore, score_rows), (FetchLog, list(logs))]
+
+
+def _write_rows(scores: list[dict], logs: list[dict]) -> tuple[int, int]:
+    """
+    Multi-row INSERTs for both tables in one transaction. Returns the rows
+    written and the rows rejected by the database (see _insert_isolated).
+    """
+    from sqlalchemy import insert
+    from sqlalchemy.exc import DataError, IntegrityError
+
+    from app.core.database import get_sync_session
+
+    with get_sync_session() as session:
+        tables = _tables(session, scores, logs)
+        try:
+            for model, rows in tables:
+                if rows:
+                    session.execute(insert(model), rows)
+            session.commit()
+            return sum(len(rows) for _, rows in tables), 0
+        except (DataError, IntegrityError):
+            session.rollback()
+
+        written = rejected = 0
+        for model, rows in tables:
+            ok, bad = _insert_isolated(session, model, rows)
+            written += ok
+            rejected += bad
+        session.commit()
+    return written, rejected
+
+
+def _insert_isolated(session, model, rows: list[dict]) -> tuple[int, int]:
+    """
+    Insert ``rows`` inside a savepoint, falling back to one savepoint per
+    row when that fails, and skip the rows the database rejects. Other
+    errors (connection lost, timeouts) propagate so the flush is retried.
+    """
+    from sqlalchemy import insert
+    from sqlalchemy.exc import DataError, IntegrityError
+
+    if not rows:
+        return 0, 0
+    try:
+        with session.begin_nested():
+            session.execute(insert(model), rows)
+        return len(rows), 0
+    except (DataError, IntegrityError):
+        pass
+
+    rejected = 0
+    for row in rows:
+        try:
+            with session.begin_nested():
+                session.execute(insert(model), [row])
+        except (DataError, IntegrityError) as exc:
+            rejected += 1
+            logger.error("Write buffer dropped a %s row: %s", model.__tablename__, exc.orig)
+    return len(rows) - rejected, rejected
+
+
+def _invalidate_dashboards(tickers: set[str]):
+    """
+    Cached dashboards list each ticker's latest source scores. Announcing a
+    new score invalidates them while its row may still sit here, so a
+    request in between would cache the old list; invalidate again now the
+    rows are visible.
+    """
+    if not settings.DASHBOARD_CACHE_ENABLED:
+        return
+    from app.services.dashboard_cache import invalidate_dashboard_cache
+
+    invalidate_dashboard_cache(*sorted(tickers))
+
+
+_buffer: WriteBuffer | None = None
+
+
+def get_write_buffer() -> WriteBuffer:
+    """This process's write buffer (rebuilt after fork)."""
+    global _buffer
+    if _buffer is None or _buffer._pid != os.getpid():
+        _buffer = WriteBuffer(
+            max_rows=settings.WRITE_BUFFER_MAX_ROWS,
+            max_age_seconds=settings.WRITE_BUFFER_MAX_AGE_SECONDS,
+            max_pending=settings.WRITE_BUFFER_MAX_PENDING_ROWS,
+        )
+    return _buffer
+
+
+def close_write_buffer():
+    global _buffer
+    if _buffer is not None and _buffer._pid == os.getpid():
+        _buffer.close()
+    _buffer = None
+
+
+def publish_write_buffer_stats():
+    """Store this process's flush latency and batch size stats for /health."""
+    if _buffer is None:
+        return
+    try:
+        from app.core.process_stats import process_field, stats_value
+        from app.core.redis import get_sync_redis
+
+        stats = dict(_buffer.stats, pending=_buffer.pending)
+        if stats["flushes"]:
+            stats["avg_flush_ms"] = round(stats["total_flush_ms"] / stats["flushes"], 2)
+            stats["avg_batch_size"] = round(stats["rows"] / stats["flushes"], 1)
+        get_sync_redis().hset(WRITE_BUFFER_STATS_KEY, process_field(), stats_value(stats))
+    except Exception:
+        logger.debug("Publishing write buffer stats failed", exc_info=True)
@@ -8,11 +8,13 @@ from app.api.v1.router import api_v1_router
 from app.core.config import settings
 from app.core.database import engine
 from app.core.redis import close_redis
+from app.services.score_hub import close_score_hub
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     yield
+    await close_score_hub()
     await close_http_client()
     await close_redis()
     await engine.dispose()
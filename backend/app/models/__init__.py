@@ -1,7 +1,9 @@
 """SQLAlchemy ORM models for the application."""
 from app.models.base import Base
 from app.models.aggregate_score import AggregateScore
+from app.models.aggregate_score_rollup import AggregateScoreRollup
 from app.models.fetch_log import FetchLog
+from app.models.latest_aggregate_score import LatestAggregateScore
 from app.models.source_config import SEED_SOURCES, SourceConfig
 from app.models.source_score import SourceScore
 from app.models.stock import Stock
@@ -9,7 +11,9 @@ from app.models.stock import Stock
 __all__ = [
     "Base",
     "AggregateScore",
+    "AggregateScoreRollup",
     "FetchLog",
+    "LatestAggregateScore",
     "SEED_SOURCES",
     "SourceConfig",
     "SourceScore",
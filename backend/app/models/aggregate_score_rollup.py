@@ -0,0 +1,28 @@
+"""AggregateScoreRollup model: aggregate scores pre-bucketed per resolution."""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+
+class AggregateScoreRollup(Base):
+    """
+    One time bucket of a stock's aggregate scores at a fixed resolution
+    (1h, 4h or 1d, epoch-aligned in UTC), kept up to date as scores are
+    written so /historical never buckets raw rows.
+    """
+
+    __tablename__ = "aggregate_score_rollups"
+
+    stock_id = Column(UUID(as_uuid=True), ForeignKey("stocks.id", ondelete="CASCADE"), primary_key=True)
+    resolution = Column(String(4), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    count = Column(Integer, nullable=False)
+    score_sum = Column(Numeric(14, 6), nullable=False)
+    score_min = Column(Numeric(7, 6), nullable=False)
+    score_max = Column(Numeric(7, 6), nullable=False)
+    last_score = Column(Numeric(7, 6), nullable=False)
+    last_label = Column(String(20), nullable=False)
+    last_computed_at = Column(DateTime(timezone=True), nullable=False)
+    confidence_sum = Column(Numeric(14, 4), nullable=False)
+    sources_sum = Column(Integer, nullable=False)
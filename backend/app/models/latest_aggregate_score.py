@@ -0,0 +1,32 @@
+"""LatestAggregateScore model: the newest aggregate score per stock."""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class LatestAggregateScore(Base):
+    """
+    Copy of each stock's newest AggregateScore, upserted in the same
+    transaction that writes it, so "latest" reads and previous_score
+    lookups are a primary key hit instead of a scan of aggregate_scores.
+    """
+
+    __tablename__ = "latest_aggregate_scores"
+
+    stock_id = Column(UUID(as_uuid=True), ForeignKey("stocks.id", ondelete="CASCADE"), primary_key=True)
+    aggregate_score_id = Column(
+        UUID(as_uuid=True), ForeignKey("aggregate_scores.id", ondelete="SET NULL"), nullable=True
+    )
+    score = Column(Numeric(7, 6), nullable=False)
+    confidence = Column(Numeric(5, 4), nullable=False)
+    sources_available = Column(Integer, nullable=False)
+    sources_total = Column(Integer, nullable=False, server_default="13")
+    source_breakdown = Column(JSONB, nullable=False)
+    weight_breakdown = Column(JSONB, nullable=False)
+    sentiment_label = Column(String(20), nullable=False)
+    previous_score = Column(Numeric(7, 6), nullable=True)
+    score_delta = Column(Numeric(7, 6), nullable=True)
+    computed_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
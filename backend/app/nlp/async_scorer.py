@@ -0,0 +1,163 @@
+import asyncio
+import math
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from app.core.config import settings
+from app.nlp.backends import get_default_backend
+from app.nlp.score_cache import SentimentCache, get_sentiment_cache
+from app.nlp.sentiment_analyzer import SentimentAnalyzer
+
+_worker_analyzer: SentimentAnalyzer | None = None
+_worker_cache: SentimentCache | None = None
+_worker_namespace = ""
+
+
+def _init_worker():
+    """Pool initializer: build one analyzer (lexicon + cache) per process."""
+    global _worker_analyzer, _worker_cache, _worker_namespace
+    backend = get_default_backend()
+    _worker_namespace = backend.name
+    _worker_cache = get_sentiment_cache(backend.name)
+    _worker_analyzer = SentimentAnalyzer(backend, _worker_cache)
+
+
+def _score_chunk(texts: list[str]) -> tuple[list[float], str, tuple[int, int, int]]:
+    """
+    Scores plus the cache counter increments they caused. Pool processes
+    never publish stats themselves; the parent folds the counts into its
+    own cache of the same namespace, which publish_cache_stats() reports.
+    """
+    scores = _worker_analyzer.batch_score(texts)
+    return scores, _worker_namespace, _worker_cache.take_counts()
+
+
+def _in_daemon_process() -> bool:
+    """
+    True in a daemonic process, which must not start a pool of its own:
+    multiprocessing children and Celery prefork children (billiard
+    processes, whose prefork pool already spreads scoring across cores).
+    """
+    if multiprocessing.current_process().daemon:
+        return True
+    try:
+        import billiard
+    except ImportError:
+        return False
+    return billiard.current_process().daemon
+
+
+def _merge_counts(namespace: str, counts: tuple[int, int, int]):
+    if any(counts):
+        get_sentiment_cache(namespace).add_counts(counts)
+
+
+class AsyncSentimentScorer:
+    """
+    Awaitable scoring service that keeps CPU-bound NLP off the event loop.
+
+    VADER scoring is fanned out to a process pool in chunks of at least
+    ``min_chunk`` texts, one chunk per worker at most. FinBERT (or a pool
+    size of 0, or a daemonic host process such as a Celery prefork child)
+    runs on a thread instead: the transformer backend already batches across
+    threads and releases the GIL during inference.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = settings.NLP_POOL_WORKERS,
+        min_chunk: int = settings.NLP_POOL_MIN_CHUNK,
+    ):
+        self._max_workers = max_workers
+        self._min_chunk = max(1, min_chunk)
+        self._pool: Executor | None = None
+        self._analyzer: SentimentAnalyzer | None = None
+        self._pid = os.getpid()
+
+        self._use_processes = (
+            max_workers > 0
+            and not settings.USE_FINBERT
+            and not _in_daemon_process()
+        )
+
+    async def batch_score_async(self, texts: list[str]) -> list[float]:
+        """Score texts without blocking the running event loop."""
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+
+        if not self._use_processes:
+            return await loop.run_in_executor(None, self._local_analyzer().batch_score, texts)
+
+        pool = self._get_pool()
+        chunk_count = min(self._max_workers, math.ceil(len(texts) / self._min_chunk))
+        chunk_size = math.ceil(len(texts) / chunk_count)
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _score_chunk, chunk) for chunk in chunks)
+        )
+        scores = []
+        for chunk_scores, namespace, counts in results:
+            scores.extend(chunk_scores)
+            _merge_counts(namespace, counts)
+        return scores
+
+    async def average_score_async(self, texts: list[str]) -> float:
+        """Score texts off-loop and return their average."""
+        scores = await self.batch_score_async(texts)
+        if not scores:
+            return 0.0
+        return sum(scores) / len(scores)
+
+    def warm_up(self):
+        """Start every pool process and load its analyzer ahead of the first task."""
+        if not self._use_processes:
+            self._local_analyzer().batch_score(["warm up"])
+            return
+        pool = self._get_pool()
+        futures = [pool.submit(_score_chunk, ["warm up"]) for _ in range(self._max_workers)]
+        for future in futures:
+            _, namespace, counts = future.result()
+            _merge_counts(namespace, counts)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            # spawn: the parent may hold threads (HTTP client, batcher) that
+            # must not be forked mid-operation.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return self._pool
+
+    def _local_analyzer(self) -> SentimentAnalyzer:
+        if self._analyzer is None:
+            self._analyzer = SentimentAnalyzer()
+        return self._analyzer
+
+
+_scorer: AsyncSentimentScorer | None = None
+
+
+def get_async_scorer() -> AsyncSentimentScorer:
+    """Get the process-wide async scoring service (rebuilt after fork)."""
+    global _scorer
+    if _scorer is None or _scorer._pid != os.getpid():
+        _scorer = AsyncSentimentScorer()
+    return _scorer
+
+
+def close_async_scorer():
+    """Shut down the scoring pool. Call on worker shutdown."""
+    global _scorer
+    if _scorer is not None and _scorer._pid == os.getpid():
+        _scorer.shutdown()
+        _scorer = None
@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from app.nlp.batch_engine import VaderBatchEngine
+
+
+class SentimentBackend(ABC):
+    """
+    Scoring model behind SentimentAnalyzer.
+
+    Backends receive already-preprocessed, non-empty texts and return one
+    score in [-1.0, +1.0] per text, in order. ``name`` namespaces the score
+    cache so different models never share entries.
+    """
+
+    name: str
+
+    @abstractmethod
+    def score_batch(self, texts: list[str]) -> list[float]:
+        ...
+
+    def score_one(self, text: str) -> float:
+        return self.score_batch([text])[0]
+
+    def close(self) -> None:
+        """Release background resources, if any."""
+
+
+class VaderBackend(SentimentBackend):
+    """Lexicon-based VADER compound score."""
+
+    name = "vader"
+
+    def __init__(self):
+        self._vader = SentimentIntensityAnalyzer()
+        self._engine = VaderBatchEngine(self._vader)
+
+    def score_batch(self, texts: list[str]) -> list[float]:
+        return self._engine.compound_scores(texts)
+
+    def score_one(self, text: str) -> float:
+        return self._vader.polarity_scores(text)["compound"]
+
+
+_default_backend: SentimentBackend | None = None
+
+
+def get_default_backend() -> SentimentBackend:
+    """Get the process-wide backend selected by settings.USE_FINBERT."""
+    global _default_backend
+    if _default_backend is None:
+        from app.core.config import settings
+
+        if settings.USE_FINBERT:
+            from app.nlp.finbert import FinBertBackend
+
+            _default_backend = FinBertBackend.from_settings()
+        else:
+            _default_backend = VaderBackend()
+    return _default_backend
+
+
+def close_default_backend():
+    """Stop the shared backend. Call on worker shutdown."""
+    global _default_backend
+    if _default_backend is not None:
+        _default_backend.close()
+        _default_backend = None
@@ -0,0 +1,153 @@
+import string
+
+import numpy as np
+from vaderSentiment.vaderSentiment import (
+    BOOSTER_DICT,
+    NEGATE,
+    SPECIAL_CASES,
+    SentimentIntensityAnalyzer,
+)
+
+# VADER constants mirrored here so the vectorized path reproduces the
+# reference arithmetic bit for bit.
+NORMALIZE_ALPHA = 15.0
+EXCLAMATION_INCR = 0.292
+QUESTION_INCR = 0.18
+QUESTION_CAP = 0.96
+COMPOUND_DIGITS = 4
+
+# Words that only change a score when they sit up to 3 tokens in front of a
+# lexicon word (boosters, negations, "no", "least", "so"/"this" emphasis).
+_MODIFIER_WORDS = frozenset(
+    [w for w in BOOSTER_DICT if " " not in w]
+    + list(NEGATE)
+    + ["no", "least", "so", "this"]
+)
+
+# Multi-word phrases VADER matches on token n-grams. Any occurrence sends the
+# text through the reference implementation.
+_PHRASES = tuple(
+    [w for w in BOOSTER_DICT if " " in w]
+    + [w for w in SPECIAL_CASES if " " in w]
+)
+
+_LOOKAHEAD = 3
+
+
+class VaderBatchEngine:
+    """
+    Batch scorer producing VADER compound scores for many texts at once.
+
+    Texts are tokenized in one pass, lexicon lookups are resolved against a
+    NumPy valence array, and per-text sums are accumulated in token order so
+    the result is identical to ``SentimentIntensityAnalyzer.polarity_scores``.
+    Texts that trigger one of VADER's contextual rules (negation, boosters,
+    "but", ALL CAPS emphasis, idioms, emoji) fall back to the reference
+    implementation.
+    """
+
+    def __init__(self, vader: SentimentIntensityAnalyzer):
+        self._vader = vader
+
+        words = list(vader.lexicon)
+        self._vocab: dict[str, int] = {w: i for i, w in enumerate(words)}
+        # Boosters never contribute their own lexicon valence.
+        self._valences = np.array(
+            [0.0 if w in BOOSTER_DICT else vader.lexicon[w] for w in words],
+            dtype=np.float64,
+        )
+
+        # VADER only translates emojis one character at a time, and none of
+        # them are ASCII, so pure-ASCII texts can skip the check entirely.
+        self._emoji_chars = frozenset(e for e in vader.emojis if len(e) == 1)
+
+    def compound_scores(self, texts: list[str]) -> list[float]:
+        """
+        Return the VADER compound score for each already-preprocessed text.
+        Empty strings score 0.0.
+        """
+        n = len(texts)
+        if n == 0:
+            return []
+
+        tokens_per_text = [t.split() for t in texts]
+        lengths = np.fromiter((len(t) for t in tokens_per_text), dtype=np.int64, count=n)
+        total = int(lengths.sum())
+
+        tokens = [_strip_punc_if_word(tok) for toks in tokens_per_text for tok in toks]
+        lowered = [tok.lower() for tok in tokens]
+        text_ids = np.repeat(np.arange(n), lengths)
+
+        lex_idx = np.fromiter(
+            (self._vocab.get(w, -1) for w in lowered), dtype=np.int64, count=total
+        )
+        in_lexicon = lex_idx >= 0
+        token_valence = np.where(in_lexicon, self._valences[lex_idx], 0.0)
+
+        is_upper = np.fromiter((tok.isupper() for tok in tokens), dtype=bool, count=total)
+        is_modifier = np.fromiter(
+            (w in _MODIFIER_WORDS or "n't" in w for w in lowered), dtype=bool, count=total
+        )
+        is_but = np.fromiter((w == "but" for w in lowered), dtype=bool, count=total)
+
+        # A modifier matters only if a lexicon word follows within 3 tokens
+        # of the same text.
+        lexicon_ahead = np.zeros(total, dtype=bool)
+        for k in range(1, _LOOKAHEAD + 1):
+            if k >= total:
+                break
+            same_text = text_ids[k:] == text_ids[:-k]
+            lexicon_ahead[:-k] |= in_lexicon[k:] & same_text
+
+        upper_count = np.bincount(text_ids, weights=is_upper, minlength=n)
+        cap_diff = (upper_count > 0) & (upper_count < lengths)
+
+        needs_rules = (
+            np.bincount(text_ids, weights=is_modifier & lexicon_ahead, minlength=n) > 0
+        )
+        needs_rules |= np.bincount(text_ids, weights=is_but, minlength=n) > 0
+        needs_rules |= cap_diff & (
+            np.bincount(text_ids, weights=is_upper & in_lexicon, minlength=n) > 0
+        )
+
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        for i in range(n):
+            if needs_rules[i]:
+                continue
+            text = texts[i]
+            if not text.isascii() and not self._emoji_chars.isdisjoint(text):
+                needs_rules[i] = True
+                continue
+            joined = " ".join(lowered[offsets[i]:offsets[i + 1]])
+            if any(p in joined for p in _PHRASES):
+                needs_rules[i] = True
+
+        # bincount adds weights in input order, matching Python's sum().
+        sums = np.bincount(text_ids, weights=token_valence, minlength=n)
+
+        ep = np.minimum(
+            np.fromiter((t.count("!") for t in texts), dtype=np.int64, count=n), 4
+        )
+        qm = np.fromiter((t.count("?") for t in texts), dtype=np.int64, count=n)
+        amplifier = ep * EXCLAMATION_INCR + np.where(
+            qm > 1, np.where(qm <= 3, qm * QUESTION_INCR, QUESTION_CAP), 0.0
+        )
+        sums = np.where(sums > 0, sums + amplifier, np.where(sums < 0, sums - amplifier, sums))
+
+        compound = np.clip(sums / np.sqrt(sums * sums + NORMALIZE_ALPHA), -1.0, 1.0)
+
+        # VADER reports the compound score rounded to 4 places.
+        results = [round(c, COMPOUND_DIGITS) for c in compound.tolist()]
+        for i in np.flatnonzero(needs_rules):
+            results[i] = self._vader.polarity_scores(texts[i])["compound"]
+        for i in np.flatnonzero(lengths == 0):
+            results[i] = 0.0
+        return results
+
+
+def _strip_punc_if_word(token: str) -> str:
+    """Same token cleanup as VADER's SentiText: keep short emoticons intact."""
+    stripped = token.strip(string.punctuation)
+    if len(stripped) <= 2:
+        return token
+    return stripped
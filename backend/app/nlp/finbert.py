@@ -0,0 +1,276 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable
+
+from app.nlp.backends import SentimentBackend
+
+
+class BackendOverloadedError(RuntimeError):
+    """Raised when the inference request queue stays full past the timeout."""
+
+
+class BackendClosedError(RuntimeError):
+    """Raised for requests made to, or left pending in, a closed batcher."""
+
+
+@dataclass
+class _Request:
+    texts: list[str]
+    future: Future = field(default_factory=Future)
+
+
+class MicroBatcher:
+    """
+    Coalesces scoring requests from concurrent callers into model batches.
+
+    A single daemon thread drains a bounded queue: it blocks for the first
+    request, then keeps collecting until ``max_batch_size`` texts are pending
+    or ``max_wait_ms`` has elapsed, runs ``infer`` once and resolves every
+    caller's future with its own slice of the output.
+    """
+
+    def __init__(
+        self,
+        infer: Callable[[list[str]], list[float]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+        queue_size: int = 256,
+        submit_timeout: float = 30.0,
+    ):
+        self._infer = infer
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000.0
+        self._submit_timeout = submit_timeout
+        self._queue: queue.Queue[_Request | None] = queue.Queue(maxsize=queue_size)
+        self._carry: _Request | None = None
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="finbert-batcher", daemon=True)
+        self._thread.start()
+
+        self.batches_run = 0
+        self.texts_scored = 0
+
+    def submit(self, texts: list[str]) -> Future:
+        """Enqueue texts for scoring; the future resolves to list[float]."""
+        if self._closed.is_set():
+            raise BackendClosedError("Inference backend is closed")
+        request = _Request(texts)
+        try:
+            self._queue.put(request, timeout=self._submit_timeout)
+        except queue.Full:
+            raise BackendOverloadedError(
+                f"Inference queue full ({self._queue.maxsize} requests pending)"
+            )
+        return request.future
+
+    def score(self, texts: list[str]) -> list[float]:
+        """Blocking helper around submit()."""
+        return self.submit(texts).result()
+
+    def close(self, timeout: float = 5.0):
+        """
+        Stop the worker after the batch it is running. Requests it did not
+        get to fail with BackendClosedError instead of waiting forever.
+        """
+        self._closed.set()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass  # The worker is busy and checks _closed between batches
+        self._thread.join(timeout=timeout)
+
+        # The carried request belongs to the worker until it has exited
+        pending = [] if self._thread.is_alive() else [self._carry]
+        while True:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        for request in pending:
+            if request is not None and not request.future.done():
+                request.future.set_exception(BackendClosedError("Inference backend closed"))
+
+    def _run(self):
+        while True:
+            first = self._carry or self._queue.get()
+            self._carry = None
+            if first is None:
+                return
+
+            batch = [first]
+            pending = len(first.texts)
+            deadline = time.monotonic() + self._max_wait
+            stop = False
+            while pending < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                if pending + len(nxt.texts) > self._max_batch_size:
+                    # Keep batches bounded; this request opens the next one.
+                    self._carry = nxt
+                    break
+                batch.append(nxt)
+                pending += len(nxt.texts)
+
+            self._execute(batch)
+            if stop or self._closed.is_set():
+                return
+
+    def _execute(self, batch: list[_Request]):
+        texts = [t for req in batch for t in req.texts]
+        try:
+            scores: list[float] = []
+            for start in range(0, len(texts), self._max_batch_size):
+                scores.extend(self._infer(texts[start:start + self._max_batch_size]))
+        except Exception as exc:
+            for req in batch:
+                req.future.set_exception(exc)
+            return
+
+        self.batches_run += 1
+        self.texts_scored += len(texts)
+        offset = 0
+        for req in batch:
+            req.future.set_result(scores[offset:offset + len(req.texts)])
+            offset += len(req.texts)
+
+
+class FinBertBackend(SentimentBackend):
+    """
+    Finance-tuned transformer classifier (FinBERT-style) on CPU.
+
+    Score is P(positive) - P(negative). Weights load from ``model_path`` (a
+    local directory or hub id). If the directory contains ``model.onnx`` it
+    is run through onnxruntime; otherwise PyTorch is used, optionally with
+    int8 dynamic quantization of the Linear layers. Requires the packages
+    in requirements-finbert.txt.
+    """
+
+    name = "finbert"
+
+    def __init__(
+        self,
+        model_path: str,
+        quantize: bool = False,
+        max_length: int = 256,
+        num_threads: int = 0,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+        queue_size: int = 256,
+    ):
+        from transformers import AutoTokenizer
+
+        self._max_length = max_length
+        self._tokenizer = AutoTokenizer.from_pretrained(model_path)
+
+        onnx_file = os.path.join(model_path, "model.onnx")
+        if os.path.isfile(onnx_file):
+            self._infer_logits = self._load_onnx(onnx_file, num_threads)
+            labels = self._read_labels(model_path)
+        else:
+            self._infer_logits, labels = self._load_torch(model_path, quantize, num_threads)
+
+        self._pos_idx = labels.index("positive")
+        self._neg_idx = labels.index("negative")
+        self._batcher = MicroBatcher(
+            self._infer,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            queue_size=queue_size,
+        )
+
+    @classmethod
+    def from_settings(cls) -> "FinBertBackend":
+        from app.core.config import settings
+
+        return cls(
+            model_path=settings.FINBERT_MODEL_PATH,
+            quantize=settings.FINBERT_QUANTIZE,
+            max_length=settings.FINBERT_MAX_LENGTH,
+            num_threads=settings.FINBERT_NUM_THREADS,
+            max_batch_size=settings.FINBERT_MAX_BATCH_SIZE,
+            max_wait_ms=settings.FINBERT_MAX_WAIT_MS,
+            queue_size=settings.FINBERT_QUEUE_SIZE,
+        )
+
+    def score_batch(self, texts: list[str]) -> list[float]:
+        return self._batcher.score(texts)
+
+    def close(self) -> None:
+        self._batcher.close()
+
+    def _infer(self, texts: list[str]) -> list[float]:
+        import numpy as np
+
+        encoded = self._tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self._max_length,
+            return_tensors="np",
+        )
+        logits = self._infer_logits(encoded)
+        logits = logits - logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=1, keepdims=True)
+        scores = np.clip(probs[:, self._pos_idx] - probs[:, self._neg_idx], -1.0, 1.0)
+        return [round(s, 4) for s in scores.tolist()]
+
+    @staticmethod
+    def _load_torch(model_path: str, quantize: bool, num_threads: int):
+        import torch
+        from transformers import AutoModelForSequenceClassification
+
+        if num_threads:
+            torch.set_num_threads(num_threads)
+
+        model = AutoModelForSequenceClassification.from_pretrained(model_path)
+        model.to("cpu").eval()
+        if quantize:
+            model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+
+        def infer_logits(encoded):
+            inputs = {k: torch.from_numpy(v) for k, v in encoded.items()}
+            with torch.inference_mode():
+                return model(**inputs).logits.numpy()
+
+        labels = [model.config.id2label[i].lower() for i in range(model.config.num_labels)]
+        return infer_logits, labels
+
+    @staticmethod
+    def _load_onnx(onnx_file: str, num_threads: int):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        session = ort.InferenceSession(
+            onnx_file, options, providers=["CPUExecutionProvider"]
+        )
+        input_names = {i.name for i in session.get_inputs()}
+
+        def infer_logits(encoded):
+            feed = {k: v.astype("int64") for k, v in encoded.items() if k in input_names}
+            return session.run(None, feed)[0]
+
+        return infer_logits
+
+    @staticmethod
+    def _read_labels(model_path: str) -> list[str]:
+        from transformers import AutoConfig
+
+        config = AutoConfig.from_pretrained(model_path)
+        return [config.id2label[i].lower() for i in range(config.num_labels)]
@@ -0,0 +1,202 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from app.core.config import settings
+
+STATS_KEY = "sentiment_cache:stats"
+
+
+class SentimentCache:
+    """
+    Two-tier memoization for sentiment scores keyed by a hash of the
+    preprocessed text.
+
+    Tier 1 is a bounded in-process LRU. Tier 2 is a shared Redis keyspace
+    with a TTL so every worker benefits from texts already scored elsewhere.
+    Redis errors are treated as misses; the cache never fails a scoring call.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int = settings.SENTIMENT_CACHE_SIZE,
+        ttl_seconds: int = settings.SENTIMENT_CACHE_TTL_SECONDS,
+        use_redis: bool = settings.SENTIMENT_CACHE_REDIS,
+    ):
+        self._namespace = namespace
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._use_redis = use_redis
+        self._local: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self._published = (0, 0, 0)
+        self._taken = (0, 0, 0)
+
+    def get_many(self, texts: list[str]) -> dict[str, float]:
+        """Return cached scores for whichever of the given texts are known."""
+        found: dict[str, float] = {}
+        pending: dict[str, str] = {}
+
+        with self._lock:
+            for text in texts:
+                if text in found or text in pending:
+                    continue
+                digest = self._digest(text)
+                if digest in self._local:
+                    self._local.move_to_end(digest)
+                    found[text] = self._local[digest]
+                    self.local_hits += 1
+                else:
+                    pending[text] = digest
+
+        remote_hits = 0
+        if pending and self._use_redis:
+            remote = self._redis_get([self._redis_key(d) for d in pending.values()])
+            with self._lock:
+                for (text, digest), value in zip(pending.items(), remote):
+                    if value is None:
+                        continue
+                    score = float(value)
+                    found[text] = score
+                    self._remember(digest, score)
+                    remote_hits += 1
+
+        with self._lock:
+            self.redis_hits += remote_hits
+            self.misses += len(pending) - remote_hits
+        return found
+
+    def set_many(self, scores: dict[str, float]) -> None:
+        """Store freshly computed scores in both tiers."""
+        if not scores:
+            return
+        digests = {text: self._digest(text) for text in scores}
+        with self._lock:
+            for text, score in scores.items():
+                self._remember(digests[text], score)
+
+        if self._use_redis:
+            self._redis_set({
+                self._redis_key(digests[text]): repr(score)
+                for text, score in scores.items()
+            })
+
+    def get(self, text: str) -> float | None:
+        return self.get_many([text]).get(text)
+
+    def set(self, text: str, score: float) -> None:
+        self.set_many({text: score})
+
+    def stats(self) -> dict[str, int | float]:
+        """Hit/miss counters for this process."""
+        with self._lock:
+            lookups = self.local_hits + self.redis_hits + self.misses
+            return {
+                "namespace": self._namespace,
+                "size": len(self._local),
+                "max_entries": self._max_entries,
+                "local_hits": self.local_hits,
+                "redis_hits": self.redis_hits,
+                "misses": self.misses,
+                "hit_ratio": round((lookups - self.misses) / lookups, 4) if lookups else 0.0,
+            }
+
+    def publish_stats(self) -> None:
+        """Add counter deltas since the last publish to the shared Redis hash."""
+        with self._lock:
+            current = (self.local_hits, self.redis_hits, self.misses)
+            deltas = [now - before for now, before in zip(current, self._published)]
+            self._published = current
+        if not any(deltas) or not self._use_redis:
+            return
+        try:
+            from app.core.redis import get_sync_redis
+
+            pipe = get_sync_redis().pipeline(transaction=False)
+            for field, delta in zip(("local_hits", "redis_hits", "misses"), deltas):
+                if delta:
+                    pipe.hincrby(STATS_KEY, f"{self._namespace}:{field}", delta)
+            pipe.execute()
+        except Exception:
+            pass
+
+    def take_counts(self) -> tuple[int, int, int]:
+        """
+        Hit/miss counter increments since the last call, for a scoring pool
+        process to hand to its parent (see add_counts()).
+        """
+        with self._lock:
+            current = (self.local_hits, self.redis_hits, self.misses)
+            counts = tuple(now - before for now, before in zip(current, self._taken))
+            self._taken = current
+        return counts
+
+    def add_counts(self, counts: tuple[int, int, int]) -> None:
+        """Fold a pool process's take_counts() into this cache's counters."""
+        local_hits, redis_hits, misses = counts
+        with self._lock:
+            self.local_hits += local_hits
+            self.redis_hits += redis_hits
+            self.misses += misses
+
+    def clear(self) -> None:
+        """Drop the local tier (the Redis tier expires on its own)."""
+        with self._lock:
+            self._local.clear()
+
+    def _remember(self, digest: str, score: float) -> None:
+        self._local[digest] = score
+        self._local.move_to_end(digest)
+        while len(self._local) > self._max_entries:
+            self._local.popitem(last=False)
+
+    def _redis_key(self, digest: str) -> str:
+        return f"sentiment:{self._namespace}:{digest}"
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _redis_get(self, keys: list[str]) -> list[str | None]:
+        try:
+            from app.core.redis import get_sync_redis
+
+            return get_sync_redis().mget(keys)
+        except Exception:
+            return [None] * len(keys)
+
+    def _redis_set(self, mapping: dict[str, str]) -> None:
+        try:
+            from app.core.redis import get_sync_redis
+
+            pipe = get_sync_redis().pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=self._ttl)
+            pipe.execute()
+        except Exception:
+            pass
+
+
+_caches: dict[str, SentimentCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_sentiment_cache(namespace: str) -> SentimentCache:
+    """Get the process-wide cache for a scoring backend namespace."""
+    with _caches_lock:
+        if namespace not in _caches:
+            _caches[namespace] = SentimentCache(namespace)
+        return _caches[namespace]
+
+
+def publish_cache_stats() -> None:
+    """Push hit/miss counters of every cache in this process to Redis."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.publish_stats()
@@ -1,27 +1,54 @@
 import re
 
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from app.nlp.backends import SentimentBackend, get_default_backend
+from app.nlp.score_cache import SentimentCache, get_sentiment_cache
+
+_URL_PATTERN = re.compile(r"https?://\S+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
 
 
 class SentimentAnalyzer:
     """
-    Wraps VADER sentiment analyzer for scoring financial text.
-    Returns compound score in range [-1.0, +1.0].
+    Scores financial text with a pluggable backend (VADER by default,
+    FinBERT when settings.USE_FINBERT is on).
+    Returns score in range [-1.0, +1.0].
+
+    Scores are memoized by preprocessed text through a shared SentimentCache,
+    so texts seen in earlier cycles (or by other workers) are not rescored.
     """
 
-    def __init__(self):
-        self._vader = SentimentIntensityAnalyzer()
+    def __init__(
+        self,
+        backend: SentimentBackend | None = None,
+        cache: SentimentCache | None = None,
+    ):
+        self._backend = backend or get_default_backend()
+        self._cache = cache or get_sentiment_cache(self._backend.name)
 
     def score(self, text: str) -> float:
         """Score a single text. Returns [-1.0, +1.0]."""
         cleaned = self._preprocess(text)
         if not cleaned:
             return 0.0
-        return self._vader.polarity_scores(cleaned)["compound"]
+        cached = self._cache.get(cleaned)
+        if cached is not None:
+            return cached
+        result = self._backend.score_one(cleaned)
+        self._cache.set(cleaned, result)
+        return result
 
     def batch_score(self, texts: list[str]) -> list[float]:
         """Score multiple texts. Returns list of [-1.0, +1.0] values."""
-        return [self.score(t) for t in texts]
+        cleaned = [self._preprocess(t) for t in texts]
+        known = self._cache.get_many([c for c in cleaned if c])
+
+        missing = list(dict.fromkeys(c for c in cleaned if c and c not in known))
+        if missing:
+            fresh = dict(zip(missing, self._backend.score_batch(missing)))
+            self._cache.set_many(fresh)
+            known.update(fresh)
+
+        return [known[c] if c else 0.0 for c in cleaned]
 
     def average_score(self, texts: list[str]) -> float:
         """Score multiple texts and return their average."""
@@ -30,13 +57,16 @@ class SentimentAnalyzer:
             return 0.0
         return sum(scores) / len(scores)
 
+    def cache_stats(self) -> dict[str, int | float]:
+        return self._cache.stats()
+
     @staticmethod
     def _preprocess(text: str) -> str:
         """Basic text cleaning for sentiment analysis."""
         if not text:
             return ""
         # Remove URLs
-        text = re.sub(r"https?://\S+", "", text)
+        text = _URL_PATTERN.sub("", text)
         # Remove excessive whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WHITESPACE_PATTERN.sub(" ", text).strip()
         return text
@@ -0,0 +1,179 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "dashboard:{ticker}"  # Hash: hours -> serialized payload
+VERSION_KEY = "dashboard:{ticker}:version"  # Bumped by every invalidation
+STATS_KEY = "dashboard_cache:stats"
+STATS_PUBLISH_SECONDS = 10
+
+# Store a payload only if no invalidation happened since it was computed.
+_STORE_LUA = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+  return 0
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+_RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class DashboardCache:
+    """
+    Read-through cache of serialized /dashboard/{ticker} payloads, one Redis
+    hash per ticker with a field per ``hours`` window.
+
+    Aggregation invalidates a ticker when it announces a new score
+    (invalidate_dashboard_cache()), so entries live until the data changes;
+    ``ttl_seconds`` only bounds how stale a trend window can get.
+
+    Misses are single-flight: concurrent requests in this process share one
+    computation, and across processes a short Redis lock lets one process
+    compute while the others wait for its result (computing themselves if
+    it has not appeared within ``lock_seconds``). A payload computed while
+    an invalidation happened is not stored.
+    """
+
+    def __init__(self, ttl_seconds: int, lock_seconds: float):
+        self._ttl = ttl_seconds
+        self._lock_seconds = lock_seconds
+        self._inflight: dict[tuple[str, int], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._published = (0, 0, 0)
+        self._published_at = time.monotonic()
+
+    async def get_or_compute(
+        self, ticker: str, hours: int, compute: Callable[[], Awaitable[dict]]
+    ) -> str:
+        """The serialized payload for (ticker, hours), computing it on a miss."""
+        from app.core.redis import get_redis
+
+        try:
+            r = await get_redis()
+            cached = await r.hget(CACHE_KEY.format(ticker=ticker), hours)
+        except Exception:
+            return json.dumps(await compute())
+        if cached is not None:
+            self.hits += 1
+            await self._maybe_publish_stats(r)
+            return cached
+
+        flight = (ticker, hours)
+        if flight in self._inflight:
+            self.coalesced += 1
+            return await asyncio.shield(self._inflight[flight])
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight] = future
+        try:
+            payload = await self._fill(r, ticker, hours, compute)
+            future.set_result(payload)
+            return payload
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # Waiters re-raise it; do not log it as unretrieved
+            raise
+        finally:
+            del self._inflight[flight]
+            await self._maybe_publish_stats(r)
+
+    async def _fill(self, r, ticker: str, hours: int, compute) -> str:
+        key = CACHE_KEY.format(ticker=ticker)
+        lock_key = f"{key}:{hours}:lock"
+        token = uuid.uuid4().hex
+        try:
+            version = await r.get(VERSION_KEY.format(ticker=ticker)) or "0"
+            owner = await r.set(lock_key, token, nx=True, px=int(self._lock_seconds * 1000))
+        except Exception:
+            self.misses += 1
+            return json.dumps(await compute())
+
+        if not owner:
+            deadline = time.monotonic() + self._lock_seconds
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                cached = await r.hget(key, hours)
+                if cached is not None:
+                    self.coalesced += 1
+                    return cached
+
+        self.misses += 1
+        payload = json.dumps(await compute())
+        try:
+            await r.eval(
+                _STORE_LUA, 2, key, VERSION_KEY.format(ticker=ticker),
+                version, hours, payload, self._ttl,
+            )
+            if owner:
+                await r.eval(_RELEASE_LUA, 1, lock_key, token)
+        except Exception:
+            logger.warning("Could not store dashboard payload for %s", ticker)
+        return payload
+
+    async def _maybe_publish_stats(self, r):
+        """Add counter deltas to the shared hash every STATS_PUBLISH_SECONDS."""
+        if time.monotonic() - self._published_at < STATS_PUBLISH_SECONDS:
+            return
+        current = (self.hits, self.misses, self.coalesced)
+        deltas = [now - before for now, before in zip(current, self._published)]
+        self._published = current
+        self._published_at = time.monotonic()
+        if not any(deltas):
+            return
+        try:
+            pipe = r.pipeline(transaction=False)
+            for field, delta in zip(("hits", "misses", "coalesced"), deltas):
+                if delta:
+                    pipe.hincrby(STATS_KEY, field, delta)
+            await pipe.execute()
+        except Exception:
+            pass
+
+
+_cache: DashboardCache | None = None
+
+
+def get_dashboard_cache() -> DashboardCache:
+    global _cache
+    if _cache is None:
+        _cache = DashboardCache(
+            ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS,
+            lock_seconds=settings.DASHBOARD_CACHE_LOCK_SECONDS,
+        )
+    return _cache
+
+
+def invalidate_dashboard_cache(*tickers: str):
+    """
+    Drop every cached window of the tickers (called from the Celery side:
+    when a score is announced, and after the write buffer has stored new
+    source scores, so no payload is cached without them).
+    """
+    from app.core.redis import get_sync_redis
+
+    if not tickers:
+        return
+    try:
+        pipe = get_sync_redis().pipeline()
+        for ticker in tickers:
+            pipe.incr(VERSION_KEY.format(ticker=ticker))
+            pipe.delete(CACHE_KEY.format(ticker=ticker))
+        pipe.execute()
+    except Exception:
+        pass
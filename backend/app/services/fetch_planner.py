@@ -0,0 +1,206 @@
+import json
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+CURSORS_KEY = "fetch_planner:cursors"
+LAST_PLAN_KEY = "fetch_planner:last_plan"
+
+
+@dataclass
+class SourceLimits:
+    """What the planner knows about one source going into a cycle."""
+
+    source_name: str
+    rpm: int
+    burst: int  # Requests the token bucket allows back to back
+    latency_seconds: float  # Observed upstream latency (p90)
+
+
+@dataclass
+class SourcePlan:
+    """One source's share of a cycle."""
+
+    source_name: str
+    tickers: list[str]
+    requests: int
+    offsets: list[float]  # Seconds after cycle start each request may go out
+    latency_seconds: float
+    predicted_seconds: float
+    coverage: float  # Fraction of active tickers fetched this cycle
+    cycles_for_full_coverage: int
+
+    def request_offset(self, index: int) -> float:
+        return self.offsets[index] if index < len(self.offsets) else 0.0
+
+
+@dataclass
+class CyclePlan:
+    started_at: datetime
+    sources: dict[str, SourcePlan] = field(default_factory=dict)
+    cursors: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def predicted_seconds(self) -> float:
+        return max((p.predicted_seconds for p in self.sources.values()), default=0.0)
+
+    @property
+    def predicted_completion_at(self) -> datetime:
+        return self.started_at + timedelta(seconds=self.predicted_seconds)
+
+    @property
+    def tickers(self) -> list[str]:
+        seen = dict.fromkeys(t for p in self.sources.values() for t in p.tickers)
+        return list(seen)
+
+    def summary(self) -> dict:
+        return {
+            "started_at": self.started_at.isoformat(),
+            "predicted_seconds": round(self.predicted_seconds, 1),
+            "predicted_completion_at": self.predicted_completion_at.isoformat(),
+            "sources": {
+                name: {
+                    "tickers": len(p.tickers),
+                    "requests": p.requests,
+                    "latency_seconds": round(p.latency_seconds, 3),
+                    "predicted_seconds": round(p.predicted_seconds, 1),
+                    "coverage": round(p.coverage, 4),
+                    "cycles_for_full_coverage": p.cycles_for_full_coverage,
+                }
+                for name, p in self.sources.items()
+            },
+        }
+
+
+class FetchPlanner:
+    """
+    Builds a per-source timeline for one refresh cycle.
+
+    A source's request budget for the cycle is what its token bucket can
+    grant inside the usable window (``burst`` immediately, then one request
+    every 60/rpm seconds) and what ``concurrency`` in-flight requests can
+    complete at the observed latency. Sources whose budget covers every
+    ticker are saturated; slower sources take the next slice of tickers from
+    a round-robin cursor so every ticker is covered over successive cycles.
+
+    Each request gets an offset (its earliest slot under the rate limit) so
+    tasks can be scheduled instead of blocking a worker on the limiter.
+    """
+
+    def __init__(self, cycle_seconds: float, utilization: float, concurrency: int):
+        self._window = cycle_seconds * utilization
+        self._concurrency = max(concurrency, 1)
+
+    def plan(
+        self,
+        tickers: list[str],
+        sources: list[SourceLimits],
+        cursors: dict[str, int],
+        started_at: datetime | None = None,
+    ) -> CyclePlan:
+        plan = CyclePlan(started_at=started_at or datetime.now(timezone.utc))
+        if not tickers:
+            return plan
+
+        for source in sources:
+            cursor = cursors.get(source.source_name, 0) % len(tickers)
+            source_plan, next_cursor = self._plan_source(source, tickers, cursor)
+            plan.sources[source.source_name] = source_plan
+            plan.cursors[source.source_name] = next_cursor
+        return plan
+
+    def _plan_source(
+        self, source: SourceLimits, tickers: list[str], cursor: int
+    ) -> tuple[SourcePlan, int]:
+        budget = self._request_budget(source)
+
+        if budget >= len(tickers):
+            selected, next_cursor = list(tickers), cursor
+        else:
+            rotated = tickers[cursor:] + tickers[:cursor]
+            selected = rotated[:budget]
+            next_cursor = (cursor + budget) % len(tickers)
+
+        requests = len(selected)
+        offsets = [self._offset(source, i) for i in range(requests)]
+        predicted = max(
+            (offsets[-1] if offsets else 0.0) + source.latency_seconds,
+            math.ceil(requests / self._concurrency) * source.latency_seconds,
+        )
+
+        coverage = len(selected) / len(tickers)
+        return SourcePlan(
+            source_name=source.source_name,
+            tickers=selected,
+            requests=requests,
+            offsets=offsets,
+            latency_seconds=source.latency_seconds,
+            predicted_seconds=predicted,
+            coverage=coverage,
+            cycles_for_full_coverage=math.ceil(1 / coverage) if coverage else 0,
+        ), next_cursor
+
+    def _request_budget(self, source: SourceLimits) -> int:
+        if source.rpm <= 0:
+            return 0
+        latency = max(source.latency_seconds, 0.001)
+        paced = source.burst + int(max(self._window - latency, 0) * source.rpm / 60.0)
+        in_flight = self._concurrency * max(int(self._window / latency), 1)
+        return max(min(paced, in_flight), 1)
+
+    @staticmethod
+    def _offset(source: SourceLimits, index: int) -> float:
+        if index < source.burst or source.rpm <= 0:
+            return 0.0
+        return (index - source.burst + 1) * 60.0 / source.rpm
+
+
+def load_observed_latencies(session, window_hours: int) -> dict[str, float]:
+    """
+    p90 upstream latency per source from recent fetch_logs, in seconds.
+    Time spent waiting on the rate limiter is not latency and is subtracted.
+    """
+    from sqlalchemy import Integer, func
+
+    from app.models.fetch_log import FetchLog
+
+    since = datetime.now(timezone.utc) - timedelta(hours=window_hours)
+    waited = func.coalesce(FetchLog.response_meta["rate_limit_wait_ms"].astext.cast(Integer), 0)
+    rows = (
+        session.query(
+            FetchLog.source_name,
+            func.percentile_cont(0.9).within_group(FetchLog.duration_ms - waited),
+        )
+        .filter(
+            FetchLog.started_at >= since,
+            FetchLog.status.in_(("success", "no_data")),
+            FetchLog.duration_ms.isnot(None),
+        )
+        .group_by(FetchLog.source_name)
+        .all()
+    )
+    return {name: max(float(ms), 0.0) / 1000 for name, ms in rows if ms is not None}
+
+
+def load_cursors() -> dict[str, int]:
+    try:
+        from app.core.redis import get_sync_redis
+
+        raw = get_sync_redis().hgetall(CURSORS_KEY)
+    except Exception:
+        return {}
+    return {name: int(value) for name, value in raw.items()}
+
+
+def save_plan(plan: CyclePlan, cycle_id: str):
+    """Persist round-robin cursors and the cycle's summary for /health."""
+    try:
+        from app.core.redis import get_sync_redis
+
+        pipe = get_sync_redis().pipeline()
+        if plan.cursors:
+            pipe.hset(CURSORS_KEY, mapping=plan.cursors)
+        pipe.set(LAST_PLAN_KEY, json.dumps({"cycle_id": cycle_id, **plan.summary()}))
+        pipe.execute()
+    except Exception:
+        pass
@@ -0,0 +1,70 @@
+from sqlalchemy import Select, select, true
+
+from app.models.aggregate_score import AggregateScore
+from app.models.latest_aggregate_score import LatestAggregateScore
+from app.models.stock import Stock
+
+# Columns every "latest score per stock" read returns, in this order.
+LATEST_SCORE_FIELDS = (
+    "score",
+    "confidence",
+    "sentiment_label",
+    "score_delta",
+    "sources_available",
+    "computed_at",
+)
+
+
+def latest_scores_query(active_only: bool = True, strategy: str = "table") -> Select:
+    """
+    One query for the latest aggregate score of every stock, as plain rows of
+    (ticker, company_name, *LATEST_SCORE_FIELDS) ordered by ticker. Stocks
+    with no score yet come back with None in the score columns.
+
+    strategy:
+      "table"       join latest_aggregate_scores (one row per stock)
+      "distinct_on" DISTINCT ON (stock_id) over idx_aggregate_scores_stock_time
+      "lateral"     LATERAL ... ORDER BY computed_at DESC LIMIT 1 per stock
+    The last two read aggregate_scores directly and need no latest table.
+    """
+    if strategy == "table":
+        latest = LatestAggregateScore.__table__.alias("latest")
+        on = latest.c.stock_id == Stock.id
+    elif strategy == "distinct_on":
+        latest = (
+            select(AggregateScore.stock_id, *_score_columns())
+            .distinct(AggregateScore.stock_id)
+            .order_by(AggregateScore.stock_id, AggregateScore.computed_at.desc())
+            .subquery("latest")
+        )
+        on = latest.c.stock_id == Stock.id
+    elif strategy == "lateral":
+        latest = (
+            select(*_score_columns())
+            .where(AggregateScore.stock_id == Stock.id)
+            .order_by(AggregateScore.computed_at.desc())
+            .limit(1)
+            .lateral("latest")
+        )
+        on = true()
+    else:
+        raise ValueError(f"Unknown latest score strategy: {strategy}")
+
+    query = (
+        select(Stock.ticker, Stock.company_name, *(latest.c[f] for f in LATEST_SCORE_FIELDS))
+        .outerjoin(latest, on)
+        .order_by(Stock.ticker)
+    )
+    if active_only:
+        query = query.where(Stock.is_active.is_(True))
+    return query
+
+
+def _score_columns():
+    return [getattr(AggregateScore, f) for f in LATEST_SCORE_FIELDS]
+
+
+async def fetch_latest_scores(db, active_only: bool = True, strategy: str = "table") -> list:
+    """Latest score row per stock (see latest_scores_query)."""
+    result = await db.execute(latest_scores_query(active_only, strategy))
+    return result.all()
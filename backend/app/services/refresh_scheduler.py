@@ -0,0 +1,103 @@
+import math
+import statistics
+import time
+from dataclasses import dataclass
+
+SCHEDULE_KEY = "refresh_schedule"
+
+
+@dataclass
+class TickerActivity:
+    """Recent signal for one ticker."""
+
+    score_deltas: list[float]  # Newest first
+    data_points: int  # Across all sources in the latest aggregation
+    sources_available: int
+    sources_total: int
+
+
+class RefreshScheduler:
+    """
+    Decides when each ticker is refreshed next.
+
+    Activity combines score volatility (RMS of recent ``score_delta``) and
+    data volume (``data_points``, log-scaled), discounted when few
+    sources reported, since a swing seen by one source is weak evidence:
+
+        activity = (0.7 * volatility + 0.3 * volume) * (0.5 + 0.5 * coverage)
+
+    The interval then runs linearly from ``max_minutes`` (activity 0) down
+    to ``min_minutes`` (activity 1).
+    """
+
+    VOLATILITY_SATURATION = 0.15  # RMS score_delta treated as "fully active"
+    VOLUME_SATURATION = 500  # data points treated as "fully active"
+
+    def __init__(self, min_minutes: float, max_minutes: float):
+        self._min = min(min_minutes, max_minutes)
+        self._max = max(min_minutes, max_minutes)
+
+    def activity(self, stats: TickerActivity) -> float:
+        deltas = stats.score_deltas
+        rms = math.sqrt(statistics.fmean(d * d for d in deltas)) if deltas else 0.0
+        volatility = min(rms / self.VOLATILITY_SATURATION, 1.0)
+        volume = min(
+            math.log1p(max(stats.data_points, 0)) / math.log1p(self.VOLUME_SATURATION), 1.0
+        )
+        coverage = (
+            stats.sources_available / stats.sources_total if stats.sources_total else 0.0
+        )
+        return (0.7 * volatility + 0.3 * volume) * (0.5 + 0.5 * coverage)
+
+    def next_interval_minutes(self, stats: TickerActivity) -> float:
+        return self._max - (self._max - self._min) * self.activity(stats)
+
+
+def load_score_deltas(session, ticker: str, history: int) -> list[float]:
+    """``score_delta`` of the latest ``history`` aggregate scores, newest first."""
+    from sqlalchemy import desc
+
+    from app.models.aggregate_score import AggregateScore
+    from app.models.stock import Stock
+
+    rows = (
+        session.query(AggregateScore.score_delta)
+        .join(Stock, Stock.id == AggregateScore.stock_id)
+        .filter(Stock.ticker == ticker, AggregateScore.score_delta.isnot(None))
+        .order_by(desc(AggregateScore.computed_at))
+        .limit(history)
+        .all()
+    )
+    return [float(r.score_delta) for r in rows]
+
+
+def claim_due_tickers(active_tickers: list[str], lease_minutes: float) -> list[str]:
+    """
+    Return tickers whose refresh is due and push their next due time out by
+    ``lease_minutes`` so the next tick does not dispatch them again; the
+    real next time is set by reschedule() once they are aggregated. Tickers
+    never scheduled are due now; inactive ones are dropped from the schedule.
+    """
+    from app.core.redis import get_sync_redis
+
+    r = get_sync_redis()
+    now = time.time()
+    active = set(active_tickers)
+
+    scheduled = dict(r.zrange(SCHEDULE_KEY, 0, -1, withscores=True))
+    stale = [t for t in scheduled if t not in active]
+    due = [t for t in active_tickers if scheduled.get(t, 0.0) <= now]
+
+    pipe = r.pipeline()
+    if stale:
+        pipe.zrem(SCHEDULE_KEY, *stale)
+    if due:
+        pipe.zadd(SCHEDULE_KEY, {t: now + lease_minutes * 60 for t in due})
+    pipe.execute()
+    return due
+
+
+def reschedule(ticker: str, interval_minutes: float):
+    from app.core.redis import get_sync_redis
+
+    get_sync_redis().zadd(SCHEDULE_KEY, {ticker: time.time() + interval_minutes * 60})
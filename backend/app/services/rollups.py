@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta, timezone
+
+# Rollup resolution -> bucket width in seconds. Buckets are epoch-aligned in UTC.
+ROLLUP_RESOLUTIONS = {
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+
+
+# Every bucket width the API serves; 15m is bucketed on the fly in SQL.
+BUCKET_SECONDS = {"15m": 900, **ROLLUP_RESOLUTIONS}
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def time_bucket(column, seconds: int):
+    """SQL expression for the epoch-aligned bucket ``column`` falls in (date_bin)."""
+    from sqlalchemy import func
+
+    return func.date_bin(timedelta(seconds=seconds), column, EPOCH)
+
+
+def bucket_start(ts: datetime, seconds: int) -> datetime:
+    ts = int(ts.timestamp())
+    return datetime.fromtimestamp(ts - ts % seconds, tz=timezone.utc)
+
+
+def add_to_rollups(session, agg):
+    """
+    Fold a newly written AggregateScore into its bucket at every resolution
+    with a single multi-row upsert, in the caller's transaction.
+    """
+    from sqlalchemy import case, func
+    from sqlalchemy.dialects.postgresql import insert
+
+    from app.models.aggregate_score_rollup import AggregateScoreRollup as R
+
+    rows = [
+        {
+            "stock_id": agg.stock_id,
+            "resolution": resolution,
+            "bucket_start": bucket_start(agg.computed_at, seconds),
+            "count": 1,
+            "score_sum": agg.score,
+            "score_min": agg.score,
+            "score_max": agg.score,
+            "last_score": agg.score,
+            "last_label": agg.sentiment_label,
+            "last_computed_at": agg.computed_at,
+            "confidence_sum": agg.confidence,
+            "sources_sum": agg.sources_available,
+        }
+        for resolution, seconds in ROLLUP_RESOLUTIONS.items()
+    ]
+    stmt = insert(R).values(rows)
+    new = stmt.excluded
+    is_newer = new.last_computed_at >= R.last_computed_at
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[R.stock_id, R.resolution, R.bucket_start],
+        set_={
+            "count": R.count + new.count,
+            "score_sum": R.score_sum + new.score_sum,
+            "score_min": func.least(R.score_min, new.score_min),
+            "score_max": func.greatest(R.score_max, new.score_max),
+            "last_score": case((is_newer, new.last_score), else_=R.last_score),
+            "last_label": case((is_newer, new.last_label), else_=R.last_label),
+            "last_computed_at": func.greatest(R.last_computed_at, new.last_computed_at),
+            "confidence_sum": R.confidence_sum + new.confidence_sum,
+            "sources_sum": R.sources_sum + new.sources_sum,
+        },
+    )
+    session.execute(stmt)
+
+
+def update_rollups(session, agg, old_score, old_confidence, old_sources: int):
+    """
+    Swap the previous values of a score rewritten in place (quorum
+    re-aggregation) for its new ones in the buckets containing it: the
+    sums take the difference and min/max widen to the new score.
+
+    That is exact unless the old score was a bucket's min (max) and the new
+    one is higher (lower): the bucket's true extreme is then unknown, so
+    only those buckets are recomputed from aggregate_scores.
+    """
+    from sqlalchemy import case, func, or_, update
+
+    from app.models.aggregate_score_rollup import AggregateScoreRollup as R
+
+    new_score = agg.score
+    is_last = R.last_computed_at == agg.computed_at
+    stale = []
+    for resolution, seconds in ROLLUP_RESOLUTIONS.items():
+        stmt = (
+            update(R)
+            .where(
+                R.stock_id == agg.stock_id,
+                R.resolution == resolution,
+                R.bucket_start == bucket_start(agg.computed_at, seconds),
+                or_(R.score_min < old_score, new_score <= old_score),
+                or_(R.score_max > old_score, new_score >= old_score),
+            )
+            .values(
+                score_sum=R.score_sum - old_score + new_score,
+                score_min=func.least(R.score_min, new_score),
+                score_max=func.greatest(R.score_max, new_score),
+                last_score=case((is_last, new_score), else_=R.last_score),
+                last_label=case((is_last, agg.sentiment_label), else_=R.last_label),
+                confidence_sum=R.confidence_sum - old_confidence + agg.confidence,
+                sources_sum=R.sources_sum - old_sources + agg.sources_available,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if session.execute(stmt).rowcount == 0:
+            stale.append(resolution)
+    if stale:
+        rebuild_rollups(session, agg.stock_id, agg.computed_at, stale)
+
+
+def rebuild_rollups(session, stock_id, computed_at: datetime, resolutions=None):
+    """
+    Recompute the buckets containing ``computed_at`` from aggregate_scores,
+    at every resolution or only the given ones.
+    """
+    from sqlalchemy import func, literal, select
+    from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+
+    from app.models.aggregate_score import AggregateScore as A
+    from app.models.aggregate_score_rollup import AggregateScoreRollup as R
+
+    for resolution, seconds in ROLLUP_RESOLUTIONS.items():
+        if resolutions is not None and resolution not in resolutions:
+            continue
+        start = bucket_start(computed_at, seconds)
+        source = (
+            select(
+                A.stock_id,
+                literal(resolution),
+                literal(start),
+                func.count(),
+                func.sum(A.score),
+                func.min(A.score),
+                func.max(A.score),
+                func.array_agg(aggregate_order_by(A.score, A.computed_at.desc()))[1],
+                func.array_agg(aggregate_order_by(A.sentiment_label, A.computed_at.desc()))[1],
+                func.max(A.computed_at),
+                func.sum(A.confidence),
+                func.sum(A.sources_available),
+            )
+            .where(
+                A.stock_id == stock_id,
+                A.computed_at >= start,
+                A.computed_at < start + timedelta(seconds=seconds),
+            )
+            .group_by(A.stock_id)
+        )
+        columns = [
+            "stock_id", "resolution", "bucket_start", "count", "score_sum", "score_min",
+            "score_max", "last_score", "last_label", "last_computed_at",
+            "confidence_sum", "sources_sum",
+        ]
+        stmt = insert(R).from_select(columns, source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[R.stock_id, R.resolution, R.bucket_start],
+            set_={c: stmt.excluded[c] for c in columns[3:]},
+        )
+        session.execute(stmt)
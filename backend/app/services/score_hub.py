@@ -0,0 +1,248 @@
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import AsyncIterator
+
+from app.core.config import settings
+from app.core.process_stats import process_field, stats_value
+
+logger = logging.getLogger(__name__)
+
+# Capped stream of score updates (fields: ticker, data), written by aggregation
+STREAM_KEY = "sentiment_updates:stream"
+# Hash: ticker -> id of its newest entry in STREAM_KEY (trimmed or not)
+LATEST_IDS_KEY = "sentiment_updates:latest_ids"
+READ_COUNT = 500  # Entries per XREAD / XRANGE page
+STATS_KEY = "sse_hub_stats"  # Hash: {hostname}:{pid} -> JSON stats of one API process
+STATS_PUBLISH_SECONDS = 10
+
+
+class Subscriber:
+    """
+    One SSE client's bounded queue of pending events. When the client falls
+    ``maxsize`` events behind, the oldest pending event is dropped: a newer
+    score for the same ticker supersedes it anyway.
+    """
+
+    def __init__(self, hub: "ScoreHub", tickers, maxsize: int):
+        self.tickers = frozenset(tickers)
+        self.dropped = 0
+        self._hub = hub
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(maxsize, 1))
+
+    def put(self, event: dict, received: float):
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+            self._hub.stats["dropped"] += 1
+        self._queue.put_nowait((event, received))
+
+    async def get(self) -> dict:
+        event, received = await self._queue.get()
+        self._hub._observe("delivery_ms", (time.monotonic() - received) * 1000)
+        return event
+
+
+class ScoreHub:
+    """
+    Fans score updates out to the SSE clients of this API process from a
+    single blocking XREAD on STREAM_KEY, instead of a connection and
+    subscription per client. Entries carry their ticker as a field, so they
+    are queued for that ticker's subscribers without decoding the payload;
+    the stream id becomes the SSE event id (see replay()).
+
+    The reader task starts with the first subscriber and, if Redis goes
+    away, reconnects with backoff and resumes after the last entry it read.
+    Client count, drops and fan-out / delivery latency are published to
+    STATS_KEY for /health.
+    """
+
+    def __init__(self, queue_size: int):
+        self._queue_size = queue_size
+        self._subscribers: dict[str, set[Subscriber]] = defaultdict(set)
+        self._clients: set[Subscriber] = set()
+        self._task: asyncio.Task | None = None
+        self._last_id: str | None = None
+        self._published_at = time.monotonic()
+        self.stats = {
+            "messages": 0,
+            "deliveries": 0,
+            "dropped": 0,
+            "reconnects": 0,
+            "replays": 0,
+            "replayed": 0,
+            "resyncs": 0,
+        }
+        # name -> [count, total, max] in milliseconds
+        self._timings: dict[str, list[float]] = {}
+
+    def subscribe(self, tickers) -> Subscriber:
+        subscriber = Subscriber(self, tickers, self._queue_size)
+        self._clients.add(subscriber)
+        for ticker in subscriber.tickers:
+            self._subscribers[ticker].add(subscriber)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self._clients.discard(subscriber)
+        for ticker in subscriber.tickers:
+            subs = self._subscribers.get(ticker)
+            if subs is not None:
+                subs.discard(subscriber)
+                if not subs:
+                    del self._subscribers[ticker]
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        from app.core.redis import get_redis
+
+        backoff = 1.0
+        while True:
+            try:
+                r = await get_redis()
+                if self._last_id is None:
+                    newest = await r.xrevrange(STREAM_KEY, count=1)
+                    self._last_id = newest[0][0] if newest else "0-0"
+                backoff = 1.0
+                while True:
+                    response = await r.xread({STREAM_KEY: self._last_id}, count=READ_COUNT, block=1000)
+                    for _, entries in response:
+                        for entry_id, fields in entries:
+                            self._dispatch(entry_id, fields)
+                            self._last_id = entry_id
+                    await self._maybe_publish_stats(r)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.stats["reconnects"] += 1
+                logger.warning("Score hub stream read failed (%s), retrying in %.0fs", exc, backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _dispatch(self, entry_id: str, fields: dict):
+        received = time.monotonic()
+        self.stats["messages"] += 1
+        # Stream ids start with the Redis server time of the XADD in ms
+        self._observe("publish_lag_ms", max(time.time() * 1000 - parse_stream_id(entry_id)[0], 0.0))
+
+        subscribers = self._subscribers.get(fields.get("ticker"))
+        if subscribers:
+            event = _event(entry_id, fields)
+            for subscriber in subscribers:
+                subscriber.put(event, received)
+            self.stats["deliveries"] += len(subscribers)
+            self._observe("fanout_ms", (time.monotonic() - received) * 1000)
+
+    async def replay(self, tickers, last_event_id: str) -> AsyncIterator[dict]:
+        """
+        Events for ``tickers`` stored after ``last_event_id``, oldest first,
+        for a reconnecting client. Each update carries the ticker's whole
+        score, so only losing a ticker's newest update matters: if that was
+        trimmed from the stream (or Redis lost the stream), a "resync" event
+        naming those tickers and echoing ``last_event_id`` comes first, and
+        the client refetches them instead of relying on the replay. An id
+        that is not a stream id replays nothing.
+        """
+        from app.core.redis import get_redis
+
+        try:
+            after = parse_stream_id(last_event_id)
+        except ValueError:
+            return
+        tickers = sorted(set(tickers))
+        self.stats["replays"] += 1
+
+        r = await get_redis()
+        oldest = await r.xrange(STREAM_KEY, count=1)
+        if oldest:
+            oldest_id = parse_stream_id(oldest[0][0])
+            latest = await r.hmget(LATEST_IDS_KEY, tickers)
+            trimmed = [
+                ticker for ticker, entry_id in zip(tickers, latest)
+                if entry_id and after < parse_stream_id(entry_id) < oldest_id
+            ]
+        else:
+            trimmed = tickers if after > (0, 0) else []
+        if trimmed:
+            self.stats["resyncs"] += 1
+            yield {
+                "event": "resync",
+                "data": json.dumps(
+                    {"trimmed": True, "tickers": trimmed, "last_event_id": last_event_id}
+                ),
+            }
+        tickers = set(tickers)
+
+        start = f"{after[0]}-{after[1] + 1}"
+        while True:
+            entries = await r.xrange(STREAM_KEY, min=start, count=READ_COUNT)
+            for entry_id, fields in entries:
+                if fields.get("ticker") in tickers:
+                    self.stats["replayed"] += 1
+                    yield _event(entry_id, fields)
+            if len(entries) < READ_COUNT:
+                return
+            ms, seq = parse_stream_id(entries[-1][0])
+            start = f"{ms}-{seq + 1}"
+
+    def _observe(self, name: str, ms: float):
+        timing = self._timings.setdefault(name, [0, 0.0, 0.0])
+        timing[0] += 1
+        timing[1] += ms
+        timing[2] = max(timing[2], ms)
+
+    def snapshot(self) -> dict:
+        stats = dict(self.stats, clients=len(self._clients), tickers=len(self._subscribers))
+        for name, (count, total, peak) in self._timings.items():
+            stats[f"avg_{name}"] = round(total / count, 3)
+            stats[f"max_{name}"] = round(peak, 3)
+        return stats
+
+    async def _maybe_publish_stats(self, r):
+        if time.monotonic() - self._published_at < STATS_PUBLISH_SECONDS:
+            return
+        self._published_at = time.monotonic()
+        try:
+            await r.hset(STATS_KEY, process_field(), stats_value(self.snapshot()))
+        except Exception:
+            pass
+
+
+def parse_stream_id(entry_id: str) -> tuple[int, int]:
+    """A Redis stream id ("<ms>-<seq>") as a comparable tuple; ValueError if malformed."""
+    ms, _, seq = entry_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _event(entry_id: str, fields: dict) -> dict:
+    # The payload is JSON already and goes out as the event data unchanged
+    return {"event": "score_update", "id": entry_id, "data": fields.get("data", "{}")}
+
+
+_hub: ScoreHub | None = None
+
+
+def get_score_hub() -> ScoreHub:
+    global _hub
+    if _hub is None:
+        _hub = ScoreHub(queue_size=settings.SSE_SUBSCRIBER_QUEUE_SIZE)
+    return _hub
+
+
+async def close_score_hub():
+    global _hub
+    if _hub is not None:
+        await _hub.close()
+        _hub = None
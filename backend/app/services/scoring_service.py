@@ -1,5 +1,5 @@
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 
 from app.adapters.base import RawSentimentData
@@ -18,6 +18,45 @@ class AggregationResult:
     sources_total: int
 
 
+@dataclass
+class SourceContribution:
+    """One source's share of a stock's aggregate."""
+
+    source_name: str
+    score: float  # Normalized [-1, +1]
+    effective_weight: float  # base_weight * data_quality_factor
+    confidence_quality: float  # Data quality term of the confidence formula
+    data_points: int
+
+
+@dataclass
+class RunningAggregate:
+    """
+    Order-independent sums over the sources seen so far for one stock.
+    Adding a source is O(1) and the aggregate can be produced from the sums
+    alone, so results can be folded in as they arrive.
+    """
+
+    weighted_sum: float = 0.0
+    total_weight: float = 0.0
+    quality_sum: float = 0.0
+    sources_available: int = 0
+    data_points: int = 0
+    max_data_points: int = 0
+    source_breakdown: dict[str, float] = field(default_factory=dict)
+    weight_breakdown: dict[str, float] = field(default_factory=dict)
+
+    def add(self, contribution: SourceContribution):
+        self.weighted_sum += contribution.score * contribution.effective_weight
+        self.total_weight += contribution.effective_weight
+        self.quality_sum += contribution.confidence_quality
+        self.sources_available += 1
+        self.data_points += contribution.data_points
+        self.max_data_points = max(self.max_data_points, contribution.data_points)
+        self.source_breakdown[contribution.source_name] = round(contribution.score, 6)
+        self.weight_breakdown[contribution.source_name] = round(contribution.effective_weight, 4)
+
+
 class ScoringService:
     """
     Core aggregation engine.
@@ -57,31 +96,57 @@ class ScoringService:
                 sources_total=len(weight_config),
             )
 
-        source_breakdown: dict[str, float] = {}
-        weight_breakdown: dict[str, float] = {}
-        weighted_sum = 0.0
-        total_weight = 0.0
-
+        running = RunningAggregate()
         for ss in source_scores:
-            base_weight = weight_config.get(ss.source_name, 1.0)
-            quality_factor = self._data_quality_factor(ss.data_points)
-            effective_weight = base_weight * quality_factor
+            running.add(self.contribution(
+                ss.source_name, float(ss.normalized_score), ss.data_points, weight_config
+            ))
 
-            score_float = float(ss.normalized_score)
-            weighted_sum += score_float * effective_weight
-            total_weight += effective_weight
+        return self.result_from_running(running, sources_total=len(weight_config))
 
-            source_breakdown[ss.source_name] = round(score_float, 6)
-            weight_breakdown[ss.source_name] = round(effective_weight, 4)
+    def contribution(
+        self,
+        source_name: str,
+        normalized_score: float,
+        data_points: int,
+        weight_config: dict[str, float],
+    ) -> SourceContribution:
+        """What one source result adds to its stock's RunningAggregate."""
+        base_weight = weight_config.get(source_name, 1.0)
+        return SourceContribution(
+            source_name=source_name,
+            score=normalized_score,
+            effective_weight=base_weight * self._data_quality_factor(data_points),
+            confidence_quality=self._confidence_quality(data_points),
+            data_points=data_points,
+        )
 
-        final_score = weighted_sum / total_weight if total_weight > 0 else 0.0
-        final_score = max(-1.0, min(1.0, final_score))
+    def result_from_running(
+        self, running: RunningAggregate, sources_total: int
+    ) -> AggregationResult:
+        """Aggregate from running sums in O(1): no source results needed."""
+        if running.sources_available == 0:
+            return AggregationResult(
+                score=Decimal("0.0"),
+                confidence=Decimal("0.0"),
+                sentiment_label="neutral",
+                source_breakdown={},
+                weight_breakdown={},
+                sources_available=0,
+                sources_total=sources_total,
+            )
 
-        confidence = self._compute_confidence(
-            sources_available=len(source_scores),
-            sources_total=len(weight_config),
-            data_points=[ss.data_points for ss in source_scores],
+        final_score = (
+            running.weighted_sum / running.total_weight if running.total_weight > 0 else 0.0
         )
+        final_score = max(-1.0, min(1.0, final_score))
+
+        if sources_total == 0:
+            confidence = 0.0
+        else:
+            coverage = running.sources_available / sources_total
+            avg_quality = running.quality_sum / running.sources_available
+            confidence = 0.6 * coverage + 0.4 * avg_quality
 
         label = self._score_to_label(final_score)
 
@@ -89,10 +154,10 @@ class ScoringService:
             score=Decimal(str(round(final_score, 6))),
             confidence=Decimal(str(round(confidence, 4))),
             sentiment_label=label,
-            source_breakdown=source_breakdown,
-            weight_breakdown=weight_breakdown,
-            sources_available=len(source_scores),
-            sources_total=len(weight_config),
+            source_breakdown=dict(running.source_breakdown),
+            weight_breakdown=dict(running.weight_breakdown),
+            sources_available=running.sources_available,
+            sources_total=sources_total,
         )
 
     @staticmethod
@@ -110,26 +175,12 @@ class ScoringService:
         return min(1.0, 0.3 + 0.7 * (1 - math.exp(-data_points / 15.0)))
 
     @staticmethod
-    def _compute_confidence(
-        sources_available: int,
-        sources_total: int,
-        data_points: list[int],
-    ) -> float:
+    def _confidence_quality(data_points: int) -> float:
         """
+        Data quality term of the confidence score:
         Confidence = 60% source coverage + 40% average data quality.
         """
-        if sources_total == 0:
-            return 0.0
-
-        coverage = sources_available / sources_total
-
-        quality_factors = [
-            min(1.0, 0.3 + 0.7 * (1 - math.exp(-dp / 15.0)))
-            for dp in data_points
-        ] if data_points else [0.0]
-        avg_quality = sum(quality_factors) / len(quality_factors)
-
-        return 0.6 * coverage + 0.4 * avg_quality
+        return min(1.0, 0.3 + 0.7 * (1 - math.exp(-data_points / 15.0)))
 
     def _score_to_label(self, score: float) -> str:
         for low, high, label in self.LABEL_THRESHOLDS:
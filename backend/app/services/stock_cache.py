@@ -0,0 +1,196 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+
+from app.core.config import settings
+
+VERSION_KEY = "stock_cache:version"
+INVALIDATION_CHANNEL = "stock_cache:invalidate"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedStock:
+    """The stock columns hot paths need to resolve a ticker."""
+
+    id: uuid.UUID
+    ticker: str
+    company_name: str
+    sector: str | None
+    is_active: bool
+
+
+_MISSING = object()
+
+
+class StockCache:
+    """
+    In-process ticker -> CachedStock map shared by every request or task in
+    the process, so resolving a ticker does not cost a stocks query.
+
+    Writers bump VERSION_KEY and publish the new version on
+    INVALIDATION_CHANNEL (see invalidate_stock_cache()); a listener thread
+    records the newest version and the next lookup drops every entry cached
+    under an older one. Entries are stored against the version that was
+    current when their query started, so a row read just before an
+    invalidation is never cached past it. Unknown tickers are cached too,
+    since creating them bumps the version. If the listener is disconnected
+    entries still expire after ``max_age_seconds``.
+    """
+
+    def __init__(self, max_age_seconds: float):
+        self._max_age = max_age_seconds
+        self._entries: dict[str, CachedStock | None] = {}
+        self._lock = threading.Lock()
+        self._entries_version: str | None = None
+        self._latest_version: str | None = None
+        self._loaded_at = time.monotonic()
+        self._listener: threading.Thread | None = None
+        self._pid = os.getpid()
+
+    def version(self) -> str | None:
+        """Token to pass to put() for a lookup about to hit the database."""
+        self._ensure_listener()
+        return self._latest_version
+
+    def get(self, ticker: str):
+        """The cached stock, None for a known-missing ticker, or _MISSING."""
+        self._ensure_listener()
+        with self._lock:
+            self._expire()
+            return self._entries.get(ticker, _MISSING)
+
+    def put(self, ticker: str, stock: CachedStock | None, version: str | None):
+        with self._lock:
+            self._expire()
+            if version == self._entries_version:
+                self._entries[ticker] = stock
+
+    def invalidate(self, version: str | None = None):
+        with self._lock:
+            self._latest_version = version
+            self._entries.clear()
+            self._entries_version = version
+            self._loaded_at = time.monotonic()
+
+    def _expire(self):
+        if (
+            self._entries_version != self._latest_version
+            or time.monotonic() - self._loaded_at > self._max_age
+        ):
+            self._entries.clear()
+            self._entries_version = self._latest_version
+            self._loaded_at = time.monotonic()
+
+    def _ensure_listener(self):
+        if self._listener is not None and self._listener.is_alive():
+            return
+        self._listener = threading.Thread(target=self._listen, name="stock-cache", daemon=True)
+        self._listener.start()
+
+    def _listen(self):
+        from app.core.redis import get_sync_redis
+
+        while True:
+            try:
+                r = get_sync_redis()
+                pubsub = r.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                self._latest_version = r.get(VERSION_KEY) or "0"
+                for message in pubsub.listen():
+                    self._latest_version = message["data"]
+            except Exception:
+                # Until reconnected, entries only live for max_age_seconds.
+                time.sleep(1.0)
+
+
+def _to_cached(stock) -> CachedStock:
+    return CachedStock(
+        id=stock.id,
+        ticker=stock.ticker,
+        company_name=stock.company_name,
+        sector=stock.sector,
+        is_active=stock.is_active,
+    )
+
+
+_cache: StockCache | None = None
+
+
+def get_stock_cache() -> StockCache:
+    global _cache
+    if _cache is None or _cache._pid != os.getpid():
+        _cache = StockCache(max_age_seconds=settings.STOCK_CACHE_MAX_AGE_SECONDS)
+    return _cache
+
+
+async def get_cached_stock(db, ticker: str) -> CachedStock | None:
+    """Resolve a ticker in the API; queries stocks only on a cache miss."""
+    from sqlalchemy import select
+
+    from app.models.stock import Stock
+
+    ticker = ticker.upper()
+    cache = get_stock_cache()
+    cached = cache.get(ticker)
+    if cached is not _MISSING:
+        return cached
+
+    version = cache.version()
+    result = await db.execute(select(Stock).filter(Stock.ticker == ticker))
+    stock = result.scalar_one_or_none()
+    cached = _to_cached(stock) if stock else None
+    cache.put(ticker, cached, version)
+    return cached
+
+
+def get_cached_stocks_sync(session, tickers) -> dict[str, CachedStock]:
+    """Resolve tickers in a worker with at most one stocks query for the misses."""
+    from app.models.stock import Stock
+
+    cache = get_stock_cache()
+    found: dict[str, CachedStock] = {}
+    missing = []
+    for ticker in dict.fromkeys(tickers):
+        cached = cache.get(ticker)
+        if cached is _MISSING:
+            missing.append(ticker)
+        elif cached is not None:
+            found[ticker] = cached
+
+    if missing:
+        version = cache.version()
+        rows = {
+            s.ticker: _to_cached(s)
+            for s in session.query(Stock).filter(Stock.ticker.in_(missing)).all()
+        }
+        for ticker in missing:
+            cache.put(ticker, rows.get(ticker), version)
+        found.update(rows)
+    return found
+
+
+async def invalidate_stock_cache():
+    """
+    Announce a stocks change to every API and worker process.
+
+    Called after the change is committed, so a Redis failure is logged
+    rather than raised; other processes then pick the change up once their
+    entries reach STOCK_CACHE_MAX_AGE_SECONDS.
+    """
+    from app.core.redis import get_redis
+
+    cache = get_stock_cache()
+    cache.invalidate()
+    try:
+        r = await get_redis()
+        version = await r.incr(VERSION_KEY)
+        await r.publish(INVALIDATION_CHANNEL, str(version))
+    except Exception:
+        logger.exception("Failed to publish stock cache invalidation")
+        return
+    cache.invalidate(str(version))
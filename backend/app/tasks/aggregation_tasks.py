@@ -1,10 +1,79 @@
 import json
+import logging
+import math
+import time
 from datetime import datetime, timezone
 from decimal import Decimal
 
 from app.adapters.base import RawSentimentData
 from app.core.celery_app import celery_app
-from app.services.scoring_service import ScoringService
+from app.core.config import settings
+from app.services.scoring_service import RunningAggregate, ScoringService
+
+logger = logging.getLogger(__name__)
+
+# Per (cycle, ticker) arrival state for quorum aggregation. Hash fields:
+#   expected  sources dispatched for the ticker this cycle
+#   arrived   sources that reported (with or without data)
+#   with_data sources that reported a score
+#   status    "" until the first aggregation, then "partial" or "final"
+#   agg_id    AggregateScore row written for this cycle
+#   refresh   set once the final score scheduled the next adaptive refresh
+#   a:<src>   arrival marker (1 with data, 0 without)
+# and the ticker's RunningAggregate, folded in as each source lands:
+#   ws, tw, qs  weighted score sum, total weight, confidence quality sum
+#   dp, dp_max  data points (sum, largest single source)
+#   s:<src>, w:<src>  per-source score and effective weight
+ARRIVALS_KEY = "aggregation:{cycle_id}:{ticker}"
+
+# Record one source's result and decide what the arrival triggers:
+# "dup" (already recorded), "wait", "partial" (quorum just reached),
+# "update" (re-publish an already published score) or "final".
+# ARGV: source, has_data, quorum, score, weighted score, weight, quality, data points
+_ARRIVAL_LUA = """
+if redis.call('HSETNX', KEYS[1], 'a:' .. ARGV[1], ARGV[2]) == 0 then
+  return 'dup'
+end
+local arrived = redis.call('HINCRBY', KEYS[1], 'arrived', 1)
+local with_data = tonumber(redis.call('HGET', KEYS[1], 'with_data') or '0')
+if ARGV[2] == '1' then
+  with_data = redis.call('HINCRBY', KEYS[1], 'with_data', 1)
+  redis.call('HINCRBYFLOAT', KEYS[1], 'ws', ARGV[5])
+  redis.call('HINCRBYFLOAT', KEYS[1], 'tw', ARGV[6])
+  redis.call('HINCRBYFLOAT', KEYS[1], 'qs', ARGV[7])
+  redis.call('HINCRBY', KEYS[1], 'dp', ARGV[8])
+  if tonumber(ARGV[8]) > tonumber(redis.call('HGET', KEYS[1], 'dp_max') or '0') then
+    redis.call('HSET', KEYS[1], 'dp_max', ARGV[8])
+  end
+  redis.call('HSET', KEYS[1], 's:' .. ARGV[1], ARGV[4], 'w:' .. ARGV[1], ARGV[6])
+end
+local expected = tonumber(redis.call('HGET', KEYS[1], 'expected') or '0')
+local status = redis.call('HGET', KEYS[1], 'status') or ''
+if arrived >= expected then
+  redis.call('HSET', KEYS[1], 'status', 'final')
+  return 'final'
+end
+if status ~= '' then
+  return 'update'
+end
+if with_data >= tonumber(ARGV[3]) then
+  redis.call('HSET', KEYS[1], 'status', 'partial')
+  return 'partial'
+end
+return 'wait'
+"""
+
+# Close a ticker at its deadline. Returns 1 if it was still open.
+_DEADLINE_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return 0
+end
+if redis.call('HGET', KEYS[1], 'status') == 'final' then
+  return 0
+end
+redis.call('HSET', KEYS[1], 'status', 'final')
+return 1
+"""
 
 
 @celery_app.task(name="app.tasks.aggregation_tasks.aggregate_scores_for_stock")
@@ -18,12 +87,230 @@ def aggregate_scores_for_stock(fetch_results: list[dict | None], ticker: str, cy
     4. Call ScoringService.aggregate()
     5. Persist AggregateScore
     6. Publish SSE event via Redis pub/sub
+    7. Schedule the ticker's next refresh from its activity (adaptive mode)
     """
     valid_results = [r for r in fetch_results if r is not None]
 
     if not valid_results:
         return {"ticker": ticker, "status": "no_data"}
 
+    source_scores, result = _aggregate(valid_results)
+
+    _persist_aggregate_score(ticker, result)
+    _publish_sse_update(ticker, result)
+    if settings.ADAPTIVE_REFRESH_ENABLED:
+        _schedule_next_refresh(ticker, result, sum(s.data_points for s in source_scores))
+
+    return {
+        "ticker": ticker,
+        "score": str(result.score),
+        "confidence": str(result.confidence),
+        "label": result.sentiment_label,
+        "sources": result.sources_available,
+    }
+
+
+@celery_app.task(name="app.tasks.aggregation_tasks.aggregate_cycle")
+def aggregate_cycle(fetch_results: list, tickers: list[str], cycle_id: str):
+    """
+    Chord callback for a whole-cycle chord. Header tasks return either one
+    result dict (per-ticker fetches) or a list of them (fan-out fetches);
+    results are regrouped by ticker and aggregated per stock.
+    """
+    by_ticker: dict[str, list[dict]] = {ticker: [] for ticker in tickers}
+    for item in fetch_results:
+        if item is None:
+            continue
+        for r in item if isinstance(item, list) else [item]:
+            if r is not None and r["ticker"] in by_ticker:
+                by_ticker[r["ticker"]].append(r)
+
+    for ticker, results in by_ticker.items():
+        aggregate_scores_for_stock.delay(results, ticker=ticker, cycle_id=cycle_id)
+
+    return {"cycle_id": cycle_id, "stocks": len(by_ticker)}
+
+
+@celery_app.task(name="app.tasks.aggregation_tasks.finalize_at_deadline")
+def finalize_at_deadline(cycle_id: str, tickers: list[str]):
+    """
+    Cycle deadline: tickers still waiting on sources are published with what
+    has arrived and marked final. Sources that report later still trigger an
+    update of the same score.
+    """
+    from app.core.redis import get_sync_redis
+
+    r = get_sync_redis()
+    script = r.register_script(_DEADLINE_LUA)
+    closed = 0
+    for ticker in tickers:
+        key = ARRIVALS_KEY.format(cycle_id=cycle_id, ticker=ticker)
+        if int(script(keys=[key])):
+            publish_running_score(ticker, cycle_id)
+            closed += 1
+    return {"cycle_id": cycle_id, "closed": closed}
+
+
+def start_quorum_tracking(cycle_id: str, expected: dict[str, int], deadlines: dict[str, float]):
+    """
+    Register how many sources each ticker waits for and schedule the
+    deadline sweeps. ``deadlines`` holds seconds from now per ticker;
+    tickers are swept in FETCH_TIMEOUT_SECONDS-wide buckets so a cycle
+    needs a handful of deadline tasks rather than one per ticker.
+    """
+    from app.core.redis import get_sync_redis
+
+    ttl = int(max(deadlines.values(), default=0) + settings.AGGREGATION_STATE_TTL_SECONDS)
+    pipe = get_sync_redis().pipeline()
+    for ticker, count in expected.items():
+        key = ARRIVALS_KEY.format(cycle_id=cycle_id, ticker=ticker)
+        pipe.hset(key, mapping={"expected": count, "arrived": 0, "with_data": 0, "status": ""})
+        pipe.expire(key, ttl)
+    pipe.execute()
+
+    width = max(settings.FETCH_TIMEOUT_SECONDS, 1)
+    buckets: dict[int, list[str]] = {}
+    for ticker, seconds in deadlines.items():
+        buckets.setdefault(math.ceil(seconds / width) * width, []).append(ticker)
+    for countdown, tickers in sorted(buckets.items()):
+        finalize_at_deadline.apply_async(
+            kwargs={"cycle_id": cycle_id, "tickers": tickers}, countdown=countdown
+        )
+
+
+def report_arrival(cycle_id: str, source_name: str, ticker: str, result: dict | None):
+    """
+    Called by fetch tasks once a source is done with a ticker (data, no data
+    or final failure). The result is folded into the ticker's running
+    aggregate in Redis; once the quorum is reached, and for every arrival
+    after that, the updated score is published straight from the caller.
+
+    Never raises: the fetch result is already stored, so a failed publish is
+    logged rather than retried by the fetch task (which would call the
+    upstream API again) or allowed to cut short a multi-ticker loop.
+    """
+    from app.core.redis import get_sync_redis
+
+    r = get_sync_redis()
+    key = ARRIVALS_KEY.format(cycle_id=cycle_id, ticker=ticker)
+    try:
+        expected = int(r.hget(key, "expected") or 0)
+        if not expected:
+            return
+        quorum = max(math.ceil(expected * settings.AGGREGATION_QUORUM), 1)
+        if result:
+            score = float(result["normalized_score"])
+            c = ScoringService().contribution(
+                source_name, score, result["data_points"], _weight_config()
+            )
+            args = [
+                source_name, 1, quorum, repr(round(c.score, 6)),
+                repr(c.score * c.effective_weight), repr(c.effective_weight),
+                repr(c.confidence_quality), c.data_points,
+            ]
+        else:
+            args = [source_name, 0, quorum, 0, 0, 0, 0, 0]
+        action = r.register_script(_ARRIVAL_LUA)(keys=[key], args=args)
+    except Exception:
+        logger.exception("Could not record %s arrival for %s in cycle %s", source_name, ticker, cycle_id)
+        return
+    if action in ("partial", "update", "final"):
+        try:
+            publish_running_score(ticker, cycle_id)
+        except Exception:
+            logger.exception("Could not publish running score for %s in cycle %s", ticker, cycle_id)
+
+
+def publish_running_score(ticker: str, cycle_id: str) -> dict:
+    """
+    Quorum-mode aggregation: score the ticker from its running sums, with
+    no source results reloaded. The first call writes the cycle's
+    AggregateScore; later calls (late arrivals, deadline) update that same
+    row instead of adding another. The SSE event carries "partial" until
+    every source reported or the cycle deadline passed, then "final".
+    """
+    from app.core.redis import get_sync_redis
+
+    r = get_sync_redis()
+    key = ARRIVALS_KEY.format(cycle_id=cycle_id, ticker=ticker)
+
+    with r.lock(f"{key}:lock", timeout=60, blocking_timeout=60):
+        state = r.hgetall(key)
+        running = _running_from_state(state)
+        if not running.sources_available:
+            return {"ticker": ticker, "status": "no_data"}
+
+        result = ScoringService().result_from_running(
+            running, sources_total=len(_weight_config())
+        )
+        status = state.get("status") or "partial"
+        pending = max(int(state.get("expected", 0)) - int(state.get("arrived", 0)), 0)
+        # Late arrivals re-publish a final score; the refresh is scheduled once.
+        schedule_refresh = (
+            settings.ADAPTIVE_REFRESH_ENABLED
+            and status == "final"
+            and r.hsetnx(key, "refresh", 1)
+        )
+
+        agg_id = state.get("agg_id")
+        if agg_id:
+            _update_aggregate_score(agg_id, result)
+        else:
+            agg_id = _persist_aggregate_score(ticker, result)
+            if agg_id:
+                r.hset(key, "agg_id", agg_id)
+
+    _publish_sse_update(ticker, result, status=status, sources_pending=pending, cycle_id=cycle_id)
+    if schedule_refresh:
+        _schedule_next_refresh(ticker, result, running.data_points)
+
+    return {
+        "ticker": ticker,
+        "score": str(result.score),
+        "status": status,
+        "sources": result.sources_available,
+        "pending": pending,
+    }
+
+
+def _running_from_state(state: dict[str, str]) -> RunningAggregate:
+    running = RunningAggregate(
+        weighted_sum=float(state.get("ws", 0)),
+        total_weight=float(state.get("tw", 0)),
+        quality_sum=float(state.get("qs", 0)),
+        sources_available=int(state.get("with_data", 0)),
+        data_points=int(state.get("dp", 0)),
+        max_data_points=int(state.get("dp_max", 0)),
+    )
+    for field, value in state.items():
+        if field.startswith("s:"):
+            running.source_breakdown[field[2:]] = float(value)
+        elif field.startswith("w:"):
+            running.weight_breakdown[field[2:]] = round(float(value), 4)
+    return running
+
+
+_weights: dict[str, float] = {}
+_weights_loaded_at = 0.0
+
+
+def _weight_config() -> dict[str, float]:
+    """Enabled source weights, reloaded every RATE_LIMIT_CONFIG_TTL_SECONDS."""
+    global _weights, _weights_loaded_at
+    if _weights_loaded_at and time.monotonic() - _weights_loaded_at < settings.RATE_LIMIT_CONFIG_TTL_SECONDS:
+        return _weights
+
+    from app.core.database import get_sync_session
+    from app.models.source_config import SourceConfig
+
+    with get_sync_session() as session:
+        configs = session.query(SourceConfig).filter(SourceConfig.is_enabled.is_(True)).all()
+        _weights = {c.source_name: float(c.weight) for c in configs}
+    _weights_loaded_at = time.monotonic()
+    return _weights
+
+
+def _aggregate(valid_results: list[dict]):
     source_scores = [
         RawSentimentData(
             source_name=r["source_name"],
@@ -36,45 +323,29 @@ def aggregate_scores_for_stock(fetch_results: list[dict | None], ticker: str, cy
         for r in valid_results
     ]
 
-    from app.core.database import get_sync_session
-    from app.models.source_config import SourceConfig
-
-    with get_sync_session() as session:
-        configs = session.query(SourceConfig).filter(SourceConfig.is_enabled.is_(True)).all()
-        weight_config = {c.source_name: float(c.weight) for c in configs}
-
     scoring = ScoringService()
-    result = scoring.aggregate(source_scores, weight_config)
+    return source_scores, scoring.aggregate(source_scores, _weight_config())
 
-    _persist_aggregate_score(ticker, result)
-    _publish_sse_update(ticker, result)
 
-    return {
-        "ticker": ticker,
-        "score": str(result.score),
-        "confidence": str(result.confidence),
-        "label": result.sentiment_label,
-        "sources": result.sources_available,
-    }
-
-
-def _persist_aggregate_score(ticker, result):
+def _persist_aggregate_score(ticker, result) -> str | None:
+    """
+    Write a new AggregateScore. previous_score comes from the stock's
+    latest_aggregate_scores row (locked for the transaction), which is
+    then upserted to point at the new score, and the score is added to its
+    rollup buckets, in the same commit.
+    """
     from app.core.database import get_sync_session
     from app.models.aggregate_score import AggregateScore
-    from app.models.stock import Stock
-    from sqlalchemy import desc
+    from app.models.latest_aggregate_score import LatestAggregateScore
+    from app.services.rollups import add_to_rollups
+    from app.services.stock_cache import get_cached_stocks_sync
 
     with get_sync_session() as session:
-        stock = session.query(Stock).filter(Stock.ticker == ticker).first()
+        stock = get_cached_stocks_sync(session, [ticker]).get(ticker)
         if not stock:
-            return
+            return None
 
-        previous = (
-            session.query(AggregateScore)
-            .filter(AggregateScore.stock_id == stock.id)
-            .order_by(desc(AggregateScore.computed_at))
-            .first()
-        )
+        previous = session.get(LatestAggregateScore, stock.id, with_for_update=True)
 
         previous_score = previous.score if previous else None
         delta = result.score - previous_score if previous_score is not None else None
@@ -90,14 +361,115 @@ def _persist_aggregate_score(ticker, result):
             sentiment_label=result.sentiment_label,
             previous_score=previous_score,
             score_delta=delta,
+            computed_at=datetime.now(timezone.utc),
         )
         session.add(agg)
+        session.flush()
+        _upsert_latest(session, agg)
+        add_to_rollups(session, agg)
         session.commit()
+        return str(agg.id)
+
+
+def _update_aggregate_score(agg_id, result):
+    """Re-aggregation within a cycle: same row, same previous_score."""
+    from app.core.database import get_sync_session
+    from app.models.aggregate_score import AggregateScore
+    from app.services.rollups import update_rollups
+
+    with get_sync_session() as session:
+        agg = session.get(AggregateScore, agg_id)
+        if agg is None:
+            return
+        old = (agg.score, agg.confidence, agg.sources_available)
+        agg.score = result.score
+        agg.confidence = result.confidence
+        agg.sources_available = result.sources_available
+        agg.sources_total = result.sources_total
+        agg.source_breakdown = result.source_breakdown
+        agg.weight_breakdown = result.weight_breakdown
+        agg.sentiment_label = result.sentiment_label
+        if agg.previous_score is not None:
+            agg.score_delta = result.score - agg.previous_score
+        session.flush()
+        _upsert_latest(session, agg)
+        update_rollups(session, agg, *old)
+        session.commit()
+
 
+def _upsert_latest(session, agg):
+    """
+    Point the stock's latest_aggregate_scores row at ``agg``. A row for a
+    newer score is left alone, so an in-cycle update of an older score
+    cannot move "latest" backwards.
+    """
+    from sqlalchemy.dialects.postgresql import insert
+
+    from app.models.latest_aggregate_score import LatestAggregateScore
+
+    values = {
+        "stock_id": agg.stock_id,
+        "aggregate_score_id": agg.id,
+        "score": agg.score,
+        "confidence": agg.confidence,
+        "sources_available": agg.sources_available,
+        "sources_total": agg.sources_total,
+        "source_breakdown": agg.source_breakdown,
+        "weight_breakdown": agg.weight_breakdown,
+        "sentiment_label": agg.sentiment_label,
+        "previous_score": agg.previous_score,
+        "score_delta": agg.score_delta,
+        "computed_at": agg.computed_at,
+    }
+    stmt = insert(LatestAggregateScore).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LatestAggregateScore.stock_id],
+        set_={k: stmt.excluded[k] for k in values if k != "stock_id"}
+        | {"updated_at": datetime.now(timezone.utc)},
+        where=LatestAggregateScore.computed_at <= stmt.excluded.computed_at,
+    )
+    session.execute(stmt)
+
+
+def _schedule_next_refresh(ticker, result, data_points: int):
+    from app.core.database import get_sync_session
+    from app.services.refresh_scheduler import (
+        RefreshScheduler,
+        TickerActivity,
+        load_score_deltas,
+        reschedule,
+    )
 
-def _publish_sse_update(ticker, result):
-    """Push update to Redis pub/sub for SSE endpoint to pick up."""
+    with get_sync_session() as session:
+        deltas = load_score_deltas(session, ticker, settings.REFRESH_ACTIVITY_HISTORY)
+
+    scheduler = RefreshScheduler(
+        settings.REFRESH_MIN_INTERVAL_MINUTES, settings.REFRESH_MAX_INTERVAL_MINUTES
+    )
+    interval = scheduler.next_interval_minutes(TickerActivity(
+        score_deltas=deltas,
+        data_points=data_points,
+        sources_available=result.sources_available,
+        sources_total=result.sources_total,
+    ))
+    try:
+        reschedule(ticker, interval)
+    except Exception:
+        pass
+
+
+def _publish_sse_update(ticker, result, status="final", sources_pending=0, cycle_id=None):
+    """
+    Append the update to the capped SSE stream the API's score hubs read
+    (and replay to reconnecting clients), after dropping the ticker's cached
+    dashboard payloads. ``status`` is "partial" while sources are still
+    outstanding, "final" otherwise.
+    """
     from app.core.redis import get_sync_redis
+    from app.services.dashboard_cache import invalidate_dashboard_cache
+    from app.services.score_hub import LATEST_IDS_KEY, STREAM_KEY
+
+    invalidate_dashboard_cache(ticker)
 
     r = get_sync_redis()
     message = json.dumps({
@@ -108,6 +480,15 @@ def _publish_sse_update(ticker, result):
         "label": result.sentiment_label,
         "sources_available": result.sources_available,
         "source_breakdown": result.source_breakdown,
+        "status": status,
+        "sources_pending": sources_pending,
+        "cycle_id": cycle_id,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     })
-    r.publish("sentiment_updates", message)
+    entry_id = r.xadd(
+        STREAM_KEY,
+        {"ticker": ticker, "data": message},
+        maxlen=settings.SSE_STREAM_MAXLEN,
+        approximate=True,
+    )
+    r.hset(LATEST_IDS_KEY, ticker, entry_id)
@@ -1,8 +1,15 @@
 import asyncio
+import time
 import uuid
 from datetime import datetime, timezone
 
+from app.core.async_runtime import run_async
 from app.core.celery_app import celery_app
+from app.core.config import settings
+
+FANOUT_SOFT_TIME_LIMIT = 540
+# Kept back from the soft limit for writing and reporting the results
+FANOUT_RESERVE_SECONDS = 30
 
 
 @celery_app.task(
@@ -28,45 +35,166 @@ def fetch_source_for_stock(self, source_name: str, ticker: str, cycle_id: str) -
 
         adapter = get_adapter(source_name)
 
-        # Run async adapter in sync Celery context
-        loop = _get_or_create_event_loop()
-        result = loop.run_until_complete(adapter.fetch_sentiment(ticker))
+        # Run async adapter on the worker's shared event loop
+        result, waited = run_async(
+            _fetch_with_wait(adapter, ticker), timeout=settings.FETCH_TIMEOUT_SECONDS
+        )
+        _publish_worker_stats()
+        response_meta = {"rate_limit_wait_ms": int(waited * 1000)}
 
         if result is None:
-            _log_fetch(cycle_id, source_name, ticker, "no_data", started_at)
+            _log_fetch(
+                cycle_id, source_name, ticker, "no_data", started_at,
+                response_meta=response_meta,
+            )
+            _report_arrival(cycle_id, source_name, ticker, None)
             return None
 
         _persist_source_score(result)
         _log_fetch(
             cycle_id, source_name, ticker, "success", started_at,
             data_points=result.data_points,
+            response_meta=response_meta,
         )
 
-        return {
-            "source_name": result.source_name,
-            "ticker": result.ticker,
-            "normalized_score": str(result.normalized_score),
-            "data_points": result.data_points,
-            "fetched_at": result.fetched_at.isoformat(),
-        }
+        payload = _result_to_dict(result)
+        _report_arrival(cycle_id, source_name, ticker, payload)
+        return payload
 
     except Exception as exc:
         _log_fetch(cycle_id, source_name, ticker, "error", started_at, error=str(exc))
         try:
             raise self.retry(exc=exc)
         except self.MaxRetriesExceededError:
+            _report_arrival(cycle_id, source_name, ticker, None)
             return None
 
 
-def _get_or_create_event_loop() -> asyncio.AbstractEventLoop:
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            raise RuntimeError
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop
+@celery_app.task(
+    name="app.tasks.fetch_tasks.fetch_source_fanout",
+    bind=True,
+    # One task covers a whole source (or shard), paced by its rate limit.
+    soft_time_limit=FANOUT_SOFT_TIME_LIMIT,
+    time_limit=600,
+)
+def fetch_source_fanout(self, source_name: str, tickers: list[str], cycle_id: str) -> list[dict]:
+    """
+    Fetch sentiment from one source for many stocks inside a single event
+    loop: all tickers run concurrently under FETCH_FANOUT_CONCURRENCY and the
+    source's rate limiter. Failures are logged per ticker; returns the result
+    dicts for tickers that produced data.
+    """
+    _ensure_adapters_loaded()
+
+    from app.adapters.registry import get_adapter
+
+    adapter = get_adapter(source_name)
+
+    deadline = time.monotonic() + FANOUT_SOFT_TIME_LIMIT - FANOUT_RESERVE_SECONDS
+    outcomes = run_async(_fan_out(adapter, tickers, settings.FETCH_FANOUT_CONCURRENCY, deadline))
+    _publish_worker_stats()
+
+    payload = []
+    for ticker, started_at, completed_at, result, waited, error in outcomes:
+        response_meta = {"rate_limit_wait_ms": int(waited * 1000), "mode": "fanout"}
+        if error is not None:
+            _log_fetch(
+                cycle_id, source_name, ticker, "error", started_at,
+                error=error, response_meta=response_meta, completed_at=completed_at,
+            )
+            _report_arrival(cycle_id, source_name, ticker, None)
+            continue
+        if result is None:
+            _log_fetch(
+                cycle_id, source_name, ticker, "no_data", started_at,
+                response_meta=response_meta, completed_at=completed_at,
+            )
+            _report_arrival(cycle_id, source_name, ticker, None)
+            continue
+        try:
+            _persist_source_score(result)
+        except Exception as exc:
+            _log_fetch(
+                cycle_id, source_name, ticker, "error", started_at,
+                error=str(exc), completed_at=completed_at,
+            )
+            _report_arrival(cycle_id, source_name, ticker, None)
+            continue
+        _log_fetch(
+            cycle_id, source_name, ticker, "success", started_at,
+            data_points=result.data_points,
+            response_meta=response_meta,
+            completed_at=completed_at,
+        )
+        payload.append(_result_to_dict(result))
+        _report_arrival(cycle_id, source_name, ticker, payload[-1])
+    return payload
+
+
+async def _fan_out(
+    adapter, tickers: list[str], concurrency: int, deadline: float | None = None
+) -> list[tuple]:
+    """
+    Run fetch_sentiment for every ticker with at most `concurrency` requests
+    in flight. Returns (ticker, started_at, completed_at, result, waited,
+    error) per ticker, in input order.
+
+    With a ``deadline`` (time.monotonic()), each fetch may wait on the rate
+    limiter for whatever time is left before it, less one request timeout,
+    instead of RATE_LIMIT_MAX_WAIT_SECONDS: a slow source's tickers queue
+    for their slots rather than failing once the first few are taken.
+    """
+    from app.adapters.rate_limiter import rate_limit_budget, rate_limit_wait
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def fetch_one(ticker: str) -> tuple:
+        async with semaphore:
+            started_at = datetime.now(timezone.utc)
+            timeout = settings.FETCH_TIMEOUT_SECONDS
+            if deadline is not None:
+                budget = max(deadline - time.monotonic() - settings.FETCH_TIMEOUT_SECONDS, 0.0)
+                rate_limit_budget.set(budget)
+                timeout += budget
+            try:
+                result, waited = await asyncio.wait_for(_fetch_with_wait(adapter, ticker), timeout)
+                error = None
+            except asyncio.TimeoutError:
+                result, waited = None, rate_limit_wait.get()
+                error = f"Timed out after {timeout:.0f}s"
+            except Exception as exc:
+                result, waited, error = None, rate_limit_wait.get(), str(exc)
+            return ticker, started_at, datetime.now(timezone.utc), result, waited, error
+
+    return await asyncio.gather(*(fetch_one(t) for t in tickers))
+
+
+def _report_arrival(cycle_id: str, source_name: str, ticker: str, payload: dict | None):
+    """Hand a finished (source, ticker) to quorum aggregation."""
+    if not settings.AGGREGATION_QUORUM_ENABLED:
+        return
+    from app.tasks.aggregation_tasks import report_arrival
+
+    report_arrival(cycle_id, source_name, ticker, payload)
+
+
+def _result_to_dict(result) -> dict:
+    return {
+        "source_name": result.source_name,
+        "ticker": result.ticker,
+        "normalized_score": str(result.normalized_score),
+        "data_points": result.data_points,
+        "fetched_at": result.fetched_at.isoformat(),
+    }
+
+
+async def _fetch_with_wait(adapter, ticker: str):
+    """Run one adapter fetch and report how long it waited on rate limits."""
+    from app.adapters.rate_limiter import rate_limit_wait
+
+    rate_limit_wait.set(0.0)
+    result = await adapter.fetch_sentiment(ticker)
+    return result, rate_limit_wait.get()
 
 
 _adapters_loaded = False
@@ -93,48 +221,66 @@ def _ensure_adapters_loaded():
     _adapters_loaded = True
 
 
+def _publish_worker_stats():
+    """Report this worker's cache, HTTP connection and write buffer stats to Redis."""
+    from app.adapters.http_client import publish_connection_stats
+    from app.adapters.response_cache import publish_response_cache_stats
+    from app.core.write_buffer import publish_write_buffer_stats
+    from app.nlp.score_cache import publish_cache_stats
+
+    publish_cache_stats()
+    publish_response_cache_stats()
+    publish_connection_stats()
+    publish_write_buffer_stats()
+
+
 def _persist_source_score(result):
-    """Write the source score to the database."""
-    from app.core.database import get_sync_session
-    from app.models.source_score import SourceScore
-    from app.models.stock import Stock
-
-    with get_sync_session() as session:
-        stock = session.query(Stock).filter(Stock.ticker == result.ticker).first()
-        if not stock:
-            return
-        score = SourceScore(
-            stock_id=stock.id,
-            source_name=result.source_name,
-            raw_score=result.raw_score,
-            normalized_score=result.normalized_score,
-            data_points=result.data_points,
-            metadata_json=result.metadata,
-            fetched_at=result.fetched_at,
-        )
-        session.add(score)
-        session.commit()
+    """Write the source score, or queue it for the next write-buffer flush."""
+    from app.core.write_buffer import get_write_buffer, write_rows_now
+
+    if result.metadata.get("http_cache"):
+        # Reused from the response cache: stored when it was first fetched
+        return
+    row = {
+        "id": uuid.uuid4(),
+        "ticker": result.ticker,
+        "source_name": result.source_name,
+        "raw_score": result.raw_score,
+        "normalized_score": result.normalized_score,
+        "data_points": result.data_points,
+        "metadata_json": result.metadata,
+        "fetched_at": result.fetched_at,
+    }
+    if settings.WRITE_BUFFER_ENABLED:
+        get_write_buffer().add_source_score(row)
+    else:
+        write_rows_now(scores=[row])
 
 
-def _log_fetch(cycle_id, source_name, ticker, status, started_at, data_points=0, error=None):
-    """Write fetch log entry."""
-    from app.core.database import get_sync_session
-    from app.models.fetch_log import FetchLog
+def _log_fetch(
+    cycle_id, source_name, ticker, status, started_at,
+    data_points=0, error=None, response_meta=None, completed_at=None,
+):
+    """Write a fetch log entry, or queue it for the next write-buffer flush."""
+    from app.core.write_buffer import get_write_buffer, write_rows_now
 
-    completed_at = datetime.now(timezone.utc)
+    completed_at = completed_at or datetime.now(timezone.utc)
     duration_ms = int((completed_at - started_at).total_seconds() * 1000)
 
-    with get_sync_session() as session:
-        log = FetchLog(
-            cycle_id=uuid.UUID(cycle_id),
-            source_name=source_name,
-            stock_ticker=ticker,
-            status=status,
-            duration_ms=duration_ms,
-            data_points=data_points,
-            error_message=error,
-            started_at=started_at,
-            completed_at=completed_at,
-        )
-        session.add(log)
-        session.commit()
+    row = {
+        "id": uuid.uuid4(),
+        "cycle_id": uuid.UUID(cycle_id),
+        "source_name": source_name,
+        "stock_ticker": ticker,
+        "status": status,
+        "duration_ms": duration_ms,
+        "data_points": data_points,
+        "error_message": error,
+        "response_meta": response_meta or {},
+        "started_at": started_at,
+        "completed_at": completed_at,
+    }
+    if settings.WRITE_BUFFER_ENABLED:
+        get_write_buffer().add_fetch_log(row)
+    else:
+        write_rows_now(logs=[row])
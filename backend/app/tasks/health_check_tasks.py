@@ -10,7 +10,8 @@ def check_all_sources():
     from app.core.database import get_sync_session
     from app.models.source_config import SourceConfig
     from app.adapters.registry import get_adapter
-    from app.tasks.fetch_tasks import _ensure_adapters_loaded, _get_or_create_event_loop
+    from app.core.async_runtime import run_async
+    from app.tasks.fetch_tasks import _ensure_adapters_loaded
 
     _ensure_adapters_loaded()
 
@@ -18,12 +19,10 @@ def check_all_sources():
         configs = session.query(SourceConfig).filter(SourceConfig.is_enabled.is_(True)).all()
         results = {}
 
-        loop = _get_or_create_event_loop()
-
         for config in configs:
             try:
                 adapter = get_adapter(config.source_name)
-                is_healthy = loop.run_until_complete(adapter.health_check())
+                is_healthy = run_async(adapter.health_check())
                 if is_healthy:
                     config.last_healthy_at = datetime.now(timezone.utc)
                 results[config.source_name] = is_healthy
@@ -1,23 +1,55 @@
+import logging
 import uuid
 from datetime import datetime, timezone
 
 from celery import chord, group
 
 from app.core.celery_app import celery_app
-from app.tasks.fetch_tasks import fetch_source_for_stock
-from app.tasks.aggregation_tasks import aggregate_scores_for_stock
+from app.core.config import settings
+from app.tasks.fetch_tasks import fetch_source_fanout, fetch_source_for_stock
+from app.tasks.aggregation_tasks import aggregate_cycle, aggregate_scores_for_stock
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="app.tasks.orchestrator.schedule_due_refreshes")
+def schedule_due_refreshes():
+    """
+    Adaptive scheduler tick, run every REFRESH_TICK_SECONDS by Celery Beat.
+    Starts a sentiment cycle for the active tickers whose next refresh time
+    (set from their recent activity after each aggregation) has passed.
+    """
+    from app.core.database import get_sync_session
+    from app.models.stock import Stock
+    from app.services.refresh_scheduler import claim_due_tickers
+
+    with get_sync_session() as session:
+        active = [
+            t for (t,) in session.query(Stock.ticker).filter(Stock.is_active.is_(True)).all()
+        ]
+
+    due = claim_due_tickers(active, lease_minutes=settings.REFRESH_MAX_INTERVAL_MINUTES)
+    if not due:
+        return {"due": 0}
+
+    run_sentiment_cycle.delay(tickers=due)
+    return {"due": len(due), "active": len(active)}
 
 
 @celery_app.task(name="app.tasks.orchestrator.run_sentiment_cycle", bind=True)
-def run_sentiment_cycle(self):
+def run_sentiment_cycle(self, tickers: list[str] | None = None):
     """
-    Master orchestrator task. Runs every 15 minutes via Celery Beat.
+    Master orchestrator task. Runs every REFRESH_INTERVAL_MINUTES via Celery
+    Beat, or for the due subset of `tickers` under adaptive scheduling.
 
     Flow:
     1. Generate a unique cycle_id
     2. Get all active stocks and enabled sources from DB
-    3. For each stock: fan out fetch tasks for all sources (parallel via chord)
-    4. After all fetches complete: run aggregation (chord callback)
+    3. Plan the cycle against each source's rate limit and observed latency
+       (slow sources cover a round-robin slice of tickers)
+    4. For each stock: fan out fetch tasks for its planned sources (parallel
+       via chord), each scheduled at its slot in the plan
+    5. After all fetches complete: run aggregation (chord callback)
     """
     cycle_id = str(uuid.uuid4())
     started_at = datetime.now(timezone.utc).isoformat()
@@ -27,10 +59,25 @@ def run_sentiment_cycle(self):
     from app.models.source_config import SourceConfig
 
     with get_sync_session() as session:
-        active_stocks = session.query(Stock).filter(Stock.is_active.is_(True)).all()
+        stock_query = session.query(Stock).filter(Stock.is_active.is_(True))
+        if tickers is not None:
+            stock_query = stock_query.filter(Stock.ticker.in_(tickers))
+        active_stocks = stock_query.all()
         enabled_sources = session.query(SourceConfig).filter(SourceConfig.is_enabled.is_(True)).all()
         stock_tickers = [s.ticker for s in active_stocks]
         source_names = [s.source_name for s in enabled_sources]
+        source_limits = {
+            s.source_name: (s.rate_limit_rpm, (s.config_json or {}).get("burst"))
+            for s in enabled_sources
+        }
+
+        latencies = {}
+        if settings.FETCH_PLANNER_ENABLED and stock_tickers and source_names:
+            from app.services.fetch_planner import load_observed_latencies
+
+            latencies = load_observed_latencies(
+                session, settings.FETCH_PLANNER_LATENCY_WINDOW_HOURS
+            )
 
     if not stock_tickers or not source_names:
         return {
@@ -41,15 +88,58 @@ def run_sentiment_cycle(self):
             "status": "skipped_no_data",
         }
 
+    plan = None
+    if settings.FETCH_PLANNER_ENABLED:
+        plan = _plan_cycle(cycle_id, stock_tickers, source_limits, latencies)
+        assignments = {name: p.tickers for name, p in plan.sources.items()}
+    else:
+        assignments = {name: stock_tickers for name in source_names}
+
+    summary = {
+        "cycle_id": cycle_id,
+        "started_at": started_at,
+        "stocks": len(stock_tickers),
+        "sources": len(source_names),
+    }
+    if plan is not None:
+        summary["predicted_completion_at"] = plan.predicted_completion_at.isoformat()
+        summary["predicted_seconds"] = round(plan.predicted_seconds, 1)
+        summary["deferred"] = {
+            name: len(stock_tickers) - len(p.tickers)
+            for name, p in plan.sources.items()
+            if len(p.tickers) < len(stock_tickers)
+        }
+
+    if settings.FETCH_MODE == "fanout":
+        summary["mode"] = "fanout"
+        summary["fetch_tasks"] = _dispatch_fanout(cycle_id, assignments, plan)
+        return summary
+
+    # Quorum aggregation needs no per-ticker chords: one task per
+    # (source, ticker) pair, all sent as a single group.
+    if settings.AGGREGATION_QUORUM_ENABLED:
+        _dispatch_pairs(cycle_id, assignments, plan)
+        return summary
+
+    positions = {
+        name: {ticker: i for i, ticker in enumerate(tickers)}
+        for name, tickers in assignments.items()
+    }
     for ticker in stock_tickers:
         fetch_group = group(
-            fetch_source_for_stock.s(
-                source_name=source_name,
-                ticker=ticker,
-                cycle_id=cycle_id,
+            _scheduled(
+                fetch_source_for_stock.s(
+                    source_name=source_name,
+                    ticker=ticker,
+                    cycle_id=cycle_id,
+                ),
+                plan, source_name, index[ticker],
             )
-            for source_name in source_names
+            for source_name, index in positions.items()
+            if ticker in index
         )
+        if not fetch_group.tasks:
+            continue
 
         chord(fetch_group)(
             aggregate_scores_for_stock.s(
@@ -58,9 +148,141 @@ def run_sentiment_cycle(self):
             )
         )
 
-    return {
-        "cycle_id": cycle_id,
-        "started_at": started_at,
-        "stocks": len(stock_tickers),
-        "sources": len(source_names),
+    return summary
+
+
+def _plan_cycle(cycle_id, tickers, source_limits, latencies):
+    """Build, persist and log the rate-limit-aware plan for this cycle."""
+    from app.services.fetch_planner import (
+        FetchPlanner,
+        SourceLimits,
+        load_cursors,
+        save_plan,
+    )
+
+    # Under adaptive scheduling a new dispatch can start every tick.
+    if settings.ADAPTIVE_REFRESH_ENABLED:
+        cycle_seconds = settings.REFRESH_TICK_SECONDS
+    else:
+        cycle_seconds = settings.REFRESH_INTERVAL_MINUTES * 60
+    planner = FetchPlanner(
+        cycle_seconds=cycle_seconds,
+        utilization=settings.FETCH_PLANNER_UTILIZATION,
+        concurrency=settings.FETCH_FANOUT_CONCURRENCY,
+    )
+    sources = [
+        SourceLimits(
+            source_name=name,
+            rpm=rpm,
+            burst=int(burst or rpm),
+            latency_seconds=latencies.get(name, settings.FETCH_PLANNER_DEFAULT_LATENCY_SECONDS),
+        )
+        for name, (rpm, burst) in source_limits.items()
+    ]
+    plan = planner.plan(tickers, sources, load_cursors())
+    save_plan(plan, cycle_id)
+    logger.info(
+        "Cycle %s planned: %d sources, predicted completion %s (%.0fs)",
+        cycle_id, len(plan.sources), plan.predicted_completion_at.isoformat(),
+        plan.predicted_seconds,
+    )
+    return plan
+
+
+def _scheduled(signature, plan, source_name: str, request_index: int):
+    """Delay a fetch until its slot in the plan so it does not hold a worker."""
+    offset = _request_offset(plan, source_name, request_index)
+    return signature.set(countdown=offset) if offset > 0 else signature
+
+
+def _request_offset(plan, source_name: str, request_index: int) -> float:
+    if plan is None or source_name not in plan.sources:
+        return 0.0
+    return plan.sources[source_name].request_offset(request_index)
+
+
+def _predicted_seconds(plan, source_name: str) -> float:
+    if plan is None or source_name not in plan.sources:
+        return 0.0
+    return plan.sources[source_name].predicted_seconds
+
+
+def _dispatch_pairs(cycle_id: str, assignments: dict[str, list[str]], plan=None):
+    """The whole cycle as one group of per-(source, ticker) fetch tasks."""
+    header = []
+    deadlines: dict[str, float] = {}
+    for source_name, tickers in assignments.items():
+        for i, ticker in enumerate(tickers):
+            offset = _request_offset(plan, source_name, i)
+            deadlines[ticker] = max(deadlines.get(ticker, 0.0), offset)
+            header.append(_scheduled(
+                fetch_source_for_stock.s(
+                    source_name=source_name,
+                    ticker=ticker,
+                    cycle_id=cycle_id,
+                ),
+                plan, source_name, i,
+            ))
+
+    _launch(cycle_id, header, assignments, deadlines)
+
+
+def _dispatch_fanout(cycle_id: str, assignments: dict[str, list[str]], plan=None) -> int:
+    """
+    One chord for the whole cycle with one fetch task per source (or per
+    shard of FETCH_FANOUT_SHARD_SIZE tickers). Returns the header size.
+    """
+    header = []
+    deadlines: dict[str, float] = {}
+    for source_name, tickers in assignments.items():
+        # Fan-out tasks pace themselves, so the plan's estimate is the offset.
+        finish = _predicted_seconds(plan, source_name)
+        for ticker in tickers:
+            deadlines[ticker] = max(deadlines.get(ticker, 0.0), finish)
+
+        shard_size = settings.FETCH_FANOUT_SHARD_SIZE or len(tickers) or 1
+        header.extend(
+            fetch_source_fanout.s(
+                source_name=source_name,
+                tickers=tickers[i:i + shard_size],
+                cycle_id=cycle_id,
+            )
+            for i in range(0, len(tickers), shard_size)
+        )
+
+    _launch(cycle_id, header, assignments, deadlines)
+    return len(header)
+
+
+def _launch(cycle_id: str, header: list, assignments: dict[str, list[str]], offsets: dict[str, float]):
+    """
+    Send the cycle's fetch tasks. With quorum aggregation they go out as a
+    plain group and each ticker's running aggregate is updated as its
+    sources report, closing at the latest FETCH_TIMEOUT_SECONDS after its
+    last planned request; nothing reads the fetch results back, so they are
+    not stored in the result backend. Otherwise a chord waits for every
+    fetch before aggregate_cycle runs.
+    """
+    if not settings.AGGREGATION_QUORUM_ENABLED:
+        chord(group(header))(
+            aggregate_cycle.s(tickers=_covered(assignments), cycle_id=cycle_id)
+        )
+        return
+
+    from app.tasks.aggregation_tasks import start_quorum_tracking
+
+    expected: dict[str, int] = {}
+    for tickers in assignments.values():
+        for ticker in tickers:
+            expected[ticker] = expected.get(ticker, 0) + 1
+    deadlines = {
+        ticker: offsets.get(ticker, 0.0) + settings.FETCH_TIMEOUT_SECONDS
+        for ticker in expected
     }
+    start_quorum_tracking(cycle_id, expected, deadlines)
+    group(sig.set(ignore_result=True) for sig in header).apply_async()
+
+
+def _covered(assignments: dict[str, list[str]]) -> list[str]:
+    """Tickers fetched by at least one source this cycle."""
+    return list(dict.fromkeys(t for tickers in assignments.values() for t in tickers))
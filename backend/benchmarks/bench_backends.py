@@ -0,0 +1,99 @@
+"""
+Throughput/latency benchmark: VADER vs the FinBERT CPU backend on the same
+corpus, with concurrent callers exercising FinBERT's micro-batching.
+
+Requires requirements-finbert.txt for the FinBERT half.
+
+Usage (from backend/):
+    python -m benchmarks.bench_backends --texts 2000 --callers 8 --request-size 25
+    python -m benchmarks.bench_backends --model-path /models/finbert-onnx
+    python -m benchmarks.bench_backends --quantize
+"""
+import argparse
+import statistics
+import threading
+import time
+
+from app.core.config import settings
+from app.nlp.backends import SentimentBackend, VaderBackend
+from benchmarks.bench_batch_score import build_corpus
+
+
+def measure(backend: SentimentBackend, corpus: list[str], callers: int, request_size: int) -> dict:
+    requests = [corpus[i:i + request_size] for i in range(0, len(corpus), request_size)]
+    latencies: list[float] = []
+    lock = threading.Lock()
+    cursor = iter(requests)
+
+    def caller():
+        while True:
+            with lock:
+                texts = next(cursor, None)
+            if texts is None:
+                return
+            start = time.perf_counter()
+            backend.score_batch(texts)
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    backend.score_batch(corpus[:request_size])  # warm-up
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=caller) for _ in range(callers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "texts_per_sec": len(corpus) / wall,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "wall_s": wall,
+    }
+
+
+def report(name: str, stats: dict) -> None:
+    print(
+        f"{name:<10} {stats['texts_per_sec']:>12,.0f} texts/sec"
+        f"  p50 {stats['p50_ms']:8.1f} ms  p95 {stats['p95_ms']:8.1f} ms"
+        f"  wall {stats['wall_s']:6.2f} s"
+    )
+
+
+def run(args) -> None:
+    corpus = build_corpus(args.texts)
+    print(f"corpus: {len(corpus)} texts, {args.callers} callers x {args.request_size} texts/request")
+
+    report("vader", measure(VaderBackend(), corpus, args.callers, args.request_size))
+
+    from app.nlp.finbert import FinBertBackend
+
+    finbert = FinBertBackend(
+        model_path=args.model_path,
+        quantize=args.quantize,
+        max_length=settings.FINBERT_MAX_LENGTH,
+        num_threads=settings.FINBERT_NUM_THREADS,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+        queue_size=settings.FINBERT_QUEUE_SIZE,
+    )
+    try:
+        report("finbert", measure(finbert, corpus, args.callers, args.request_size))
+    finally:
+        finbert.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--callers", type=int, default=8)
+    parser.add_argument("--request-size", type=int, default=25)
+    parser.add_argument("--model-path", default=settings.FINBERT_MODEL_PATH)
+    parser.add_argument("--quantize", action="store_true", default=settings.FINBERT_QUANTIZE)
+    parser.add_argument("--max-batch-size", type=int, default=settings.FINBERT_MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=settings.FINBERT_MAX_WAIT_MS)
+    run(parser.parse_args())
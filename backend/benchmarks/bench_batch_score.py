@@ -0,0 +1,74 @@
+"""
+Texts/sec benchmark: vectorized SentimentAnalyzer.batch_score vs the
+per-text score() path.
+
+Usage (from backend/):
+    python -m benchmarks.bench_batch_score --texts 1100 --rounds 5
+"""
+import argparse
+import random
+import time
+
+from app.nlp.backends import VaderBackend
+from app.nlp.sentiment_analyzer import SentimentAnalyzer
+
+HEADLINES = [
+    "{t} beats earnings expectations, shares surge after hours",
+    "{t} misses revenue estimates as guidance disappoints investors",
+    "Analysts upgrade {t} citing strong demand and margin expansion",
+    "Is {t} overvalued? Bears warn of a painful correction",
+    "{t} announces buyback program, stock rallies",
+    "Regulators open probe into {t} accounting practices",
+    "{t} to the moon!!! diamond hands 🚀",
+    "Not sure about {t}, the chart looks kind of weak but volume is great",
+    "Sold my {t} calls today, terrible timing https://example.com/post/123",
+    "{t} CEO says outlook remains solid despite macro headwinds",
+]
+
+
+def build_corpus(size: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    tickers = ["AAPL", "TSLA", "GME", "NVDA", "MSFT", "AMC"]
+    return [rng.choice(HEADLINES).format(t=rng.choice(tickers)) for _ in range(size)]
+
+
+def run(texts_count: int, rounds: int) -> None:
+    # Score through the backend directly so the sentiment cache stays out
+    # of the measurement.
+    backend = VaderBackend()
+    preprocess = SentimentAnalyzer._preprocess
+    corpus = build_corpus(texts_count)
+
+    def per_text_path() -> list[float]:
+        return [backend.score_one(preprocess(t)) for t in corpus]
+
+    def batch_path() -> list[float]:
+        return backend.score_batch([preprocess(t) for t in corpus])
+
+    per_text = per_text_path()
+    batched = batch_path()
+    assert per_text == batched, "batch engine diverged from per-text scores"
+
+    def best_of(fn) -> float:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    loop_s = best_of(per_text_path)
+    batch_s = best_of(batch_path)
+
+    print(f"texts:       {texts_count}")
+    print(f"per-text:    {texts_count / loop_s:12,.0f} texts/sec")
+    print(f"batch:       {texts_count / batch_s:12,.0f} texts/sec")
+    print(f"speedup:     {loop_s / batch_s:12.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=1100)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    run(args.texts, args.rounds)
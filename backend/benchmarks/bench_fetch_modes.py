@@ -0,0 +1,175 @@
+"""
+Compare the two fetch execution modes of run_sentiment_cycle:
+
+- chord:  one Celery task per (source, ticker), one chord per ticker
+- fanout: one Celery task per source (shard), tickers gathered in one loop
+
+Broker traffic is measured by capturing the canvases the orchestrator would
+send and serializing every task message and result with the app's JSON
+serializer. Wall time runs the same fetch code paths against a synthetic
+adapter with configurable latency on a pool of `--concurrency` worker
+threads, each standing in for a prefork child; `--task-overhead-ms` adds
+the per-task broker round trip (publish, ack, result store).
+
+Usage (from backend/):
+    python -m benchmarks.bench_fetch_modes --tickers 100 --sources 13
+    python -m benchmarks.bench_fetch_modes --latency-ms 250 --concurrency 8
+"""
+import argparse
+import asyncio
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+
+from kombu.serialization import dumps
+
+from app.adapters.base import AbstractSourceAdapter, RawSentimentData
+from app.tasks import orchestrator
+from app.tasks.fetch_tasks import _fan_out, _fetch_with_wait
+
+
+class SyntheticAdapter(AbstractSourceAdapter):
+    category = "synthetic"
+
+    def __init__(self, source_name: str, latency_s: float, jitter: float):
+        self.source_name = source_name
+        self._latency = latency_s
+        self._jitter = jitter
+
+    async def fetch_sentiment(self, ticker: str) -> RawSentimentData | None:
+        await asyncio.sleep(self._latency * random.uniform(1 - self._jitter, 1 + self._jitter))
+        return RawSentimentData(
+            source_name=self.source_name,
+            ticker=ticker,
+            raw_score=Decimal("0.1"),
+            normalized_score=Decimal("0.1"),
+            data_points=10,
+            fetched_at=datetime.now(timezone.utc),
+        )
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def capture_dispatch(mode: str, tickers: list[str], sources: list[str]) -> list:
+    """Return every signature the orchestrator would publish for one cycle."""
+    sent = []
+
+    def fake_chord(header):
+        sent.extend(header.tasks)
+        return lambda callback: sent.append(callback)
+
+    cycle_id = str(uuid.uuid4())
+    with mock.patch.object(orchestrator, "chord", fake_chord), \
+            mock.patch.object(orchestrator.settings, "AGGREGATION_QUORUM_ENABLED", False):
+        if mode == "fanout":
+            orchestrator._dispatch_fanout(cycle_id, {s: tickers for s in sources})
+        else:
+            for ticker in tickers:
+                header = orchestrator.group(
+                    orchestrator.fetch_source_for_stock.s(
+                        source_name=s, ticker=ticker, cycle_id=cycle_id
+                    )
+                    for s in sources
+                )
+                orchestrator.chord(header)(
+                    orchestrator.aggregate_scores_for_stock.s(ticker=ticker, cycle_id=cycle_id)
+                )
+    return sent
+
+
+def broker_traffic(mode: str, tickers: list[str], sources: list[str]) -> dict:
+    sent = capture_dispatch(mode, tickers, sources)
+    result = {
+        "source_name": sources[0], "ticker": tickers[0], "normalized_score": "0.1",
+        "data_points": 10, "fetched_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    messages = len(sent)
+    payload = sum(len(dumps([s.args, s.kwargs, {}], "json")[2]) for s in sent)
+    if mode == "fanout":
+        # aggregate_cycle republishes one aggregate_scores_for_stock per ticker.
+        per_source = [result] * len(tickers)
+        results_bytes = len(sources) * len(dumps(per_source, "json")[2])
+        messages += len(tickers)
+        payload += len(tickers) * len(dumps([[result] * len(sources)], "json")[2])
+    else:
+        results_bytes = len(tickers) * len(sources) * len(dumps(result, "json")[2])
+
+    return {"messages": messages, "message_bytes": payload, "result_bytes": results_bytes}
+
+
+def run_pool(jobs: list, concurrency: int, overhead_s: float) -> float:
+    lock = threading.Lock()
+    cursor = iter(jobs)
+
+    def worker():
+        while True:
+            with lock:
+                job = next(cursor, None)
+            if job is None:
+                return
+            time.sleep(overhead_s)
+            job()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+
+def wall_time(mode: str, adapters: list, tickers: list[str], args) -> float:
+    overhead = args.task_overhead_ms / 1000
+
+    if mode == "fanout":
+        def job(adapter):
+            return lambda: asyncio.run(_fan_out(adapter, tickers, args.fanout_concurrency))
+        jobs = [job(a) for a in adapters]
+    else:
+        def job(adapter, ticker):
+            return lambda: asyncio.run(_fetch_with_wait(adapter, ticker))
+        jobs = [job(a, t) for t in tickers for a in adapters]
+
+    return run_pool(jobs, args.concurrency, overhead)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--sources", type=int, default=13)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--jitter", type=float, default=0.5)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--fanout-concurrency", type=int, default=16)
+    parser.add_argument("--task-overhead-ms", type=float, default=4.0)
+    args = parser.parse_args()
+
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+    sources = [f"source_{i:02d}" for i in range(args.sources)]
+    adapters = [SyntheticAdapter(s, args.latency_ms / 1000, args.jitter) for s in sources]
+
+    print(
+        f"{args.tickers} tickers x {args.sources} sources, "
+        f"{args.latency_ms:.0f} ms +/- {args.jitter:.0%} latency, "
+        f"{args.concurrency} worker slots"
+    )
+    for mode in ("chord", "fanout"):
+        traffic = broker_traffic(mode, tickers, sources)
+        wall = wall_time(mode, adapters, tickers, args)
+        print(
+            f"{mode:>7}: {traffic['messages']:>6} messages  "
+            f"{traffic['message_bytes'] / 1024:>8.1f} KiB sent  "
+            f"{traffic['result_bytes'] / 1024:>8.1f} KiB results  "
+            f"wall {wall:>7.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
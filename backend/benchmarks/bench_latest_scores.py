@@ -0,0 +1,157 @@
+"""
+p95 latency of the "latest score per stock" read behind /scores/summary and
+/dashboard/overview, at several stock counts:
+
+- n_plus_one:  the old loop, one ORDER BY computed_at DESC LIMIT 1 per stock
+- distinct_on: one DISTINCT ON (stock_id) query over aggregate_scores
+- lateral:     one LATERAL ... LIMIT 1 join over aggregate_scores
+- table:       one join against latest_aggregate_scores
+
+Needs a PostgreSQL database. Every run builds its data in a throwaway schema
+(--schema, dropped afterwards) with the same index as migration 001, so the
+application tables are not touched.
+
+Usage (from backend/):
+    python -m benchmarks.bench_latest_scores --stocks 100 1000 5000
+    python -m benchmarks.bench_latest_scores --history 96 --requests 50
+    python -m benchmarks.bench_latest_scores --database-url postgresql+asyncpg://...
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import desc, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.models.aggregate_score import AggregateScore
+from app.models.base import Base
+from app.models.latest_aggregate_score import LatestAggregateScore
+from app.models.stock import Stock
+from app.services.latest_scores import fetch_latest_scores
+
+STRATEGIES = ("n_plus_one", "distinct_on", "lateral", "table")
+TABLES = [Stock.__table__, AggregateScore.__table__, LatestAggregateScore.__table__]
+
+
+async def populate(engine, stocks: int, history: int):
+    """`stocks` active stocks with `history` aggregate scores each, 15 min apart."""
+    now = datetime.now(timezone.utc)
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.drop_all(c, tables=TABLES))
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=TABLES))
+        await conn.execute(text(
+            "CREATE INDEX idx_aggregate_scores_stock_time "
+            "ON aggregate_scores (stock_id, computed_at DESC)"
+        ))
+
+        stock_rows = [
+            {"id": uuid.uuid4(), "ticker": f"T{i:05d}", "company_name": f"Company {i}", "is_active": True}
+            for i in range(stocks)
+        ]
+        await conn.execute(insert(Stock), stock_rows)
+
+        latest_rows = []
+        for stock in stock_rows:
+            rows = []
+            previous = None
+            for h in range(history):
+                score = round(random.uniform(-1, 1), 6)
+                rows.append({
+                    "id": uuid.uuid4(),
+                    "stock_id": stock["id"],
+                    "score": score,
+                    "confidence": round(random.random(), 4),
+                    "sources_available": 13,
+                    "sources_total": 13,
+                    "source_breakdown": {},
+                    "weight_breakdown": {},
+                    "sentiment_label": "neutral",
+                    "previous_score": previous,
+                    "score_delta": None if previous is None else round(score - previous, 6),
+                    "computed_at": now - timedelta(minutes=15 * (history - h)),
+                })
+                previous = score
+            await conn.execute(insert(AggregateScore), rows)
+            last = dict(rows[-1])
+            last["aggregate_score_id"] = last.pop("id")
+            latest_rows.append(last)
+        await conn.execute(insert(LatestAggregateScore), latest_rows)
+        await conn.execute(text("ANALYZE"))
+
+
+async def n_plus_one(db: AsyncSession) -> list:
+    stocks = (await db.execute(
+        select(Stock).filter(Stock.is_active.is_(True)).order_by(Stock.ticker)
+    )).scalars().all()
+    rows = []
+    for stock in stocks:
+        latest = (await db.execute(
+            select(AggregateScore)
+            .filter(AggregateScore.stock_id == stock.id)
+            .order_by(desc(AggregateScore.computed_at))
+            .limit(1)
+        )).scalar_one_or_none()
+        rows.append((stock.ticker, latest))
+    return rows
+
+
+async def measure(engine, strategy: str, requests: int) -> list[float]:
+    latencies = []
+    for i in range(requests + 1):
+        async with AsyncSession(engine) as db:
+            start = time.perf_counter()
+            if strategy == "n_plus_one":
+                await n_plus_one(db)
+            else:
+                await fetch_latest_scores(db, strategy=strategy)
+            elapsed = time.perf_counter() - start
+        if i:  # first request warms caches and the connection
+            latencies.append(elapsed)
+    return latencies
+
+
+def p95(values: list[float]) -> float:
+    return statistics.quantiles(values, n=20)[-1] if len(values) > 1 else values[0]
+
+
+async def run(args):
+    engine = create_async_engine(
+        args.database_url,
+        connect_args={"server_settings": {"search_path": args.schema}},
+    )
+    async with engine.begin() as conn:
+        await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{args.schema}"'))
+    try:
+        print(f"{args.history} scores per stock, {args.requests} requests per cell")
+        print(f"{'stocks':>7}" + "".join(f"{s:>14}" for s in STRATEGIES) + "   (p95 ms)")
+        for count in args.stocks:
+            await populate(engine, count, args.history)
+            cells = []
+            for strategy in STRATEGIES:
+                requests = max(args.requests // 10, 3) if strategy == "n_plus_one" else args.requests
+                cells.append(p95(await measure(engine, strategy, requests)) * 1000)
+            print(f"{count:>7}" + "".join(f"{c:>14.1f}" for c in cells))
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f'DROP SCHEMA IF EXISTS "{args.schema}" CASCADE'))
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stocks", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--history", type=int, default=48, help="aggregate scores per stock")
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--schema", default="bench_latest_scores")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
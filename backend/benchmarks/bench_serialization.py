@@ -0,0 +1,112 @@
+"""
+Serialization time and bytes on the wire of /historical/{ticker} bodies, per
+response format:
+
+- json:    what FastAPI does with the endpoint's dict (jsonable_encoder +
+           JSONResponse rendering)
+- msgpack: columnar msgpack (application/x-msgpack)
+- arrow:   Arrow IPC stream (application/vnd.apache.arrow.stream)
+
+Runs on synthetic rows shaped like the endpoint's query results, so no
+database is needed. The largest default case is the worst one the endpoint
+serves: limit=5000 with include_sources=true (5000 * 13 source rows).
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --points 500 5000 --sources-per-point 13
+"""
+import argparse
+import gzip
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api.formats import ARROW, MSGPACK, columnar_response
+from app.api.v1.endpoints.historical import HISTORY_COLUMNS, SOURCE_COLUMNS, history_json
+
+SOURCES = [
+    "alpha_vantage", "finnhub", "gdelt", "google_trends", "hackernews", "mediastack",
+    "newsapi", "polymarket", "quiver_quant", "reddit", "stocktwits", "swaggy_stocks",
+    "yahoo_finance",
+]
+LABELS = ["very_bearish", "bearish", "neutral", "bullish", "very_bullish"]
+
+
+def make_tables(points: int, sources_per_point: int) -> tuple[dict, dict]:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    start = now - timedelta(hours=points)
+    meta = {
+        "ticker": "AAPL",
+        "from": start.isoformat(),
+        "to": now.isoformat(),
+        "resolution": "1h",
+    }
+    history = []
+    for i in range(points):
+        score = round(random.uniform(-1, 1), 6)
+        history.append((
+            start + timedelta(hours=i),
+            score,
+            round(random.random(), 4),
+            random.choice(LABELS),
+            random.randint(1, len(SOURCES)),
+            round(score - random.random() / 10, 6),
+            round(score + random.random() / 10, 6),
+            score,
+            random.randint(1, 4),
+        ))
+    source_rows = [
+        (
+            start + timedelta(hours=i, seconds=j),
+            SOURCES[j % len(SOURCES)],
+            round(random.uniform(-1, 1), 6),
+            random.randint(0, 500),
+        )
+        for i in range(points)
+        for j in range(sources_per_point)
+    ]
+    return meta, {"data": (HISTORY_COLUMNS, history), "source_data": (SOURCE_COLUMNS, source_rows)}
+
+
+def encode(fmt: str, meta: dict, tables: dict) -> bytes:
+    if fmt == "json":
+        return JSONResponse(jsonable_encoder(history_json(meta, tables))).body
+    return columnar_response(ARROW if fmt == "arrow" else MSGPACK, meta, tables).body
+
+
+def measure(fmt: str, meta: dict, tables: dict, repeat: int) -> tuple[float, bytes]:
+    body = encode(fmt, meta, tables)  # warm-up (imports, allocator)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = encode(fmt, meta, tables)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, nargs="+", default=[500, 5000])
+    parser.add_argument("--sources-per-point", type=int, default=13)
+    parser.add_argument("--formats", nargs="+", default=["json", "msgpack", "arrow"])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'points':>7} {'rows':>7} {'format':>8} {'median ms':>10} {'bytes':>11} {'gzip bytes':>11}")
+    for points in args.points:
+        meta, tables = make_tables(points, args.sources_per_point)
+        rows = points * (1 + args.sources_per_point)
+        for fmt in args.formats:
+            elapsed, body = measure(fmt, meta, tables, args.repeat)
+            print(
+                f"{points:>7} {rows:>7} {fmt:>8} {elapsed * 1000:>10.1f} "
+                f"{len(body):>11,} {len(gzip.compress(body)):>11,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import fakeredis
+import pytest
+
+
+@pytest.fixture
+def redis_server():
+    """One in-memory Redis server shared by sync_redis and async_redis."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def sync_redis(monkeypatch, redis_server):
+    """In-memory Redis (with Lua scripting) behind app.core.redis.get_sync_redis()."""
+    import app.core.redis
+
+    client = fakeredis.FakeRedis(server=redis_server, decode_responses=True)
+    monkeypatch.setattr(app.core.redis, "_sync_client", client)
+    yield client
+    client.flushall()
+
+
+@pytest.fixture
+def async_redis(monkeypatch, redis_server):
+    """In-memory Redis behind app.core.redis.get_redis()."""
+    import app.core.redis
+
+    client = fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True)
+    monkeypatch.setattr(app.core.redis, "_async_pool", client)
+    return client
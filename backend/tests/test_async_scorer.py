@@ -0,0 +1,21 @@
+import billiard.pool
+
+from app.core.config import settings
+from app.nlp.async_scorer import AsyncSentimentScorer
+
+
+def uses_processes(_) -> bool:
+    return AsyncSentimentScorer(max_workers=2)._use_processes
+
+
+def test_prefork_child_scores_on_threads(monkeypatch):
+    monkeypatch.setattr(settings, "USE_FINBERT", False)
+    assert uses_processes(None)
+
+    # Celery's prefork pool runs tasks in billiard worker processes
+    pool = billiard.pool.Pool(1)
+    try:
+        assert pool.map(uses_processes, [None]) == [False]
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,52 @@
+import pytest
+
+from app.services.fetch_planner import FetchPlanner, SourceLimits
+
+TICKERS = [f"T{i}" for i in range(10)]
+
+
+@pytest.fixture
+def planner():
+    # A 50 second usable window, two requests in flight per source
+    return FetchPlanner(cycle_seconds=100, utilization=0.5, concurrency=2)
+
+
+@pytest.mark.parametrize(
+    "rpm, burst, latency, budget",
+    [
+        (60, 5, 1.0, 54),  # Rate bound: burst, then one per second after the first response
+        (600, 10, 5.0, 20),  # Latency bound: two in flight, ten rounds of five seconds
+        (1, 0, 60.0, 1),  # Always at least one request
+        (0, 5, 1.0, 0),  # Disabled source
+    ],
+)
+def test_request_budget(planner, rpm, burst, latency, budget):
+    assert planner._request_budget(SourceLimits("src", rpm, burst, latency)) == budget
+
+
+def test_offsets_follow_the_token_bucket():
+    source = SourceLimits("src", rpm=30, burst=2, latency_seconds=0.5)
+    assert [FetchPlanner._offset(source, i) for i in range(5)] == [0.0, 0.0, 2.0, 4.0, 6.0]
+
+
+def test_slow_source_rotates_through_tickers(planner):
+    slow = SourceLimits("slow", rpm=6, burst=0, latency_seconds=1.0)
+    fast = SourceLimits("fast", rpm=600, burst=100, latency_seconds=0.1)
+
+    plan = planner.plan(TICKERS, [slow, fast], cursors={"slow": 8})
+    assert plan.sources["fast"].tickers == TICKERS
+    assert plan.sources["fast"].coverage == 1.0
+    assert plan.cursors["fast"] == 0
+
+    # Budget of 4 (burst 0, then a slot every 10s in 49s) from the cursor on, wrapping
+    slow_plan = plan.sources["slow"]
+    assert slow_plan.tickers == ["T8", "T9", "T0", "T1"]
+    assert slow_plan.offsets == [10.0, 20.0, 30.0, 40.0]
+    assert slow_plan.predicted_seconds == 41.0
+    assert slow_plan.coverage == 0.4
+    assert slow_plan.cycles_for_full_coverage == 3
+    assert plan.cursors["slow"] == 2
+    assert plan.predicted_seconds == 41.0
+
+    following = planner.plan(TICKERS, [slow], cursors=plan.cursors)
+    assert following.sources["slow"].tickers == ["T2", "T3", "T4", "T5"]
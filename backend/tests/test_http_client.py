@@ -0,0 +1,27 @@
+import httpx
+
+from app.adapters import http_client
+from app.core.config import settings
+
+
+def uses_http2(client: httpx.AsyncClient, url: str) -> bool:
+    return client._transport_for_url(httpx.URL(url))._pool._http2
+
+
+def test_http2_only_for_listed_hosts(monkeypatch):
+    monkeypatch.setattr(settings, "HTTP2_HOSTS", ["h2.example.com", "*.news.example"])
+    monkeypatch.setattr(http_client, "_http2_available", lambda: True)
+    monkeypatch.setattr(http_client, "_client", None)
+
+    client = http_client.get_http_client()
+    assert uses_http2(client, "https://h2.example.com/v1/quote")
+    assert uses_http2(client, "https://api.news.example/v2/everything")
+    assert not uses_http2(client, "https://legacy.example.com/query")
+
+
+def test_http1_everywhere_by_default(monkeypatch):
+    monkeypatch.setattr(settings, "HTTP2_HOSTS", [])
+    monkeypatch.setattr(http_client, "_client", None)
+
+    client = http_client.get_http_client()
+    assert not uses_http2(client, "https://h2.example.com/v1/quote")
@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+from app.nlp.finbert import BackendClosedError, MicroBatcher
+
+
+class GatedModel:
+    """Scores each text as its length; every batch waits for ``gate``."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.batches: list[list[str]] = []
+
+    def __call__(self, texts: list[str]) -> list[float]:
+        self.started.set()
+        self.gate.wait(5)
+        self.batches.append(texts)
+        return [float(len(t)) for t in texts]
+
+
+def test_concurrent_requests_share_bounded_batches():
+    model = GatedModel()
+    batcher = MicroBatcher(model, max_batch_size=4, max_wait_ms=50)
+    try:
+        first = batcher.submit(["a"])
+        assert model.started.wait(5)
+        # Queued while the first batch runs: coalesced, but never past four texts
+        futures = [batcher.submit(["bb", "ccc"]), batcher.submit(["dddd"]), batcher.submit(["e", "ff"])]
+        model.gate.set()
+
+        assert first.result(5) == [1.0]
+        assert [f.result(5) for f in futures] == [[2.0, 3.0], [4.0], [1.0, 2.0]]
+        assert model.batches == [["a"], ["bb", "ccc", "dddd"], ["e", "ff"]]
+        assert batcher.batches_run == 3
+        assert batcher.texts_scored == 6
+    finally:
+        batcher.close()
+
+
+def test_inference_error_fails_every_request_in_the_batch():
+    def broken(texts):
+        raise RuntimeError("model crashed")
+
+    batcher = MicroBatcher(broken, max_batch_size=8, max_wait_ms=50)
+    try:
+        futures = [batcher.submit(["a"]), batcher.submit(["b"])]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="model crashed"):
+                future.result(5)
+    finally:
+        batcher.close()
+
+
+def test_close_fails_requests_left_in_the_queue():
+    model = GatedModel()
+    batcher = MicroBatcher(model, max_batch_size=1, max_wait_ms=0)
+    running = batcher.submit(["a"])
+    assert model.started.wait(5)
+    waiting = batcher.submit(["b"])
+
+    closer = threading.Thread(target=batcher.close)
+    closer.start()
+    assert batcher._closed.wait(5)
+    model.gate.set()
+    closer.join(5)
+
+    assert running.result(5) == [1.0]
+    with pytest.raises(BackendClosedError):
+        waiting.result(5)
+    with pytest.raises(BackendClosedError):
+        batcher.submit(["c"])
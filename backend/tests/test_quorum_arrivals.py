@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.adapters.base import RawSentimentData
+from app.core.config import settings
+from app.services.scoring_service import ScoringService
+from app.tasks import aggregation_tasks
+from app.tasks.aggregation_tasks import ARRIVALS_KEY, report_arrival
+
+WEIGHTS = {"finnhub": 1.5, "newsapi": 1.0, "reddit": 0.8, "stocktwits": 0.7}
+CYCLE = "cycle-1"
+KEY = ARRIVALS_KEY.format(cycle_id=CYCLE, ticker="AAPL")
+
+
+@pytest.fixture
+def published(sync_redis, monkeypatch):
+    """Track AAPL's four sources with a quorum of two; returns the publish calls."""
+    calls = []
+    monkeypatch.setattr(settings, "AGGREGATION_QUORUM", 0.5)
+    monkeypatch.setattr(aggregation_tasks, "_weight_config", lambda: WEIGHTS)
+    monkeypatch.setattr(
+        aggregation_tasks, "publish_running_score",
+        lambda ticker, cycle_id: calls.append((ticker, cycle_id)),
+    )
+    monkeypatch.setattr(aggregation_tasks.finalize_at_deadline, "apply_async", lambda **kwargs: None)
+    aggregation_tasks.start_quorum_tracking(CYCLE, {"AAPL": len(WEIGHTS)}, {"AAPL": 60.0})
+    return calls
+
+
+def result(score: str, data_points: int) -> dict:
+    return {"normalized_score": score, "data_points": data_points}
+
+
+def test_duplicate_partial_and_final_arrivals(sync_redis, published):
+    report_arrival(CYCLE, "finnhub", "AAPL", result("0.4", 30))
+    assert published == []
+    assert sync_redis.hget(KEY, "status") == ""
+
+    # A redelivered task reports the same source again: ignored
+    report_arrival(CYCLE, "finnhub", "AAPL", result("-0.9", 5))
+    assert published == []
+    assert sync_redis.hget(KEY, "arrived") == "1"
+    assert sync_redis.hget(KEY, "s:finnhub") == "0.4"
+
+    # A source without data counts as arrived, not towards the quorum
+    report_arrival(CYCLE, "newsapi", "AAPL", None)
+    assert published == []
+    assert sync_redis.hget(KEY, "with_data") == "1"
+
+    report_arrival(CYCLE, "reddit", "AAPL", result("-0.2", 3))
+    assert published == [("AAPL", CYCLE)]
+    assert sync_redis.hget(KEY, "status") == "partial"
+
+    report_arrival(CYCLE, "stocktwits", "AAPL", result("0.1", 120))
+    assert published == [("AAPL", CYCLE)] * 2
+    assert sync_redis.hget(KEY, "status") == "final"
+
+    report_arrival(CYCLE, "stocktwits", "AAPL", result("0.1", 120))
+    assert len(published) == 2
+    assert sync_redis.hget(KEY, "arrived") == "4"
+    assert sync_redis.hget(KEY, "with_data") == "3"
+
+
+def test_running_state_matches_aggregate(sync_redis, published):
+    arrivals = {"finnhub": ("0.4", 30), "reddit": ("-0.2", 3), "stocktwits": ("0.1", 120)}
+    for source, (score, data_points) in arrivals.items():
+        report_arrival(CYCLE, source, "AAPL", result(score, data_points))
+    report_arrival(CYCLE, "newsapi", "AAPL", None)
+
+    service = ScoringService()
+    running = aggregation_tasks._running_from_state(sync_redis.hgetall(KEY))
+    from_state = service.result_from_running(running, sources_total=len(WEIGHTS))
+    expected = service.aggregate(
+        [
+            RawSentimentData(
+                source_name=source,
+                ticker="AAPL",
+                raw_score=None,
+                normalized_score=Decimal(score),
+                data_points=data_points,
+                fetched_at=datetime.now(timezone.utc),
+            )
+            for source, (score, data_points) in arrivals.items()
+        ],
+        WEIGHTS,
+    )
+
+    assert from_state.score == pytest.approx(expected.score, abs=Decimal("0.000001"))
+    assert from_state.confidence == expected.confidence
+    assert from_state.sentiment_label == expected.sentiment_label
+    assert from_state.sources_available == 3
+    assert from_state.source_breakdown == expected.source_breakdown
+    assert from_state.weight_breakdown == expected.weight_breakdown
+    assert running.data_points == 153
+    assert running.max_data_points == 120
+
+
+def test_arrival_without_tracking_is_ignored(sync_redis, published):
+    report_arrival("other-cycle", "finnhub", "AAPL", result("0.4", 30))
+    assert published == []
+    assert not sync_redis.exists(ARRIVALS_KEY.format(cycle_id="other-cycle", ticker="AAPL"))
+
+
+def test_refresh_scheduled_once_when_final(sync_redis, monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(settings, "AGGREGATION_QUORUM", 0.5)
+    monkeypatch.setattr(settings, "ADAPTIVE_REFRESH_ENABLED", True)
+    monkeypatch.setattr(aggregation_tasks, "_weight_config", lambda: WEIGHTS)
+    monkeypatch.setattr(aggregation_tasks, "_persist_aggregate_score", lambda ticker, result: "agg-1")
+    monkeypatch.setattr(aggregation_tasks, "_update_aggregate_score", lambda agg_id, result: None)
+    monkeypatch.setattr(aggregation_tasks, "_publish_sse_update", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        aggregation_tasks, "_schedule_next_refresh",
+        lambda ticker, result, data_points: scheduled.append(ticker),
+    )
+    monkeypatch.setattr(aggregation_tasks.finalize_at_deadline, "apply_async", lambda **kwargs: None)
+    aggregation_tasks.start_quorum_tracking(CYCLE, {"AAPL": len(WEIGHTS)}, {"AAPL": 60.0})
+
+    report_arrival(CYCLE, "finnhub", "AAPL", result("0.4", 30))
+    report_arrival(CYCLE, "reddit", "AAPL", result("-0.2", 3))
+    assert sync_redis.hget(KEY, "status") == "partial"
+    assert scheduled == []
+
+    aggregation_tasks.finalize_at_deadline(CYCLE, ["AAPL"])
+    assert scheduled == ["AAPL"]
+
+    # Late arrivals update the final score without rescheduling
+    report_arrival(CYCLE, "newsapi", "AAPL", result("0.3", 10))
+    report_arrival(CYCLE, "stocktwits", "AAPL", result("0.1", 120))
+    assert sync_redis.hget(KEY, "arrived") == "4"
+    assert scheduled == ["AAPL"]
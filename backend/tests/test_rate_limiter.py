@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import pytest
+
+from app.adapters import rate_limiter
+from app.adapters.rate_limiter import DistributedRateLimiter, RateLimitExceededError
+
+
+def limiter(rpm: int, burst: int) -> DistributedRateLimiter:
+    """A limiter whose source config is already loaded, so no database is needed."""
+    limiter = DistributedRateLimiter("finnhub", default_rpm=rpm)
+    limiter._burst = float(burst)
+    limiter._config_loaded_at = time.monotonic()
+    return limiter
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+
+    async def sleep(seconds):
+        calls.append(seconds)
+
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", sleep)
+    return calls
+
+
+def test_bucket_is_shared_and_reserves_slots_in_order(async_redis, sleeps):
+    async def run():
+        # Two workers drawing on one 60 rpm bucket with a burst of two
+        first, second = limiter(60, 2), limiter(60, 2)
+        waits = [await first.acquire(max_wait=10), await second.acquire(max_wait=10)]
+        waits.append(await first.acquire(max_wait=10))
+        waits.append(await second.acquire(max_wait=10))
+        return waits
+
+    waits = asyncio.run(run())
+    assert waits[:2] == [0.0, 0.0]
+    # The burst is spent: each caller is handed the next free slot
+    assert waits[2] == pytest.approx(1.0, abs=0.05)
+    assert waits[3] == pytest.approx(2.0, abs=0.05)
+    assert sleeps == waits[2:]
+
+
+def test_slot_beyond_budget_is_refused_without_a_token(async_redis, sleeps):
+    async def run():
+        bucket = limiter(60, 1)
+        assert await bucket.acquire(max_wait=10) == 0.0
+        with pytest.raises(RateLimitExceededError):
+            await bucket.acquire(max_wait=0.5)
+        # The refused call consumed nothing: the next slot is still ~1s away
+        return await bucket.acquire(max_wait=10), bucket.acquires
+
+    wait, acquires = asyncio.run(run())
+    assert wait == pytest.approx(1.0, abs=0.05)
+    assert acquires == 2
+
+
+def test_falls_back_to_local_bucket_without_redis(monkeypatch, sleeps):
+    async def unavailable():
+        raise ConnectionError("Redis is down")
+
+    monkeypatch.setattr("app.core.redis.get_redis", unavailable)
+
+    async def run():
+        bucket = limiter(60, 60)
+        return [await bucket.acquire() for _ in range(3)]
+
+    assert asyncio.run(run()) == [0.0, 0.0, 0.0]
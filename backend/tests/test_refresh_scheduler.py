@@ -0,0 +1,60 @@
+import math
+import time
+
+import pytest
+
+from app.services.refresh_scheduler import (
+    SCHEDULE_KEY,
+    RefreshScheduler,
+    TickerActivity,
+    claim_due_tickers,
+    reschedule,
+)
+
+
+@pytest.fixture
+def scheduler():
+    return RefreshScheduler(min_minutes=5, max_minutes=60)
+
+
+def test_quiet_ticker_refreshes_at_the_slowest_interval(scheduler):
+    quiet = TickerActivity(score_deltas=[], data_points=0, sources_available=0, sources_total=13)
+    assert scheduler.activity(quiet) == 0.0
+    assert scheduler.next_interval_minutes(quiet) == 60
+
+
+def test_busy_fully_covered_ticker_refreshes_at_the_fastest_interval(scheduler):
+    busy = TickerActivity(
+        score_deltas=[0.3, -0.2, 0.25], data_points=5000, sources_available=13, sources_total=13
+    )
+    assert scheduler.activity(busy) == 1.0
+    assert scheduler.next_interval_minutes(busy) == 5
+
+
+def test_activity_formula(scheduler):
+    stats = TickerActivity(
+        score_deltas=[0.03, -0.04], data_points=50, sources_available=4, sources_total=8
+    )
+    volatility = math.sqrt((0.03**2 + 0.04**2) / 2) / 0.15
+    volume = math.log1p(50) / math.log1p(500)
+    expected = (0.7 * volatility + 0.3 * volume) * 0.75
+
+    assert scheduler.activity(stats) == pytest.approx(expected)
+    assert scheduler.next_interval_minutes(stats) == pytest.approx(60 - 55 * expected)
+
+    # The same swing seen by fewer sources counts for less
+    single = TickerActivity(stats.score_deltas, 50, sources_available=1, sources_total=8)
+    assert scheduler.activity(single) < scheduler.activity(stats)
+
+
+def test_claim_due_tickers(sync_redis):
+    reschedule("MSFT", 30)
+    sync_redis.zadd(SCHEDULE_KEY, {"NVDA": time.time() - 1, "GONE": time.time() - 1})
+
+    # Never scheduled (AAPL) and overdue (NVDA) tickers are due; GONE is no longer active
+    assert claim_due_tickers(["AAPL", "MSFT", "NVDA"], lease_minutes=10) == ["AAPL", "NVDA"]
+    assert sync_redis.zscore(SCHEDULE_KEY, "GONE") is None
+    assert sync_redis.zscore(SCHEDULE_KEY, "AAPL") == pytest.approx(time.time() + 600, abs=5)
+
+    # Leased: a second tick does not dispatch them again
+    assert claim_due_tickers(["AAPL", "MSFT", "NVDA"], lease_minutes=10) == []
@@ -0,0 +1,77 @@
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from app.adapters import response_cache
+from app.adapters.base import RawSentimentData
+from app.adapters.response_cache import ResponseCache
+from app.core import write_buffer
+from app.core.config import settings
+from app.tasks import fetch_tasks
+
+URL = "https://api.example.com/news"
+
+
+def score(body) -> RawSentimentData:
+    return RawSentimentData(
+        source_name="newsapi",
+        ticker="AAPL",
+        raw_score=None,
+        normalized_score=Decimal(body["score"]),
+        data_points=1,
+        fetched_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Serves an ETag'd body, answering 304 to a matching If-None-Match."""
+    requests = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"score": "0.4"}, headers={"ETag": '"v1"'})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    monkeypatch.setattr(response_cache, "get_http_client", lambda: client)
+    return requests
+
+
+def fetch_with_ttl(cache: ResponseCache, ttl: int) -> RawSentimentData:
+    cache._ttl["newsapi"] = (float("inf"), ttl)
+    return asyncio.run(cache.fetch_scored("newsapi", URL, score))
+
+
+def test_reused_results_keep_their_fetch_time(tmp_path, upstream):
+    cache = ResponseCache(backend="disk", directory=str(tmp_path), max_age_seconds=3600)
+
+    fetched = fetch_with_ttl(cache, 0)
+    assert "http_cache" not in fetched.metadata
+
+    fresh = fetch_with_ttl(cache, 600)
+    assert fresh.metadata["http_cache"] == "fresh"
+    assert fresh.fetched_at == fetched.fetched_at
+    assert len(upstream) == 1
+
+    revalidated = fetch_with_ttl(cache, 0)
+    assert revalidated.metadata["http_cache"] == "revalidated"
+    assert revalidated.fetched_at == fetched.fetched_at
+    assert revalidated.normalized_score == Decimal("0.4")
+    assert len(upstream) == 2
+
+
+def test_reused_results_are_not_stored_again(monkeypatch):
+    written = []
+    monkeypatch.setattr(settings, "WRITE_BUFFER_ENABLED", False)
+    monkeypatch.setattr(write_buffer, "write_rows_now", lambda scores=(), logs=(): written.extend(scores))
+
+    result = score({"score": "0.4"})
+    fetch_tasks._persist_source_score(result)
+    result.metadata["http_cache"] = "revalidated"
+    fetch_tasks._persist_source_score(result)
+    assert len(written) == 1
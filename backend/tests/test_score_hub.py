@@ -0,0 +1,119 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import app.core.redis
+from app.services.score_hub import LATEST_IDS_KEY, STREAM_KEY, ScoreHub
+from app.tasks import aggregation_tasks
+
+
+async def started(hub: ScoreHub):
+    """Wait until the reader task has picked its starting point in the stream."""
+    for _ in range(500):
+        if hub._last_id is not None:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("score hub reader did not start")
+
+
+def test_single_reader_fans_out_by_ticker(async_redis):
+    async def run():
+        await async_redis.xadd(STREAM_KEY, {"ticker": "AAPL", "data": '{"old": true}'})
+        hub = ScoreHub(queue_size=10)
+        apple = hub.subscribe(["AAPL"])
+        both = hub.subscribe(["AAPL", "MSFT"])
+        await started(hub)
+
+        aapl_id = await async_redis.xadd(STREAM_KEY, {"ticker": "AAPL", "data": '{"score": 0.4}'})
+        await async_redis.xadd(STREAM_KEY, {"ticker": "TSLA", "data": "{}"})
+        msft_id = await async_redis.xadd(STREAM_KEY, {"ticker": "MSFT", "data": '{"score": -0.1}'})
+
+        # Entries written before the reader started are not delivered
+        first = await asyncio.wait_for(apple.get(), 5)
+        received = [await asyncio.wait_for(both.get(), 5) for _ in range(2)]
+        hub.unsubscribe(apple)
+        hub.unsubscribe(both)
+        await hub.close()
+        return hub, first, received, aapl_id, msft_id
+
+    hub, first, received, aapl_id, msft_id = asyncio.run(run())
+    assert first == {"event": "score_update", "id": aapl_id, "data": '{"score": 0.4}'}
+    assert [e["id"] for e in received] == [aapl_id, msft_id]
+    assert hub.stats["messages"] == 3
+    assert hub.stats["deliveries"] == 3
+    assert hub.snapshot()["clients"] == 0
+
+
+def test_slow_subscriber_drops_oldest_events():
+    async def run():
+        hub = ScoreHub(queue_size=2)
+        hub._task = asyncio.get_running_loop().create_future()  # No reader needed
+        subscriber = hub.subscribe(["AAPL"])
+        for i in range(1, 4):
+            hub._dispatch(f"{i}-0", {"ticker": "AAPL", "data": str(i)})
+        return hub, subscriber, [await subscriber.get(), await subscriber.get()]
+
+    hub, subscriber, events = asyncio.run(run())
+    assert [e["data"] for e in events] == ["2", "3"]
+    assert subscriber.dropped == 1
+    assert hub.stats["dropped"] == 1
+
+
+def publish(ticker: str) -> str:
+    result = SimpleNamespace(
+        score=0.1, confidence=0.5, sentiment_label="neutral",
+        sources_available=1, source_breakdown={},
+    )
+    aggregation_tasks._publish_sse_update(ticker, result)
+    return app.core.redis.get_sync_redis().hget(LATEST_IDS_KEY, ticker)
+
+
+def trim(length: int):
+    """What XADD's approximate MAXLEN does once the stream is long enough."""
+    app.core.redis.get_sync_redis().xtrim(STREAM_KEY, maxlen=length, approximate=False)
+
+
+@pytest.fixture
+def short_stream(sync_redis, async_redis, monkeypatch):
+    monkeypatch.setattr("app.services.dashboard_cache.invalidate_dashboard_cache", lambda *tickers: None)
+
+
+def replay(tickers, last_event_id) -> list[dict]:
+    async def run():
+        return [event async for event in ScoreHub(queue_size=10).replay(tickers, last_event_id)]
+
+    return asyncio.run(run())
+
+
+def test_replay_skips_resync_when_only_older_updates_were_trimmed(short_stream):
+    last_seen = publish("AAPL")
+    for _ in range(3):
+        publish("MSFT")
+    trim(3)
+    # AAPL's update is gone from the stream, but the client already had it
+    assert replay(["AAPL"], last_seen) == []
+
+    newest = publish("AAPL")
+    publish("MSFT")
+    trim(3)
+    events = replay(["AAPL", "MSFT"], last_seen)
+    assert {e["event"] for e in events} == {"score_update"}
+    assert newest in [e["id"] for e in events]
+
+
+def test_replay_resyncs_tickers_whose_newest_update_was_trimmed(short_stream):
+    last_seen = publish("AAPL")
+    publish("AAPL")
+    publish("TSLA")
+    for _ in range(3):
+        publish("MSFT")
+    trim(3)
+
+    events = replay(["AAPL", "TSLA", "MSFT"], last_seen)
+    assert events[0]["event"] == "resync"
+    assert json.loads(events[0]["data"]) == {
+        "trimmed": True, "tickers": ["AAPL", "TSLA"], "last_event_id": last_seen,
+    }
+    assert [e["event"] for e in events[1:]] == ["score_update"] * 3
@@ -0,0 +1,63 @@
+import random
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.adapters.base import RawSentimentData
+from app.services.scoring_service import RunningAggregate, ScoringService
+
+SOURCES = [
+    "alpha_vantage", "finnhub", "gdelt", "google_trends", "hackernews", "mediastack",
+    "newsapi", "polymarket", "quiver_quant", "reddit", "stocktwits", "swaggy_stocks",
+    "yahoo_finance",
+]
+
+
+def random_source_set(rng: random.Random) -> tuple[list[RawSentimentData], dict[str, float]]:
+    weights = {name: round(rng.uniform(0.2, 2.0), 2) for name in SOURCES}
+    names = rng.sample(SOURCES, rng.randint(1, len(SOURCES)))
+    scores = [
+        RawSentimentData(
+            source_name=name,
+            ticker="AAPL",
+            raw_score=None,
+            normalized_score=Decimal(str(round(rng.uniform(-1, 1), 4))),
+            data_points=rng.choice([0, 1, rng.randint(2, 200)]),
+            fetched_at=datetime.now(timezone.utc),
+        )
+        for name in names
+    ]
+    return scores, weights
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_running_aggregate_matches_aggregate(seed):
+    rng = random.Random(seed)
+    scores, weights = random_source_set(rng)
+    service = ScoringService()
+    expected = service.aggregate(scores, weights)
+
+    # Sources folded in as they arrive, in any order
+    running = RunningAggregate()
+    for ss in rng.sample(scores, len(scores)):
+        running.add(service.contribution(
+            ss.source_name, float(ss.normalized_score), ss.data_points, weights
+        ))
+    result = service.result_from_running(running, sources_total=len(weights))
+
+    assert result.score == pytest.approx(expected.score, abs=Decimal("0.000001"))
+    assert result.confidence == pytest.approx(expected.confidence, abs=Decimal("0.0001"))
+    assert result.sources_available == expected.sources_available == len(scores)
+    assert result.sources_total == expected.sources_total
+    assert result.source_breakdown == expected.source_breakdown
+    assert result.weight_breakdown == expected.weight_breakdown
+    assert result.sentiment_label == expected.sentiment_label
+
+
+def test_no_sources_is_neutral():
+    service = ScoringService()
+    result = service.result_from_running(RunningAggregate(), sources_total=13)
+    assert result == service.aggregate([], {name: 1.0 for name in SOURCES})
+    assert result.score == Decimal("0.0")
+    assert result.sentiment_label == "neutral"
@@ -0,0 +1,66 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+
+from app.services import stock_cache
+from app.services.stock_cache import (
+    _MISSING,
+    VERSION_KEY,
+    CachedStock,
+    StockCache,
+    invalidate_stock_cache,
+)
+
+AAPL = CachedStock(uuid.uuid4(), "AAPL", "Apple", "Technology", True)
+
+
+def wait_for_version(cache: StockCache, version: str):
+    deadline = time.monotonic() + 5
+    while cache._latest_version != version:
+        assert time.monotonic() < deadline, f"listener never saw version {version}"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def other_process(sync_redis, async_redis, monkeypatch):
+    """A StockCache standing in for another API or worker process."""
+    monkeypatch.setattr(stock_cache, "_cache", None)
+    cache = StockCache(max_age_seconds=300)
+    cache.version()
+    wait_for_version(cache, "0")
+    return cache
+
+
+def test_invalidation_reaches_other_processes(sync_redis, other_process):
+    cache = other_process
+    cache.put("AAPL", AAPL, cache.version())
+    assert cache.get("AAPL") == AAPL
+
+    asyncio.run(invalidate_stock_cache())
+    assert sync_redis.get(VERSION_KEY) == "1"
+    wait_for_version(cache, "1")
+    assert cache.get("AAPL") is _MISSING
+
+
+def test_lookup_racing_an_invalidation_is_not_cached(other_process):
+    cache = other_process
+    # The query started before the stocks change and may have read the old row
+    version = cache.version()
+    asyncio.run(invalidate_stock_cache())
+    wait_for_version(cache, "1")
+
+    cache.put("AAPL", AAPL, version)
+    assert cache.get("AAPL") is _MISSING
+
+    # Known-missing tickers are cached too, until the next change
+    cache.put("MSFT", None, cache.version())
+    assert cache.get("MSFT") is None
+
+
+def test_entries_expire_without_invalidations(other_process):
+    cache = other_process
+    cache.put("AAPL", AAPL, cache.version())
+    cache._loaded_at -= 301
+    assert cache.get("AAPL") is _MISSING
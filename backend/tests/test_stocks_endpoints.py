@@ -0,0 +1,91 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+import redis
+from fastapi.testclient import TestClient
+
+import app.core.redis
+from app.api.deps import get_db
+from app.main import app as fastapi_app
+from app.models.stock import Stock
+from app.services.stock_cache import CachedStock, get_stock_cache
+
+
+class FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def scalar_one_or_none(self):
+        return self._row
+
+
+class FakeSession:
+    """Just enough of AsyncSession for the stock write endpoints."""
+
+    def __init__(self):
+        self.stocks: dict[str, Stock] = {}
+        self.committed = 0
+
+    async def execute(self, query):
+        ticker = query.whereclause.right.value
+        return FakeResult(self.stocks.get(ticker))
+
+    def add(self, stock):
+        now = datetime.now(timezone.utc)
+        stock.id = uuid.uuid4()
+        stock.is_active = True
+        stock.created_at = stock.updated_at = now
+        self.stocks[stock.ticker] = stock
+
+    async def delete(self, stock):
+        del self.stocks[stock.ticker]
+
+    async def commit(self):
+        self.committed += 1
+
+    async def refresh(self, stock):
+        pass
+
+
+class FailingRedis:
+    async def incr(self, key):
+        raise redis.ConnectionError("Redis is down")
+
+
+@pytest.fixture
+def session(monkeypatch):
+    async def failing_redis():
+        return FailingRedis()
+
+    session = FakeSession()
+
+    async def override_get_db():
+        yield session
+
+    monkeypatch.setattr(app.core.redis, "get_redis", failing_redis)
+    fastapi_app.dependency_overrides[get_db] = override_get_db
+    yield session
+    fastapi_app.dependency_overrides.clear()
+
+
+def test_writes_succeed_when_cache_invalidation_fails(session):
+    client = TestClient(fastapi_app)
+    cache = get_stock_cache()
+
+    response = client.post("/api/v1/stocks", json={"ticker": "aapl", "company_name": "Apple"})
+    assert response.status_code == 201
+    assert response.json()["ticker"] == "AAPL"
+
+    # This process's own cache is still dropped
+    stale = CachedStock(uuid.uuid4(), "AAPL", "Apple", None, True)
+    cache.put("AAPL", stale, cache._entries_version)
+    response = client.patch("/api/v1/stocks/AAPL", json={"sector": "Technology"})
+    assert response.status_code == 200
+    assert response.json()["sector"] == "Technology"
+    assert cache._entries == {}
+
+    response = client.delete("/api/v1/stocks/AAPL")
+    assert response.status_code == 204
+    assert session.stocks == {}
+    assert session.committed == 3
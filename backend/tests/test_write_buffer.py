@@ -0,0 +1,140 @@
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.adapters.base import RawSentimentData
+from app.core import write_buffer
+from app.core.config import settings
+from app.tasks import fetch_tasks
+
+CYCLE = str(uuid.uuid4())
+
+
+class Retry(Exception):
+    pass
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Unbuffered writes; source scores fail as if the database were down."""
+    written = []
+
+    def write_rows_now(scores=(), logs=()):
+        if scores:
+            raise OperationalError("INSERT INTO source_scores", {}, Exception("connection lost"))
+        written.extend(logs)
+
+    monkeypatch.setattr(settings, "WRITE_BUFFER_ENABLED", False)
+    monkeypatch.setattr(write_buffer, "write_rows_now", write_rows_now)
+    monkeypatch.setattr(write_buffer, "_buffer", None)
+    return written
+
+
+def sentiment() -> RawSentimentData:
+    return RawSentimentData(
+        source_name="finnhub",
+        ticker="AAPL",
+        raw_score=None,
+        normalized_score=Decimal("0.4"),
+        data_points=30,
+        fetched_at=datetime.now(timezone.utc),
+    )
+
+
+def test_unbuffered_write_failure_retries_the_task(writes, monkeypatch):
+    retried = []
+
+    def retry(exc):
+        retried.append(exc)
+        return Retry()
+
+    def run_async(coro, timeout=None):
+        coro.close()
+        return sentiment(), 0.0
+
+    task = fetch_tasks.fetch_source_for_stock
+    monkeypatch.setattr(fetch_tasks, "_ensure_adapters_loaded", lambda: None)
+    monkeypatch.setattr(fetch_tasks, "_publish_worker_stats", lambda: None)
+    monkeypatch.setattr(fetch_tasks, "run_async", run_async)
+    monkeypatch.setattr("app.adapters.registry.get_adapter", lambda name: object())
+    monkeypatch.setattr(task, "retry", retry)
+
+    with pytest.raises(Retry):
+        task.run("finnhub", "AAPL", CYCLE)
+
+    assert len(retried) == 1 and isinstance(retried[0], OperationalError)
+    assert [row["status"] for row in writes] == ["error"]
+    # Nothing was buffered, and no buffer (or flusher thread) was created
+    assert write_buffer._buffer is None
+
+
+def test_rows_left_after_failed_close_are_counted_as_dropped(monkeypatch):
+    def fail(scores, logs):
+        raise OperationalError("INSERT", {}, Exception("connection lost"))
+
+    monkeypatch.setattr(write_buffer, "_write_rows", fail)
+    buffer = write_buffer.WriteBuffer(max_rows=10, max_age_seconds=60, max_pending=100)
+    buffer.add_fetch_log({"status": "success"})
+    buffer.add_fetch_log({"status": "no_data"})
+
+    buffer.close()
+    assert buffer.pending == 0
+    assert buffer.stats["failed_flushes"] == 1
+    assert buffer.stats["dropped"] == 2
+
+
+def test_flushes_when_full(monkeypatch):
+    batches = []
+
+    def write(scores, logs):
+        batches.append((scores, logs))
+        return len(scores) + len(logs), 0
+
+    monkeypatch.setattr(write_buffer, "_write_rows", write)
+    monkeypatch.setattr(settings, "DASHBOARD_CACHE_ENABLED", False)
+    buffer = write_buffer.WriteBuffer(max_rows=3, max_age_seconds=60, max_pending=100)
+    buffer.add_source_score({"ticker": "AAPL"})
+    buffer.add_fetch_log({"status": "success"})
+    assert batches == []
+
+    buffer.add_fetch_log({"status": "no_data"})
+    assert batches == [([{"ticker": "AAPL"}], [{"status": "success"}, {"status": "no_data"}])]
+    assert buffer.pending == 0
+    assert buffer.stats["flushes"] == 1
+    assert buffer.stats["rows"] == 3
+    assert buffer.stats["last_batch_size"] == 3
+    buffer.close()
+
+
+def test_failed_flush_keeps_rows_and_drops_fetch_logs_first(monkeypatch):
+    failing = True
+    batches = []
+
+    def write(scores, logs):
+        if failing:
+            raise OperationalError("INSERT", {}, Exception("connection lost"))
+        batches.append((scores, logs))
+        return len(scores) + len(logs), 0
+
+    monkeypatch.setattr(write_buffer, "_write_rows", write)
+    monkeypatch.setattr(settings, "DASHBOARD_CACHE_ENABLED", False)
+    buffer = write_buffer.WriteBuffer(max_rows=2, max_age_seconds=60, max_pending=3)
+    buffer.add_source_score({"ticker": "AAPL"})
+    buffer.add_fetch_log({"status": "a"})
+    assert buffer.pending == 2
+    assert buffer.stats["failed_flushes"] == 1
+
+    # Over max_pending after the next failure: the oldest fetch log goes
+    buffer.add_source_score({"ticker": "MSFT"})
+    buffer.add_fetch_log({"status": "b"})
+    assert buffer.pending == 3
+    assert buffer.stats["dropped"] == 1
+
+    failing = False
+    assert buffer.flush() == 3
+    assert batches == [([{"ticker": "AAPL"}, {"ticker": "MSFT"}], [{"status": "b"}])]
+    assert buffer.stats["dropped"] == 1
+    buffer.close()
@@ -1,31 +1,51 @@
 import { useEffect, useRef, useCallback } from "react";
+import { useQueryClient } from "@tanstack/react-query";
 import { useDashboardStore } from "../store";
-import type { SSEScoreUpdate } from "../types";
+import type { SSEResync, SSEScoreUpdate } from "../types";
 
 export function useSSE(tickers: string[]) {
   const eventSourceRef = useRef<EventSource | null>(null);
+  // Id of the last event received, so a reconnect resumes where it left off
+  const lastEventIdRef = useRef<string | null>(null);
   const updateLiveScore = useDashboardStore((s) => s.updateLiveScore);
+  const queryClient = useQueryClient();
 
   const connect = useCallback(() => {
     if (tickers.length === 0) return;
 
     const params = new URLSearchParams();
     tickers.forEach((t) => params.append("tickers", t));
+    const resumedFrom = lastEventIdRef.current;
+    if (resumedFrom) {
+      params.set("last_event_id", resumedFrom);
+    }
 
     const es = new EventSource(`/api/v1/sse/scores?${params.toString()}`);
 
     es.addEventListener("score_update", (event) => {
       const data: SSEScoreUpdate = JSON.parse(event.data);
+      if (event.lastEventId) lastEventIdRef.current = event.lastEventId;
       updateLiveScore(data.ticker, data);
     });
 
+    // The newest update of these tickers was trimmed before it could be
+    // replayed; refetch them, unless the resync answers an older resume point
+    es.addEventListener("resync", (event) => {
+      const data: SSEResync = JSON.parse(event.data);
+      if (!data.trimmed || data.last_event_id !== resumedFrom) return;
+      queryClient.invalidateQueries({ queryKey: ["summaries"] });
+      data.tickers.forEach((t) =>
+        queryClient.invalidateQueries({ queryKey: ["dashboard", t] })
+      );
+    });
+
     es.onerror = () => {
       es.close();
       setTimeout(connect, 5000);
     };
 
     eventSourceRef.current = es;
-  }, [tickers, updateLiveScore]);
+  }, [tickers, updateLiveScore, queryClient]);
 
   useEffect(() => {
     connect();
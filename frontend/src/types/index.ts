@@ -38,6 +38,11 @@ export interface ScoreHistoryPoint {
   sentiment_label: string;
   sources_available: number;
   computed_at: string;
+  // Rolled-up resolutions (1h/4h/1d) only
+  min?: number;
+  max?: number;
+  last?: number;
+  count?: number;
 }
 
 export interface ScoreSummary {
@@ -100,9 +105,18 @@ export interface SSEScoreUpdate {
   label: SentimentLabel;
   sources_available: number;
   source_breakdown: Record<string, number>;
+  status: "partial" | "final";
+  sources_pending: number;
+  cycle_id: string | null;
   timestamp: string;
 }
 
+export interface SSEResync {
+  trimmed: boolean;
+  tickers: string[];
+  last_event_id: string;
+}
+
 export type SentimentLabel =
   | "very_bearish"
   | "bearish"